@@ -0,0 +1,946 @@
+"""Benchmarks for the syllabus tree project.
+
+Run all benchmarks with `python benchmarks.py`, or pick some by name,
+e.g. `python benchmarks.py import_time`.
+"""
+import itertools
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+IMPORT_BUDGET_MS = 150  # Maximum allowed cost of `import final` on top of interpreter startup
+
+
+def _run_python(code):
+    """Run a snippet in a fresh interpreter and return the wall time in milliseconds.
+
+    It runs from this directory, so `import final` finds the repo's modules
+    wherever the benchmarks were started from.
+    """
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    return (time.perf_counter() - start) * 1000
+
+
+def bench_import_time(repeat=5):
+    """Check that `import final` stays under IMPORT_BUDGET_MS."""
+    baseline = min(_run_python("pass") for _ in range(repeat))
+    with_import = min(_run_python("import final") for _ in range(repeat))
+    cost = with_import - baseline
+    print(f"import final: {cost:.1f} ms (budget {IMPORT_BUDGET_MS} ms)")
+    if cost > IMPORT_BUDGET_MS:
+        raise SystemExit(f"import final took {cost:.1f} ms, over the {IMPORT_BUDGET_MS} ms budget")
+
+
+def bench_catalog_streaming(courses=2000):
+    """Compare streaming a large JSON catalog against loading it all at once."""
+    import catalog
+    import final
+
+    record = catalog.node_to_dict(final.build_DSA_syllabus_tree())
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "catalog.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("[\n")
+            for i in range(courses):
+                record["name"] = f"Course {i}"
+                f.write(("," if i else "") + json.dumps(record) + "\n")
+            f.write("]\n")
+
+        for label, load in [("streamed", lambda: sum(1 for _ in catalog.iter_catalog(path))),
+                            ("materialized", lambda: len(catalog.load_catalog(path)))]:
+            tracemalloc.start()
+            start = time.perf_counter()
+            count = load()
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{label:>12}: {count} courses in {elapsed:.2f} s, peak {peak / 2**20:.1f} MiB")
+
+
+class _DictTreeNode:
+    """The original dict-backed TreeNode layout, kept for memory comparisons."""
+    def __init__(self, name, hours=None):
+        self.name = name
+        self.hours = hours
+        self.resources = {}
+        self.children = []
+        self.questions_map = {}
+
+    def add_child(self, child_node):
+        self.children.append(child_node)
+
+
+def _build_synthetic_syllabus(node_class, nodes, fanout=10):
+    """Build a syllabus of `nodes` nodes where every module has `fanout` leaf topics."""
+    root = node_class("Synthetic Syllabus")
+    built = 1
+    while built < nodes:
+        module = node_class(f"Module {built}", 6)
+        root.add_child(module)
+        built += 1
+        for i in range(min(fanout, nodes - built)):
+            module.add_child(node_class(f"Topic {built + i}"))
+        built += min(fanout, nodes - built)
+    return root
+
+
+def bench_node_memory(nodes=1_000_000):
+    """Compare per-node memory of the slotted TreeNode against the dict-backed layout."""
+    import final
+
+    for label, node_class in [("dict-backed", _DictTreeNode), ("slotted", final.TreeNode)]:
+        tracemalloc.start()
+        root = _build_synthetic_syllabus(node_class, nodes)
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del root
+        print(f"{label:>12}: {used / nodes:.0f} bytes/node ({used / 2**20:.0f} MiB for {nodes} nodes)")
+
+
+def bench_flat_tree(nodes=200_000, repeat=5):
+    """Compare total-hours-per-subtree on TreeNode pointers against the array-backed FlatTree."""
+    import final
+    from flat_tree import FlatTree
+
+    root = _build_synthetic_syllabus(final.TreeNode, nodes)
+
+    def pointer_totals():
+        totals = {}
+        order = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(node.children)
+        for node in reversed(order):
+            totals[node] = (node.hours or 0) + sum(totals[child] for child in node.children)
+        return totals
+
+    start = time.perf_counter()
+    flat = FlatTree(root)
+    build = time.perf_counter() - start
+    for label, query in [("TreeNode walk", pointer_totals), ("FlatTree", flat.subtree_hours)]:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            query()
+        print(f"{label:>13}: {(time.perf_counter() - start) / repeat * 1000:.1f} ms per pass")
+    print(f"FlatTree build: {build * 1000:.1f} ms for {len(flat)} nodes")
+
+
+def bench_linked_list_append(appends=1_000_000, walk_appends=5_000):
+    """Time LinkedList appends and compare with the old walk-to-the-tail append."""
+    import final
+
+    def walk_append(linked_list, module_time):
+        new_node = final.Node(module_time)
+        if not linked_list.head:
+            linked_list.head = new_node
+        else:
+            current = linked_list.head
+            while current.next:
+                current = current.next
+            current.next = new_node
+
+    walk_list = final.LinkedList()
+    start = time.perf_counter()
+    for i in range(walk_appends):
+        walk_append(walk_list, float(i))
+    walk = time.perf_counter() - start
+    print(f"walk-to-tail append: {walk_appends} appends in {walk:.2f} s")
+
+    linked_list = final.LinkedList()
+    start = time.perf_counter()
+    for i in range(appends):
+        linked_list.append(float(i))
+    elapsed = time.perf_counter() - start
+    print(f" tail-pointer append: {appends} appends in {elapsed:.2f} s "
+          f"({elapsed / appends * 1e9:.0f} ns/append)")
+
+    start = time.perf_counter()
+    summary = linked_list.summary()
+    print(f"summary of {summary['modules']} times in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+def _recursive_display_tree(node, level=0):
+    """The original recursive, print-per-line TreeNode.display_tree."""
+    indent = "  " * level
+    hours_info = f" ({node.hours} hours)" if node.hours else ""
+    print(f"{indent}- {node.name}{hours_info}")
+    for key, url in node.resources.items():
+        print(f"{indent}    {key}: {url}")
+    for child in node.children:
+        _recursive_display_tree(child, level + 1)
+
+
+def bench_render_tree(nodes=100_000, repeat=5):
+    """Compare the buffered iterative renderer with recursive print-based display on a large tree.
+
+    Runs against a block-buffered file and a line-buffered one; the latter
+    behaves like an interactive terminal, where every print is a write call.
+    """
+    import contextlib
+
+    import final
+    from render import render_tree
+
+    root = _build_synthetic_syllabus(final.TreeNode, nodes)
+    for label, buffering in (("block-buffered", -1), ("line-buffered", 1)):
+        recursive = iterative = float("inf")
+        with open(os.devnull, "w", buffering=buffering) as devnull:
+            for _ in range(repeat):
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(devnull):
+                    _recursive_display_tree(root)
+                recursive = min(recursive, time.perf_counter() - start)
+
+                start = time.perf_counter()
+                render_tree(root, devnull)
+                iterative = min(iterative, time.perf_counter() - start)
+        print(f"{label:>14}: recursive print {recursive * 1000:.0f} ms, "
+              f"buffered render {iterative * 1000:.0f} ms for {nodes} nodes (best of {repeat})")
+
+
+def bench_search_latency(questions=1_000_000, queries=200, seed=7):
+    """Measure BM25 query latency over a synthetic bank of `questions` questions."""
+    import random
+
+    import final
+    from search import SearchEngine
+
+    rng = random.Random(seed)
+    vocabulary = [f"term{i}" for i in range(20_000)]
+    cumulative = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(vocabulary))))  # Zipf-like
+    root = final.TreeNode("Synthetic Question Bank")
+    per_topic = 10
+    module = None
+    for i in range(questions // per_topic):
+        if i % 100 == 0:
+            module = final.TreeNode(f"Module {i // 100}", 6)
+            root.add_child(module)
+        topic = final.TreeNode(f"Topic {i}")
+        topic.add_questions(topic.name, [" ".join(rng.choices(vocabulary, cum_weights=cumulative, k=8)) for _ in range(per_topic)])
+        module.add_child(topic)
+
+    start = time.perf_counter()
+    engine = SearchEngine([root])
+    print(f"indexed {len(engine)} documents in {time.perf_counter() - start:.1f} s")
+
+    latencies = []
+    for _ in range(queries):
+        query = " ".join(rng.choices(vocabulary[100:], k=3))
+        start = time.perf_counter()
+        engine.search(query, limit=10)
+        latencies.append(time.perf_counter() - start)
+    engine.close()
+    latencies.sort()
+    print(f"query latency: p50 {latencies[len(latencies) // 2] * 1000:.3f} ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.3f} ms")
+
+
+def bench_question_retrieval(nodes=200_000, repeat=3):
+    """Time fetching the questions of every topic in every module, by name key and through the bank."""
+    import final
+    from questions import QuestionBank
+
+    root = _build_synthetic_syllabus(final.TreeNode, nodes)
+    for module in root.children:
+        for topic in module.children:
+            topic.add_questions(topic.name, [f"Question about {topic.name}?", "Why?"])
+
+    def by_name_key():
+        found = []
+        for module in root.children:
+            for topic in module.children:
+                if topic.name in topic.questions_map:
+                    found.extend(topic.questions_map[topic.name])
+        return len(found)
+
+    start = time.perf_counter()
+    bank = QuestionBank([root])
+    build = time.perf_counter() - start
+
+    def through_bank():
+        found = []
+        for module in root.children:
+            for topic in module.children:
+                found.extend(bank.questions_for(topic))
+        return len(found)
+
+    for label, retrieve in [("name-key lookup", by_name_key), ("question bank", through_bank)]:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            found = retrieve()
+        print(f"{label:>15}: {found} questions in {(time.perf_counter() - start) / repeat * 1000:.0f} ms")
+    bank.close()
+    print(f"bank build: {build * 1000:.0f} ms for {len(bank)} questions")
+
+
+def bench_quiz_sampling(quizzes=1_000, k=10):
+    """Compare weighted Fenwick-tree quiz draws with flattening the bank and calling random.sample."""
+    import random
+
+    import final
+    from sampler import QuestionSampler
+
+    for nodes in (10_000, 100_000, 1_000_000):
+        root = _build_synthetic_syllabus(final.TreeNode, nodes)
+        for module in root.children:
+            for topic in module.children:
+                topic.add_questions(topic.name, [f"{topic.name} question {i}" for i in range(5)])
+
+        start = time.perf_counter()
+        for _ in range(quizzes // 100):  # The flattening approach is too slow for the full count
+            all_questions = [q for module in root.children for topic in module.children for q in topic.get_questions()]
+            random.sample(all_questions, k)
+        flatten = (time.perf_counter() - start) / (quizzes // 100)
+
+        sampler = QuestionSampler([root], seed=1)
+        start = time.perf_counter()
+        for _ in range(quizzes):
+            sampler.sample(k)
+        fenwick = (time.perf_counter() - start) / quizzes
+        print(f"{len(sampler):>8} questions: flatten+sample {flatten * 1000:8.2f} ms/quiz, "
+              f"Fenwick draws {fenwick * 1000:.3f} ms/quiz")
+
+
+def bench_async_sessions(clients=2_000):
+    """Run `clients` simulated learners concurrently against the asyncio session server."""
+    import asyncio
+
+    import final
+    from session import start_server
+
+    syllabus_list = final.build_syllabus_list()
+    modules = len(syllabus_list[0].children)
+    script = ("1\n" + "questions\n\n" * modules).encode()  # Pick the first syllabus, answer every module
+    finished = []
+
+    async def client(port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(script)
+        await writer.drain()
+        while await reader.read(64 * 1024):
+            pass
+        writer.close()
+        await writer.wait_closed()
+
+    async def run():
+        server = await start_server(syllabus_list, port=0, on_finished=finished.append)
+        port = server.sockets[0].getsockname()[1]
+        start = time.perf_counter()
+        await asyncio.gather(*(client(port) for _ in range(clients)))
+        elapsed = time.perf_counter() - start
+        server.close()
+        await server.wait_closed()
+        return elapsed
+
+    elapsed = asyncio.run(run())
+    print(f"{len(finished)}/{clients} concurrent sessions of {modules} modules in {elapsed:.2f} s "
+          f"({len(finished) / elapsed:.0f} sessions/s)")
+
+
+def bench_http_throughput(clients=8, requests_per_client=500):
+    """Measure requests/s against the local HTTP service with keep-alive client threads."""
+    import http.client
+    import threading
+    from urllib.parse import quote
+
+    from http_service import make_server
+
+    server = make_server(port=0)
+    port = server.server_address[1]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    paths = ["/syllabi", "/syllabi/1", f"/syllabi/1?path={quote('Module 4: Trees')}", "/questions?n=5"]
+
+    def client(results):
+        connection = http.client.HTTPConnection("127.0.0.1", port)
+        for i in range(requests_per_client):
+            connection.request("GET", paths[i % len(paths)])
+            response = connection.getresponse()
+            response.read()
+            results.append(response.status)
+        connection.close()
+
+    results = []
+    threads = [threading.Thread(target=client, args=(results,)) for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+    server.server_close()
+    ok = sum(1 for status in results if status == 200)
+    print(f"{ok}/{len(results)} OK from {clients} clients in {elapsed:.2f} s ({len(results) / elapsed:.0f} req/s)")
+
+
+def bench_subtree_aggregates(nodes=200_000, updates=1_000):
+    """Time cached subtree totals: first computation, cached queries and queries after small edits."""
+    import final
+
+    root = _build_synthetic_syllabus(final.TreeNode, nodes)
+    start = time.perf_counter()
+    root.aggregates()
+    first = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for module in root.children:
+        module.total_hours()
+    cached = (time.perf_counter() - start) / len(root.children)
+
+    start = time.perf_counter()
+    for i in range(updates):
+        module = root.children[i % len(root.children)]
+        module.children[0].add_resource(f"Extra {i}", "https://example.com")
+        root.total_hours()
+    updated = (time.perf_counter() - start) / updates
+    print(f"first full computation: {first * 1000:.0f} ms for {nodes} nodes")
+    print(f"cached subtree query: {cached * 1e6:.2f} us; edit + root query: {updated * 1e6:.1f} us")
+
+
+def bench_snapshot_load(copies=250):
+    """Compare startup from a binary snapshot with rebuilding from catalog data and with pickle."""
+    import pickle
+
+    import catalog
+    import final
+    import snapshot
+
+    roots = []
+    for i in range(copies):
+        for root in final.build_syllabus_list():
+            root.name = f"{root.name} #{i}"
+            roots.append(root)
+    nodes = sum(root.descendant_count() + 1 for root in roots)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog_path = os.path.join(tmp, "catalog.jsonl")
+        pickle_path = os.path.join(tmp, "catalog.pickle")
+        snapshot_path = os.path.join(tmp, "catalog.snap")
+        catalog.save_catalog(roots, catalog_path)
+        with open(pickle_path, "wb") as f:
+            pickle.dump(roots, f, protocol=pickle.HIGHEST_PROTOCOL)
+        snapshot.save_snapshot(roots, snapshot_path)
+
+        def open_snapshot():
+            with snapshot.Snapshot(snapshot_path) as snap:
+                return snap.root_names()
+
+        def load_pickle():
+            with open(pickle_path, "rb") as f:
+                return pickle.load(f)
+
+        for label, load, path in [
+            ("rebuild from catalog", lambda: catalog.load_catalog(catalog_path), catalog_path),
+            ("pickle.load", load_pickle, pickle_path),
+            ("snapshot, full load", lambda: snapshot.load_snapshot(snapshot_path), snapshot_path),
+            ("snapshot, open (lazy)", open_snapshot, snapshot_path),
+        ]:
+            elapsed = float("inf")
+            for _ in range(5):
+                start = time.perf_counter()
+                load()
+                elapsed = min(elapsed, time.perf_counter() - start)
+            print(f"{label:>22}: {elapsed * 1000:7.1f} ms  (file {os.path.getsize(path) / 2**20:.1f} MiB, best of 5)")
+    print(f"{len(roots)} syllabi, {nodes} nodes")
+
+
+def bench_progress_store(learners=2000, modules=8, threads=32):
+    """Many sessions recording module times concurrently: batched WAL writer vs. a commit per row."""
+    import sqlite3
+    import threading
+
+    import progress
+
+    def run_sessions(record, finish=lambda: None):
+        def worker(first):
+            for learner in range(first, learners, threads):
+                for module in range(1, modules + 1):
+                    record(f"learner-{learner}", f"Module {module}", 60.0 * module + learner % 7, module)
+
+        workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+        start = time.perf_counter()
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        finish()
+        return time.perf_counter() - start
+
+    rows = learners * modules
+    with tempfile.TemporaryDirectory() as tmp:
+        store = progress.ProgressStore(os.path.join(tmp, "batched.db"))
+        batched = run_sessions(lambda learner, module, seconds, number:
+                               store.record_module_time(learner, "DSA", module, seconds, number), store.flush)
+        query_start = time.perf_counter()
+        averages = store.average_time_per_module("DSA")
+        query = time.perf_counter() - query_start
+        store.close()
+
+        path = os.path.join(tmp, "per_row.db")
+        connection = sqlite3.connect(path, check_same_thread=False)
+        connection.executescript(progress.SCHEMA)
+        lock = threading.Lock()
+
+        def record_per_row(learner, module, seconds, number):
+            with lock, connection:  # Every session write is its own transaction
+                connection.execute(progress._STATEMENTS["time"], (learner, "DSA", module, number, seconds, 0.0))
+
+        per_row = run_sessions(record_per_row)
+        connection.close()
+
+    print(f"{rows} module times from {threads} threads")
+    print(f"  commit per row:       {per_row:6.2f} s  ({rows / per_row:9.0f} rows/s)")
+    print(f"  batched WAL writer:   {batched:6.2f} s  ({rows / batched:9.0f} rows/s)")
+    print(f"  average time per module ({len(averages)} modules): {query * 1000:.1f} ms")
+
+
+def bench_study_planner(sizes=(1_000, 10_000, 50_000), weekly_hours=12, repeat=3):
+    """Plan synthetic catalogs of increasing size; report time and weeks against the lower bound."""
+    import math
+    import random
+
+    import final
+    import planner
+
+    rng = random.Random(17)
+    for topics in sizes:
+        root = final.TreeNode("Synthetic Syllabus")
+        built = 0
+        while built < topics:
+            module = final.TreeNode(f"Module {root.descendant_count() + 1}", rng.randint(2, 30))
+            for _ in range(min(rng.randint(3, 15), topics - built)):
+                module.add_child(final.TreeNode(f"Topic {built}"))
+                built += 1
+            root.add_child(module)
+        measured = {module.name: module.hours * 3600 * rng.uniform(0.6, 1.8)
+                    for module in root.children[:len(root.children) // 3]}
+        lower_bound = math.ceil(sum(planner.estimate_module_hours(root, measured).values()) / weekly_hours)
+        for ordered in (True, False):
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                plan = planner.plan_study(root, weekly_hours, measured, ordered=ordered)
+                best = min(best, time.perf_counter() - start)
+            label = "in order" if ordered else "first-fit decreasing"
+            print(f"{topics:>7} topics, {label:>20}: {best * 1000:7.1f} ms, "
+                  f"{len(plan)} weeks (lower bound {lower_bound})")
+
+
+def bench_prerequisites(courses=1_000, topics_per_course=100, edges_per_topic=3, window=30, queries=1_000):
+    """Topological order and transitive-prerequisite queries on a large synthetic prerequisite graph.
+
+    Each topic requires a few recent topics of its own course, and one topic
+    of each course requires a topic of an earlier course.
+    """
+    import random
+
+    import final
+    import prerequisites
+
+    rng = random.Random(3)
+    roots = [_build_synthetic_syllabus(final.TreeNode, topics_per_course) for _ in range(courses)]
+    graph = prerequisites.PrerequisiteGraph(roots)
+    nodes = graph.topics
+    start = time.perf_counter()
+    for c in range(courses):
+        first = c * topics_per_course
+        for i in range(first + 2, first + topics_per_course):
+            for _ in range(edges_per_topic):
+                graph.add_prerequisite(nodes[i], nodes[rng.randrange(max(first + 1, i - window), i)])
+        if c:
+            earlier = rng.randrange(c) * topics_per_course
+            graph.add_prerequisite(nodes[first + 2], nodes[earlier + rng.randrange(2, topics_per_course)])
+    graph.topological_order()
+    built = time.perf_counter() - start
+    print(f"{len(nodes)} topics, {len(graph._edge_topic)} edges: add edges + topological order {built * 1000:.0f} ms")
+
+    targets = [nodes[rng.randrange(len(nodes))] for _ in range(queries)]
+
+    def bfs_prerequisites(topic):
+        seen = set()
+        stack = [topic]
+        while stack:
+            for prerequisite in graph.direct_prerequisites(stack.pop()):
+                if prerequisite not in seen:
+                    seen.add(prerequisite)
+                    stack.append(prerequisite)
+        return sorted(seen, key=lambda node: rank(graph._ids[node]))
+
+    rank = graph._study_rank()
+
+    for label, query in [
+        ("BFS + sort per query", bfs_prerequisites),
+        ("bitset closure, cold", graph.prerequisites_of),
+        ("bitset closure, warm", graph.prerequisites_of),
+        ("requires(), warm", lambda topic: graph.requires(topic, nodes[1])),
+    ]:
+        start = time.perf_counter()
+        for topic in targets:
+            query(topic)
+        elapsed = time.perf_counter() - start
+        print(f"  {label:>22}: {elapsed / queries * 1e6:8.1f} us/query")
+
+
+def bench_review_queue(learners=10_000, questions_per_learner=100, queries=10_000):
+    """Memory and latency of the spaced-repetition due queue with a million learner-question cards."""
+    import random
+
+    import review
+
+    rng = random.Random(11)
+    tracemalloc.start()
+    scheduler = review.ReviewScheduler()
+    start = time.perf_counter()
+    for learner in range(learners):
+        first = rng.randrange(100_000)
+        scheduler.enroll(learner, range(first, first + questions_per_learner), now=0)
+    enrolled = time.perf_counter() - start
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    cards = len(scheduler)
+    print(f"{cards} cards: enrolled in {enrolled:.2f} s (under tracemalloc), {used / cards:.0f} bytes/card")
+
+    now = 0
+    start = time.perf_counter()
+    for _ in range(queries):
+        learner = rng.randrange(learners)
+        for question_id in scheduler.due(learner, 5, now=now):
+            scheduler.review(learner, question_id, rng.randint(0, 5), now=now)
+        now += 60
+    elapsed = time.perf_counter() - start
+    print(f"  due(5) + 5 reviews: {elapsed / queries * 1e6:.1f} us per learner session")
+
+    start = time.perf_counter()
+    for _ in range(queries):
+        scheduler.due(rng.randrange(learners), 20, now=now)
+    print(f"  due(20):            {(time.perf_counter() - start) / queries * 1e6:.1f} us")
+
+
+def bench_link_check(links=400, latency=0.02):
+    """Audit resource links against a local fake server with per-request latency."""
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    import final
+    import linkcheck
+
+    class FakeSiteHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def _reply(self, with_body):
+            time.sleep(latency)
+            kind = self.path.split("/")[1]
+            if kind == "moved":
+                status, headers = 301, {"Location": self.path.replace("/moved/", "/ok/")}
+            elif kind == "nohead" and self.command == "HEAD":
+                status, headers = 405, {}
+            else:
+                status, headers = (404 if kind == "dead" else 200), {}
+            body = b"fake page" if with_body else b""
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body) if with_body else 0))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_HEAD(self):
+            self._reply(False)
+
+        def do_GET(self):
+            self._reply(True)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeSiteHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    kinds = ["ok"] * 6 + ["dead", "moved", "nohead", "placeholder"]
+    root = final.TreeNode("Link Syllabus")
+    for m in range(links // 10):
+        module = final.TreeNode(f"Module {m + 1}", 2)
+        root.add_child(module)
+        topic = final.TreeNode(f"Topic {m + 1}")
+        module.add_child(topic)
+        for i, kind in enumerate(kinds):
+            url = "https://placeholder.com" if kind == "placeholder" else f"{base}/{kind}/{m}-{i}"
+            topic.add_resource(f"Resource {i}", url)
+
+    try:
+        for label, workers in [("1 worker", 1), ("16 workers", 16)]:
+            with linkcheck.LinkChecker(max_workers=workers, max_per_host=workers) as checker:
+                start = time.perf_counter()
+                problems = checker.audit([root])
+                first = time.perf_counter() - start
+                start = time.perf_counter()
+                checker.audit([root])
+                cached = time.perf_counter() - start
+            print(f"{label:>11}: {links} links in {first:.2f} s, re-audit from cache {cached * 1000:.1f} ms, "
+                  f"{len(problems)} problems")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def bench_diagram_export(sizes=(10_000, 100_000)):
+    """Time the tidy layout and streamed SVG/DOT export on large synthetic trees."""
+    import diagram
+    import final
+
+    for nodes in sizes:
+        root = _build_synthetic_syllabus(final.TreeNode, nodes)
+        start = time.perf_counter()
+        diagram.TreeLayout(root)
+        layout = time.perf_counter() - start
+        results = []
+        with tempfile.TemporaryDirectory() as tmp:
+            for extension in ("svg", "dot"):
+                path = os.path.join(tmp, f"tree.{extension}")
+                start = time.perf_counter()
+                diagram.export(root, path)
+                results.append(f"{extension} {time.perf_counter() - start:.2f} s "
+                               f"({os.path.getsize(path) / 2**20:.1f} MiB)")
+        print(f"{nodes:>7} nodes: layout {layout * 1000:.0f} ms; " + "; ".join(results))
+
+    try:
+        import networkx as nx
+    except ImportError:
+        print("networkx not installed; skipping the spring-layout comparison")
+        return
+    root = _build_synthetic_syllabus(final.TreeNode, sizes[0])
+    graph = nx.DiGraph()
+    layout = diagram.TreeLayout(root)
+    graph.add_edges_from((layout.parent[i], i) for i in range(1, len(layout)))
+    start = time.perf_counter()
+    nx.spring_layout(graph, seed=1)
+    print(f"networkx spring_layout, {sizes[0]} nodes: {time.perf_counter() - start:.2f} s")
+
+
+def bench_tree_diff(nodes=100_000, edits=10):
+    """Update a deployed tree to a new version: full rebuild vs. Merkle diff + in-place patch."""
+    import random
+
+    import catalog
+    import final
+    import treediff
+
+    rng = random.Random(5)
+    deployed = _build_synthetic_syllabus(final.TreeNode, nodes)
+    updated = _build_synthetic_syllabus(final.TreeNode, nodes)
+    for i in range(edits):
+        module = updated.children[rng.randrange(len(updated.children))]
+        if i % 3 == 0:
+            module.add_child(final.TreeNode(f"New topic {i}"))
+        elif i % 3 == 1:
+            module.children[0].add_questions(module.children[0].name, [f"New question {i}?"])
+        else:
+            module.set_hours(module.hours + 1)
+    updated_dict = catalog.node_to_dict(updated)
+
+    start = time.perf_counter()
+    catalog.node_from_dict(updated_dict)
+    rebuild = time.perf_counter() - start
+
+    merkle = treediff.MerkleHashes(deployed)
+    start = time.perf_counter()
+    new_hashes = treediff.subtree_hashes(updated)
+    hashed = time.perf_counter() - start
+    deployed_hashes = merkle.current()
+    diffed = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        changes = treediff.diff_trees(deployed, updated, deployed_hashes, new_hashes)
+        diffed = min(diffed, time.perf_counter() - start)
+    start = time.perf_counter()
+    treediff.apply_patch(deployed, changes)
+    applied = time.perf_counter() - start
+    start = time.perf_counter()
+    in_sync = merkle.current()[deployed][1] == new_hashes[updated][1]
+    rehashed = time.perf_counter() - start
+    merkle.close()
+
+    print(f"{nodes} nodes, {len(changes)} changes")
+    print(f"  rebuild new version from catalog data: {rebuild * 1000:7.1f} ms")
+    print(f"  hash new version:                      {hashed * 1000:7.1f} ms")
+    print(f"  diff against deployed hashes:          {diffed * 1000:7.1f} ms (best of 5; "
+          f"{len(deployed.children)} children under the root)")
+    print(f"  apply patch in place:                  {applied * 1000:7.2f} ms")
+    print(f"  rehash deployed tree after patch:      {rehashed * 1000:7.2f} ms (in sync: {in_sync})")
+
+
+def bench_batch_report(learners=5000, syllabi=4, modules=10):
+    """Per-module report over many learners' times, on 1, 2, 4 ... worker processes."""
+    import random
+    import sqlite3
+
+    import progress
+    import reports
+
+    rng = random.Random(6)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "progress.db")
+        connection = sqlite3.connect(path)
+        connection.executescript(progress.SCHEMA)
+        with connection:
+            for s in range(syllabi):
+                for m in range(1, modules + 1):
+                    connection.executemany(progress._STATEMENTS["time"], (
+                        (f"learner-{learner}", f"Syllabus {s}", f"Module {m}", m, rng.lognormvariate(7, 0.5), 0.0)
+                        for learner in range(learners) for _ in range(rng.randint(1, 3))))
+                    connection.executemany(progress._STATEMENTS["completion"], (
+                        (f"learner-{learner}", f"Syllabus {s}", f"Module {m}", 1, 0.0)
+                        for learner in range(learners) if rng.random() < 0.7))
+        rows = connection.execute("SELECT COUNT(*) FROM module_times").fetchone()[0]
+        connection.close()
+
+        print(f"{rows} module times, {syllabi * modules} modules, {os.cpu_count()} core(s)")
+        counts = [1]
+        while counts[-1] < max(4, os.cpu_count() or 1):
+            counts.append(counts[-1] * 2)
+        baseline = None
+        for workers in counts:
+            start = time.perf_counter()
+            report = reports.build_report(path, workers)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"  {workers} worker(s): {elapsed:6.2f} s  ({rows / elapsed:9.0f} rows/s, "
+                  f"speedup {baseline / elapsed:4.2f}x)")
+        start = time.perf_counter()
+        reports.write_csv(report, os.path.join(tmp, "report.csv"))
+        reports.write_json(report, os.path.join(tmp, "report.json"))
+        print(f"  write CSV + JSON:  {(time.perf_counter() - start) * 1000:6.1f} ms")
+
+
+def bench_event_log(sessions=50_000, modules=8, synced_events=200):
+    """Write a large session event log and replay it: per-event fsync vs. buffered writer, streaming replay."""
+    import resource
+
+    import eventlog
+
+    def write_sessions(log):
+        for s in range(sessions):
+            session = log.new_session(f"Syllabus {s % 4}", f"learner-{s % 5000}")
+            for number in range(1, modules + 1):
+                module = f"Module {number}"
+                log.emit(session, "module_start", module=module, number=number)
+                if (s + number) % 3 == 0:
+                    log.emit(session, "questions", module=module, number=number)
+                log.emit(session, "module_complete", module=module, number=number,
+                         seconds=600.0 + (s * 7 + number * 13) % 1800)
+            log.emit(session, "session_end", modules=modules)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "synced.ndjson")
+        with eventlog.EventLog(path, fsync_interval=0) as log:  # fsync after every event
+            start = time.perf_counter()
+            for i in range(synced_events):
+                log.emit("s", "module_complete", module="Module 1", number=1, seconds=float(i))
+            synced = (time.perf_counter() - start) / synced_events
+
+        path = os.path.join(tmp, "events.ndjson")
+        start = time.perf_counter()
+        with eventlog.EventLog(path) as log:
+            write_sessions(log)
+        written = time.perf_counter() - start
+        size = os.path.getsize(path)
+        events = sum(1 for _ in open(path, "rb"))
+
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        start = time.perf_counter()
+        replayed = 0
+        modules_replayed = 0
+        for session in eventlog.replay_sessions(eventlog.iter_events(path)):
+            replayed += 1
+            modules_replayed += len(session.times)
+        replay = time.perf_counter() - start
+        start = time.perf_counter()
+        stats = eventlog.replay_stats(eventlog.iter_events(path))
+        stats_time = time.perf_counter() - start
+        rss_growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before
+
+    mb = size / 1e6
+    print(f"{events} events from {sessions} sessions, {mb:.0f} MB")
+    print(f"  fsync per event:   {synced * 1e6:8.1f} us/event")
+    print(f"  buffered writer:   {written / events * 1e6:8.2f} us/event  ({mb / written:6.1f} MB/s)")
+    print(f"  replay sessions:   {replay:6.2f} s  ({mb / replay:6.1f} MB/s, {replayed} sessions, {modules_replayed} module times)")
+    print(f"  replay stats:      {stats_time:6.2f} s  ({mb / stats_time:6.1f} MB/s, {len(stats)} modules)")
+    print(f"  peak RSS growth during replay: {rss_growth / 1024:.1f} MB")
+
+
+def bench_instrumentation(nodes=200_000, rounds=3):
+    """Tree building with instrumentation disabled vs. enabled, alternating to cancel out heap growth."""
+    import gc
+
+    import final
+    import instrumentation
+
+    def build():
+        gc.collect()
+        gc.disable()  # Collector pauses grow with the heap and would swamp the difference
+        start = time.perf_counter()
+        _build_synthetic_syllabus(final.TreeNode, nodes)
+        elapsed = time.perf_counter() - start
+        gc.enable()
+        return elapsed
+
+    original = final.TreeNode.add_child
+    metrics = instrumentation.Instrumentation()
+    disabled = enabled = float("inf")
+    for _ in range(rounds):
+        disabled = min(disabled, build())
+        with metrics:
+            enabled = min(enabled, build())
+    restored = final.TreeNode.add_child is original
+    per_build = metrics.histograms["TreeNode.add_child"].count / rounds
+
+    print(f"{nodes} nodes built with add_child (best of {rounds})")
+    print(f"  disabled: {disabled * 1000:7.1f} ms  (original methods restored: {restored})")
+    print(f"  enabled:  {enabled * 1000:7.1f} ms  (+{(enabled - disabled) / per_build * 1e9:.0f} ns per call)")
+    print(metrics.format_report())
+
+
+BENCHMARKS = {
+    "import_time": bench_import_time,
+    "catalog_streaming": bench_catalog_streaming,
+    "node_memory": bench_node_memory,
+    "flat_tree": bench_flat_tree,
+    "linked_list_append": bench_linked_list_append,
+    "render_tree": bench_render_tree,
+    "search_latency": bench_search_latency,
+    "question_retrieval": bench_question_retrieval,
+    "quiz_sampling": bench_quiz_sampling,
+    "async_sessions": bench_async_sessions,
+    "http_throughput": bench_http_throughput,
+    "subtree_aggregates": bench_subtree_aggregates,
+    "snapshot_load": bench_snapshot_load,
+    "progress_store": bench_progress_store,
+    "study_planner": bench_study_planner,
+    "prerequisites": bench_prerequisites,
+    "review_queue": bench_review_queue,
+    "link_check": bench_link_check,
+    "diagram_export": bench_diagram_export,
+    "tree_diff": bench_tree_diff,
+    "batch_report": bench_batch_report,
+    "event_log": bench_event_log,
+    "instrumentation": bench_instrumentation,
+}
+
+
+def main(names):
+    for name in names or BENCHMARKS:
+        print(f"== {name} ==")
+        BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,180 @@
+"""Load syllabus trees from JSON, JSON Lines or TOML catalog files.
+
+Every course is stored as a nested node record:
+
+    {"name": "Module 4: Trees", "hours": 6,
+     "resources": {"BST Operations": "https://..."},
+     "questions": {"Binary Search Trees (BST)": ["...", "..."]},
+     "children": [...]}
+
+Only "name" is required. A catalog file holds one course, a list of courses
+(`.json`), one course per line (`.jsonl`) or `[[course]]` tables (`.toml`).
+"""
+import json
+import os
+
+from final import TreeNode
+
+SYLLABUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "syllabi")
+CHUNK_SIZE = 64 * 1024  # Bytes read at a time by the streaming JSON parser
+_NUMBER_CHARS = "0123456789+-.eE"
+
+
+def node_from_dict(data):
+    """Build a TreeNode (and its subtree) from a node record."""
+    node = TreeNode(data["name"], data.get("hours"))
+    for key, url in data.get("resources", {}).items():
+        node.add_resource(key, url)
+    for topic, questions in data.get("questions", {}).items():
+        node.add_questions(topic, list(questions))
+    for child in data.get("children", ()):
+        node.add_child(node_from_dict(child))
+    return node
+
+
+def node_to_dict(node):
+    """Convert a TreeNode (and its subtree) to a node record, omitting empty fields."""
+    data = {"name": node.name}
+    if node.hours is not None:
+        data["hours"] = node.hours
+    if node.resources:
+        data["resources"] = dict(node.resources)
+    if node.questions_map:
+        data["questions"] = {topic: list(qs) for topic, qs in node.questions_map.items()}
+    if node.children:
+        data["children"] = [node_to_dict(child) for child in node.children]
+    return data
+
+
+def _iter_json_values(f):
+    """Yield top-level values of a JSON document one at a time.
+
+    A top-level array is streamed element by element, so only one course is
+    held in memory at once; any other document is yielded as a single value.
+    Values may span chunk boundaries, and elements must be separated by
+    exactly one comma.
+    """
+    decoder = json.JSONDecoder()
+    buf, pos, eof = "", 0, False
+
+    def available():
+        """Read chunks until buf[pos] exists; False at the end of the file."""
+        nonlocal buf, pos, eof
+        while pos >= len(buf) and not eof:
+            buf, pos = f.read(CHUNK_SIZE), 0
+            eof = not buf
+        return pos < len(buf)
+
+    def skip_space():
+        nonlocal pos
+        while available() and buf[pos] in " \t\r\n":
+            pos += 1
+
+    def decode():
+        nonlocal buf, pos, eof
+        while True:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                if eof or buf[end:end + 32].strip(_NUMBER_CHARS):
+                    pos = end
+                    return value
+                # Only number characters follow (e.g. "-7." of "-7.5e3"): it may continue in the next chunk
+            chunk = f.read(CHUNK_SIZE)
+            eof = not chunk
+            buf, pos = buf[pos:] + chunk, 0
+
+    def end_of_document():
+        skip_space()
+        if available():
+            raise ValueError("Unexpected data after JSON value in catalog")
+
+    skip_space()
+    if not available():
+        return
+    if buf[pos] != "[":
+        value = decode()
+        end_of_document()
+        yield value
+        return
+
+    pos += 1
+    skip_space()
+    if available() and buf[pos] == "]":
+        pos += 1
+        end_of_document()
+        return
+    while True:
+        skip_space()
+        if not available():
+            raise ValueError("Unterminated JSON array in catalog")
+        if buf[pos] in ",]":
+            raise ValueError(f"Expected a value in catalog array, found {buf[pos]!r}")
+        yield decode()
+        skip_space()
+        if not available():
+            raise ValueError("Unterminated JSON array in catalog")
+        separator = buf[pos]
+        pos += 1
+        if separator == "]":
+            break
+        if separator != ",":
+            raise ValueError(f"Expected ',' or ']' after a value in catalog array, found {separator!r}")
+    end_of_document()
+
+
+def iter_course_records(path):
+    """Yield raw course records from a catalog file without loading the whole file."""
+    if path.endswith(".toml"):
+        import tomllib
+
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+        yield from data.get("course", [data] if "name" in data else [])
+    elif path.endswith(".jsonl"):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        with open(path, encoding="utf-8") as f:
+            for value in _iter_json_values(f):
+                if isinstance(value, list):  # Nested list of courses
+                    yield from value
+                else:
+                    yield value
+
+
+def iter_catalog(path):
+    """Yield one TreeNode per course in a catalog file, building each lazily."""
+    for record in iter_course_records(path):
+        yield node_from_dict(record)
+
+
+def load_catalog(path):
+    """Load every course in a catalog file into a list of TreeNode roots."""
+    return list(iter_catalog(path))
+
+
+def load_syllabus(name):
+    """Load a single course from the bundled syllabi directory (or an explicit path)."""
+    path = name if os.path.dirname(name) else os.path.join(SYLLABUS_DIR, name)
+    for root in iter_catalog(path):
+        return root
+    raise ValueError(f"No course found in {path}")
+
+
+def save_catalog(roots, path):
+    """Write TreeNode roots to a catalog file (one course per line for `.jsonl`)."""
+    with open(path, "w", encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            for root in roots:
+                f.write(json.dumps(node_to_dict(root), ensure_ascii=False))
+                f.write("\n")
+        else:
+            records = [node_to_dict(root) for root in roots]
+            json.dump(records[0] if len(records) == 1 else records, f, indent=2, ensure_ascii=False)
+            f.write("\n")
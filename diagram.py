@@ -0,0 +1,202 @@
+"""SVG and Graphviz DOT diagrams of syllabus trees.
+
+    python diagram.py dsa.svg                     # first syllabus, as SVG
+    python diagram.py trees.dot --syllabus 1 --path "Module 4: Trees"
+
+    export(root, "syllabus.svg", max_depth=2)
+    with open("syllabus.dot", "w") as f:
+        write_dot(root, f)
+
+The layout is computed here in linear time, without networkx: the tree runs
+left to right, one column per depth (as wide as its longest label), leaves
+take consecutive rows in syllabus order and every parent is centered on its
+first and last child. Output is streamed to the file in chunks.
+`final.draw_tree` uses the same layout when an interactive matplotlib
+window is wanted.
+"""
+import argparse
+from array import array
+from html import escape
+
+from render import FLUSH_CHARS, find_subtree
+
+ROW_HEIGHT = 22      # Pixels between leaf rows
+CHAR_WIDTH = 7       # Approximate pixels per label character at FONT_SIZE
+COLUMN_GAP = 40      # Pixels between the longest label of a column and the next column
+FONT_SIZE = 12
+MARGIN = 20
+
+
+def label_of(node):
+    return f"{node.name} ({node.hours} hours)" if node.hours else node.name
+
+
+class TreeLayout:
+    """Node positions for a tree, in pre-order (index 0 is the root)."""
+
+    def __init__(self, root, max_depth=None):
+        self.nodes = []                 # Pre-order nodes
+        self.parent = array("i")        # Index of each node's parent (-1 for the root)
+        self.depth = array("I")
+        first_child = array("i")
+        last_child = array("i")
+        stack = [(root, -1, 0)]
+        while stack:
+            node, parent, depth = stack.pop()
+            index = len(self.nodes)
+            self.nodes.append(node)
+            self.parent.append(parent)
+            self.depth.append(depth)
+            first_child.append(-1)
+            last_child.append(-1)
+            if parent >= 0:
+                if first_child[parent] < 0:
+                    first_child[parent] = index
+                last_child[parent] = index
+            if max_depth is None or depth < max_depth:
+                children = node.children
+                for i in range(len(children) - 1, -1, -1):
+                    stack.append((children[i], index, depth + 1))
+
+        # Rows: leaves in order, then parents centered over their children (children come later in pre-order)
+        self.row = array("d", bytes(8 * len(self.nodes)))
+        next_row = 0
+        for i in range(len(self.nodes)):
+            if first_child[i] < 0:
+                self.row[i] = next_row
+                next_row += 1
+        for i in range(len(self.nodes) - 1, -1, -1):
+            if first_child[i] >= 0:
+                self.row[i] = (self.row[first_child[i]] + self.row[last_child[i]]) / 2
+        self.rows = next_row
+
+        # Columns: each depth is as wide as its longest label
+        widths = []
+        for node, depth in zip(self.nodes, self.depth):
+            if depth == len(widths):
+                widths.append(0)
+            widths[depth] = max(widths[depth], len(label_of(node)))
+        self.column_x = [MARGIN]
+        for width in widths:
+            self.column_x.append(self.column_x[-1] + width * CHAR_WIDTH + COLUMN_GAP)
+        self.width = self.column_x.pop()
+        self.height = 2 * MARGIN + max(self.rows - 1, 0) * ROW_HEIGHT
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def position(self, index):
+        """Return the (x, y) pixel position of a node's connection point."""
+        return self.column_x[self.depth[index]], MARGIN + self.row[index] * ROW_HEIGHT
+
+
+def _write_chunked(out, parts):
+    """Write an iterable of strings to `out` in chunks of about FLUSH_CHARS characters."""
+    chunk = []
+    size = 0
+    for part in parts:
+        chunk.append(part)
+        size += len(part)
+        if size >= FLUSH_CHARS:
+            out.write("".join(chunk))
+            chunk = []
+            size = 0
+    if chunk:
+        out.write("".join(chunk))
+
+
+def _subtree(root, path):
+    if path is None:
+        return root
+    node = find_subtree(root, path)
+    if node is None:
+        raise KeyError(f"No topic at path {path!r}")
+    return node
+
+
+def _svg_parts(layout):
+    yield (f'<svg xmlns="http://www.w3.org/2000/svg" width="{layout.width}" height="{layout.height:.0f}" '
+           f'viewBox="0 0 {layout.width} {layout.height:.0f}">\n')
+    yield '<g fill="none" stroke="#999" stroke-width="1">\n'
+    for i in range(1, len(layout)):
+        px, py = layout.position(layout.parent[i])
+        x, y = layout.position(i)
+        px += len(label_of(layout.nodes[layout.parent[i]])) * CHAR_WIDTH + 8
+        mid = x - COLUMN_GAP / 2  # Siblings share one vertical connector just before their column
+        yield f'<path d="M{px:.0f} {py:.1f}H{mid:.0f}V{y:.1f}H{x - 4:.0f}"/>\n'
+    yield f'</g>\n<g font-family="sans-serif" font-size="{FONT_SIZE}" fill="#222">\n'
+    for i, node in enumerate(layout.nodes):
+        x, y = layout.position(i)
+        weight = ' font-weight="bold"' if node.children else ""
+        yield f'<text x="{x}" y="{y + FONT_SIZE / 3:.1f}"{weight}>{escape(label_of(node))}</text>\n'
+    yield "</g>\n</svg>\n"
+
+
+def write_svg(root, out, max_depth=None, path=None):
+    """Stream an SVG diagram of a tree (or the subtree at `path`) to `out`; returns the node count."""
+    layout = TreeLayout(_subtree(root, path), max_depth)
+    _write_chunked(out, _svg_parts(layout))
+    return len(layout)
+
+
+def _dot_quote(text):
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _dot_parts(root, max_depth, with_positions, count):
+    layout = TreeLayout(root, max_depth) if with_positions else None
+    yield "digraph syllabus {\n  rankdir=LR;\n  node [shape=box, fontname=\"sans-serif\", fontsize=10];\n"
+    stack = [(root, -1, 0)]
+    index = 0
+    while stack:
+        node, parent, depth = stack.pop()
+        attributes = f"label={_dot_quote(label_of(node))}"
+        if layout is not None:
+            x, y = layout.position(index)
+            attributes += f', pos="{x:.0f},{layout.height - y:.1f}!"'  # DOT's y axis points up
+        yield f"  n{index} [{attributes}];\n"
+        if parent >= 0:
+            yield f"  n{parent} -> n{index};\n"
+        if max_depth is None or depth < max_depth:
+            children = node.children
+            for i in range(len(children) - 1, -1, -1):
+                stack.append((children[i], index, depth + 1))
+        index += 1
+    count.append(index)
+    yield "}\n"
+
+
+def write_dot(root, out, max_depth=None, path=None, with_positions=False):
+    """Stream a Graphviz DOT graph of a tree to `out`; returns the node count.
+
+    With `with_positions`, nodes carry this module's layout as fixed `pos`
+    attributes (render with `neato -n`); otherwise Graphviz lays them out.
+    """
+    count = []  # Filled in with the node count once every node is written
+    _write_chunked(out, _dot_parts(_subtree(root, path), max_depth, with_positions, count))
+    return count[0]
+
+
+def export(root, filename, max_depth=None, path=None):
+    """Write a tree to a .svg or .dot file, chosen by extension; returns the node count."""
+    if filename.endswith(".svg"):
+        writer = write_svg
+    elif filename.endswith((".dot", ".gv")):
+        writer = write_dot
+    else:
+        raise ValueError(f"Unsupported diagram format: {filename} (use .svg or .dot)")
+    with open(filename, "w", encoding="utf-8") as f:
+        return writer(root, f, max_depth=max_depth, path=path)
+
+
+if __name__ == "__main__":
+    from final import build_syllabus_list
+
+    parser = argparse.ArgumentParser(description="Export a syllabus tree as SVG or Graphviz DOT.")
+    parser.add_argument("filename", help="Output file ending in .svg or .dot")
+    parser.add_argument("--syllabus", type=int, default=1, help="Syllabus number, as in the menu")
+    parser.add_argument("--path", help='Subtree to export, e.g. "Module 4: Trees"')
+    parser.add_argument("--depth", type=int, help="Levels below the exported node to include")
+    args = parser.parse_args()
+    nodes = export(build_syllabus_list()[args.syllabus - 1], args.filename, args.depth, args.path)
+    print(f"Wrote {nodes} nodes to {args.filename}")
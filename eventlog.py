@@ -0,0 +1,211 @@
+"""Append-only log of study session events, and replay of it.
+
+    with EventLog("events.ndjson") as log:
+        display_next_module(syllabus, log=log, learner="ana")
+
+    for session in replay_sessions(iter_events("events.ndjson")):
+        print(session.session, session.syllabus, session.times.summary())
+    stats = replay_stats(iter_events("events.ndjson"))   # {(syllabus, module): ModuleStats}
+
+The log is newline-delimited JSON, one event per line:
+
+    {"ts":1760000000.1,"session":"3f2a9c0d1e4b","event":"session_start","syllabus":"...","learner":"ana"}
+    {"ts":...,"session":"...","event":"module_start","module":"Module 1: Basics","number":1}
+    {"ts":...,"session":"...","event":"questions","module":"Module 1: Basics","number":1}
+    {"ts":...,"session":"...","event":"module_complete","module":"Module 1: Basics","number":1,"seconds":812.4}
+    {"ts":...,"session":"...","event":"session_end","modules":6}
+
+Events go through a large write buffer and are fsynced at most
+`fsync_interval` seconds after they are written (and on flush/close), so
+logging costs no disk round trip per event; a timer makes the fsync happen
+even if no further event comes, e.g. while the learner is reading. Replay
+streams the file line by line and keeps only sessions that are still open,
+so memory does not grow with the log. A line cut short by a crash is
+skipped, and reopening such a log ends the torn line first so the next
+event starts on a line of its own.
+"""
+import json
+import os
+import threading
+import time
+import uuid
+from collections import namedtuple
+
+from final import LinkedList
+
+ReplayedSession = namedtuple("ReplayedSession", "session syllabus learner started_at times questions finished")
+
+
+class EventLog:
+    """Buffered, append-only NDJSON writer with periodic fsync."""
+
+    def __init__(self, path="events.ndjson", buffer_size=1 << 20, fsync_interval=1.0, clock=time.time):
+        self.path = path
+        self.fsync_interval = fsync_interval  # Max seconds between fsyncs while events are written
+        self.clock = clock
+        self._file = open(path, "ab", buffering=buffer_size)
+        if self._file.tell() and not _ends_with_newline(path):
+            self._file.write(b"\n")  # Finish a line torn by a crash; replay skips it
+        self._lock = threading.Lock()
+        self._last_sync = time.monotonic()
+        self._dirty = False   # Events written since the last fsync
+        self._timer = None    # Pending fsync of events written since the last one
+        self._encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+    def new_session(self, syllabus, learner=None):
+        """Log the start of a session and return its id."""
+        session = uuid.uuid4().hex[:12]
+        fields = {"syllabus": syllabus}
+        if learner is not None:
+            fields["learner"] = learner
+        self.emit(session, "session_start", **fields)
+        return session
+
+    def emit(self, session, event, **fields):
+        """Append one event to the log."""
+        record = {"ts": self.clock(), "session": session, "event": event}
+        record.update(fields)
+        line = (self._encode(record) + "\n").encode()
+        with self._lock:
+            self._file.write(line)
+            self._dirty = True
+            elapsed = time.monotonic() - self._last_sync
+            if elapsed >= self.fsync_interval:
+                self._sync()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.fsync_interval - elapsed, self._timed_sync)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._last_sync = time.monotonic()
+        self._dirty = False
+
+    def _timed_sync(self):
+        with self._lock:
+            self._timer = None
+            if self._dirty and not self._file.closed:
+                self._sync()
+
+    def flush(self):
+        """Write buffered events and fsync them to disk."""
+        with self._lock:
+            self._sync()
+
+    def close(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._file.closed:
+                self._sync()
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _ends_with_newline(path):
+    with open(path, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+
+def iter_events(path, session=None, events=None):
+    """Yield the events of a log as dictionaries, in the order they were written.
+
+    `session` and `events` (a set of event names) filter what is yielded; lines
+    that cannot match the session are skipped without being decoded.
+    """
+    needle = f'"session":{json.dumps(session)}'.encode() if session is not None else None
+    decode = json.JSONDecoder().decode  # Faster than json.loads on bytes, which sniffs the encoding per call
+    with open(path, "rb", buffering=1 << 20) as f:
+        for line in f:
+            if needle is not None and needle not in line:
+                continue
+            if not line.endswith(b"\n"):
+                break  # Last event was cut short while being written
+            try:
+                event = decode(line.decode())
+            except ValueError:  # Includes UnicodeDecodeError
+                continue  # Corrupt line, e.g. a torn write before a crash
+            if events is None or event["event"] in events:
+                yield event
+
+
+def replay_sessions(events):
+    """Rebuild sessions from an event stream, yielding a ReplayedSession as each one ends.
+
+    `times` is the session's LinkedList of module times and `questions` the
+    set of modules whose questions were opened. Sessions without a
+    session_end event are yielded at the end with finished=False.
+    """
+    open_sessions = {}  # Session id -> [syllabus, learner, started at, LinkedList, questions]
+    for event in events:
+        kind = event["event"]
+        session = event["session"]
+        if kind == "session_start":
+            open_sessions[session] = [event.get("syllabus"), event.get("learner"), event["ts"], LinkedList(), set()]
+            continue
+        state = open_sessions.get(session)
+        if state is None:
+            continue  # Started before the part of the log being replayed
+        if kind == "module_complete":
+            state[3].append(event["seconds"])
+        elif kind == "questions":
+            state[4].add(event["module"])
+        elif kind == "session_end":
+            del open_sessions[session]
+            yield ReplayedSession(session, *state, True)
+    for session, state in open_sessions.items():
+        yield ReplayedSession(session, *state, False)
+
+
+class ModuleStats:
+    """Running totals for one module across every replayed session."""
+    __slots__ = ("completions", "total_seconds", "min_seconds", "max_seconds", "questions")
+
+    def __init__(self):
+        self.completions = 0
+        self.total_seconds = 0.0
+        self.min_seconds = float("inf")
+        self.max_seconds = 0.0
+        self.questions = 0  # Sessions that opened the module's questions
+
+    @property
+    def mean_seconds(self):
+        return self.total_seconds / self.completions if self.completions else 0.0
+
+    def __repr__(self):
+        return f"ModuleStats({self.completions} completions, mean {self.mean_seconds:.1f} s)"
+
+
+def replay_stats(events):
+    """Return {(syllabus, module): ModuleStats} from an event stream, in constant memory per module."""
+    syllabus_of = {}  # Open session id -> syllabus
+    stats = {}
+    for event in events:
+        kind = event["event"]
+        if kind == "session_start":
+            syllabus_of[event["session"]] = event.get("syllabus")
+        elif kind == "session_end":
+            syllabus_of.pop(event["session"], None)
+        elif kind in ("module_complete", "questions"):
+            key = (syllabus_of.get(event["session"]), event["module"])
+            module = stats.get(key)
+            if module is None:
+                module = stats[key] = ModuleStats()
+            if kind == "questions":
+                module.questions += 1
+            else:
+                seconds = event["seconds"]
+                module.completions += 1
+                module.total_seconds += seconds
+                module.min_seconds = min(module.min_seconds, seconds)
+                module.max_seconds = max(module.max_seconds, seconds)
+    return stats
@@ -1,6 +1,3 @@
-import matplotlib.pyplot as plt
-import networkx as nx
-
 class TreeNode:
     def __init__(self, name, hours=None):
         self.name = name           # Name of the module, topic, or subtopic
@@ -34,9 +31,10 @@ class TreeNode:
 
     def display_questions(self):
         """Print questions for the current node topic."""
-        if self.name in self.questions_map:
+        questions = [question for questions in self.questions_map.values() for question in questions]
+        if questions:
             print("    Questions:")
-            for question in self.questions_map[self.name]:
+            for question in questions:
                 print(f"        - {question}")
 
 def build_syllabus_tree():
@@ -203,5 +201,5 @@ def build_syllabus_tree():
 
     return syllabus
 
-# Call the function
-syllabus_tree = build_syllabus_tree()  # Build and display the syllabus tree with resources and questions
+if __name__ == "__main__":
+    syllabus_tree = build_syllabus_tree()  # Build and display the syllabus tree with resources and questions
@@ -1,49 +1,268 @@
-import matplotlib.pyplot as plt
-import networkx as nx
-import random
-import time
+import weakref
+from array import array
+from types import MappingProxyType, MethodType
+
+from render import render_tree
+from timing import SessionTimer, format_wall_clock
+
+# Shared read-only placeholders used until a node gets its first child, resource or question.
+# Most topics are leaves, so this avoids allocating three empty containers per node.
+_EMPTY_MAP = MappingProxyType({})
+_NO_CHILDREN = ()
+
+# Callables notified of tree changes as observer(event, node, *args): ("child", parent, child),
+# ("resource", node, key, url), ("questions", node, topic, questions), ("remove_child", parent, child),
+# ("remove_resource", node, key), ("remove_questions", node, topic), ("hours", node, hours)
+# or ("reorder", node).
+# Indexes register here to stay up to date; with no observers the check costs one truth test.
+# Each entry is a reference to call for the observer. Bound methods are held weakly, so an index
+# that is no longer used stops observing (and can be freed) even if it was never closed. The
+# tuple is replaced rather than mutated, so observers can come and go while events are sent.
+_observers = ()
+
+def add_observer(observer):
+    """Register a callable to be notified when any TreeNode is modified.
+
+    Bound methods are held through a weak reference and dropped once their
+    object is garbage collected; other callables are held strongly.
+    """
+    global _observers
+    if isinstance(observer, MethodType):
+        ref = weakref.WeakMethod(observer, _discard)
+    else:
+        ref = lambda: observer
+    _observers += (ref,)
+
+def remove_observer(observer):
+    """Stop notifying a previously registered observer."""
+    for ref in _observers:
+        if ref() == observer:
+            _discard(ref)
+            return
+    raise ValueError(f"{observer!r} is not an observer")
+
+def _discard(ref):
+    global _observers
+    _observers = tuple(other for other in _observers if other is not ref)
+
+def _notify(*event):
+    for ref in _observers:
+        observer = ref()
+        if observer is not None:
+            observer(*event)
 
 class TreeNode:
+    __slots__ = ("name", "hours", "resources", "children", "questions_map", "parent", "_aggregates")
+
     def __init__(self, name, hours=None):
         self.name = name           # Name of the module, topic, or subtopic
         self.hours = hours          # Duration in hours (optional for each node)
-        self.resources = {}         # HashMap for additional resources
-        self.children = []          # List of child TreeNode instances
-        self.questions_map = {}     # HashMap for storing questions related to the topic
+        self.resources = _EMPTY_MAP         # HashMap for additional resources
+        self.children = _NO_CHILDREN        # List of child TreeNode instances
+        self.questions_map = _EMPTY_MAP     # HashMap for storing questions related to the topic
+        self.parent = None          # Parent TreeNode (None for a root)
+        self._aggregates = None     # Cached (hours, descendants, questions, resources) for the subtree,
+                                    # updated along the ancestor path by the add_* methods
+
+    def __getstate__(self):
+        """Pickle/copy support: the shared empty placeholders and the parent link are left out.
+
+        Pickling a subtree therefore doesn't drag its ancestors along; the
+        children's parent links are restored by __setstate__.
+        """
+        state = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if name != "parent" and value is not _EMPTY_MAP and value is not _NO_CHILDREN:
+                state[name] = value
+        return state
+
+    def __setstate__(self, state):
+        self.resources = self.questions_map = _EMPTY_MAP
+        self.children = _NO_CHILDREN
+        self.parent = None
+        for name, value in state.items():
+            setattr(self, name, value)
+        for child in self.children:
+            child.parent = self
 
     def add_child(self, child_node):
         """Add a child node to this node."""
+        if self.children is _NO_CHILDREN:
+            self.children = []
         self.children.append(child_node)
+        child_node.parent = self
+        if self._aggregates is not None:
+            hours, descendants, questions, resources = child_node.aggregates()
+            self._add_to_aggregates(hours, descendants + 1, questions, resources)
+        if _observers:
+            _notify("child", self, child_node)
 
     def add_resource(self, key, url):
         """Add a resource link to the resources hashmap."""
+        if self.resources is _EMPTY_MAP:
+            self.resources = {}
+        if self._aggregates is not None and key not in self.resources:
+            self._add_to_aggregates(0, 0, 0, 1)
         self.resources[key] = url
+        if _observers:
+            _notify("resource", self, key, url)
 
     def add_questions(self, topic, questions):
         """Store questions for a specific topic in the hashmap."""
+        if self.questions_map is _EMPTY_MAP:
+            self.questions_map = {}
+        if self._aggregates is not None:
+            self._add_to_aggregates(0, 0, len(questions) - len(self.questions_map.get(topic, ())), 0)
         self.questions_map[topic] = questions
-
-    def display_tree(self, level=0):
-        """Recursively display the tree structure."""
-        indent = "  " * level
-        hours_info = f" ({self.hours} hours)" if self.hours else ""
-        print(f"{indent}- {self.name}{hours_info}")
-        for key, url in self.resources.items():
-            print(f"{indent}    {key}: {url}")
-        for child in self.children:
-            child.display_tree(level + 1)
+        if _observers:
+            _notify("questions", self, topic, questions)
+
+    def remove_child(self, child_node):
+        """Detach a child (and its subtree) from this node; ValueError if it isn't a child."""
+        if self.children is _NO_CHILDREN:
+            raise ValueError(f"{child_node.name!r} is not a child of {self.name!r}")
+        self.children.remove(child_node)
+        child_node.parent = None
+        if self._aggregates is not None:
+            hours, descendants, questions, resources = child_node.aggregates()
+            self._add_to_aggregates(-hours, -descendants - 1, -questions, -resources)
+        if _observers:
+            _notify("remove_child", self, child_node)
+
+    def remove_resource(self, key):
+        """Remove a resource link; KeyError if there is none under `key`."""
+        if self.resources is _EMPTY_MAP:
+            raise KeyError(key)
+        del self.resources[key]
+        if self._aggregates is not None:
+            self._add_to_aggregates(0, 0, 0, -1)
+        if _observers:
+            _notify("remove_resource", self, key)
+
+    def remove_questions(self, topic):
+        """Remove the questions stored under a topic key; KeyError if there are none."""
+        if self.questions_map is _EMPTY_MAP:
+            raise KeyError(topic)
+        questions = self.questions_map.pop(topic)
+        if self._aggregates is not None:
+            self._add_to_aggregates(0, 0, -len(questions), 0)
+        if _observers:
+            _notify("remove_questions", self, topic)
+
+    def set_hours(self, hours):
+        """Change this node's hours, keeping cached subtree totals up to date."""
+        if self._aggregates is not None:
+            self._add_to_aggregates((hours or 0) - (self.hours or 0), 0, 0, 0)
+        self.hours = hours
+        if _observers:
+            _notify("hours", self, hours)
+
+    def reorder_children(self, names):
+        """Put the children in the order of `names` (a permutation of their names)."""
+        if self.children is _NO_CHILDREN:
+            if names:
+                raise ValueError(f"{self.name!r} has no children to reorder")
+            return
+        position = {name: i for i, name in enumerate(names)}
+        self.children.sort(key=lambda child: position[child.name])
+        if _observers:
+            _notify("reorder", self)
+
+    def get_questions(self):
+        """Return every question stored on this node, whatever topic key it was added under."""
+        return [question for questions in self.questions_map.values() for question in questions]
+
+    def _add_to_aggregates(self, hours, descendants, questions, resources):
+        """Apply a change to the cached totals of this node and its ancestors.
+
+        A cached node always has cached descendants, so the walk stops at the first
+        ancestor that is not cached (none above it are either).
+        """
+        node = self
+        while node is not None and node._aggregates is not None:
+            old = node._aggregates
+            node._aggregates = (old[0] + hours, old[1] + descendants, old[2] + questions, old[3] + resources)
+            node = node.parent
+
+    def invalidate_aggregates(self):
+        """Drop cached subtree totals of this node and its ancestors.
+
+        The add_*/remove_* methods and set_hours keep the totals up to date; call this
+        after changing `hours` directly.
+        """
+        node = self
+        while node is not None and node._aggregates is not None:
+            node._aggregates = None
+            node = node.parent
+
+    def aggregates(self):
+        """Return (total hours, descendant count, question count, resource count) for the subtree."""
+        if self._aggregates is not None:
+            return self._aggregates
+        # Collect uncached nodes in pre-order, then fill them in bottom-up
+        order = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            for child in node.children:
+                if child._aggregates is None:
+                    stack.append(child)
+        for node in reversed(order):
+            hours = node.hours or 0
+            descendants = 0
+            questions = sum(len(qs) for qs in node.questions_map.values())
+            resources = len(node.resources)
+            for child in node.children:
+                child_hours, child_descendants, child_questions, child_resources = child._aggregates
+                hours += child_hours
+                descendants += child_descendants + 1
+                questions += child_questions
+                resources += child_resources
+            node._aggregates = (hours, descendants, questions, resources)
+        return self._aggregates
+
+    def total_hours(self):
+        """Sum of `hours` over this node and all its descendants."""
+        return self.aggregates()[0]
+
+    def descendant_count(self):
+        """Number of nodes below this one."""
+        return self.aggregates()[1]
+
+    def question_count(self):
+        """Number of questions stored in this subtree."""
+        return self.aggregates()[2]
+
+    def resource_count(self):
+        """Number of resources stored in this subtree."""
+        return self.aggregates()[3]
+
+    def display_tree(self, level=0, out=None, max_depth=None):
+        """Display the tree structure (iteratively, through one buffered writer)."""
+        render_tree(self, out, level, max_depth)
 
 class Node:
     """Class for creating a Node in the linked list."""
+    __slots__ = ("module_time", "next")
+
     def __init__(self, module_time):
         self.module_time = module_time  # Time for this module (in seconds)
         self.next = None  # Pointer to the next node
 
 class LinkedList:
-    """Linked list to store module times."""
+    """Linked list to store module times.
+
+    A tail pointer makes append O(1), and the times are mirrored in a compact
+    array so a module's time can be read by its number without walking the list.
+    """
     def __init__(self):
         self.head = None
+        self.tail = None  # Last node, so appends don't walk the list
         self.number_of_nodes = 0  # Initialize the counter for the number of nodes
+        self.times = array("d")  # Module times in order, for indexed access and statistics
+        self.total_time = 0.0  # Running sum of all module times
 
     def append(self, module_time):
         """Append a module time to the linked list."""
@@ -51,24 +270,62 @@ class LinkedList:
         if not self.head:
             self.head = new_node
         else:
-            current = self.head
-            while current.next:
-                current = current.next
-            current.next = new_node
+            self.tail.next = new_node
+        self.tail = new_node
+        self.times.append(module_time)
+        self.total_time += module_time
         self.number_of_nodes += 1  # Increment the number of nodes whenever a new one is added
 
-    def print_times(self):
-        """Print all stored module times along with module number."""
+    def __len__(self):
+        return self.number_of_nodes
+
+    def __iter__(self):
+        """Iterate over module times in the order they were recorded."""
+        return iter(self.times)
+
+    def time_for_module(self, module_number):
+        """Return the time of a module by its 1-based module number."""
+        if not 1 <= module_number <= self.number_of_nodes:
+            raise IndexError(f"Module {module_number} has no recorded time")
+        return self.times[module_number - 1]
+
+    def mean(self):
+        """Return the average module time (0 if nothing was recorded)."""
+        return self.total_time / self.number_of_nodes if self.number_of_nodes else 0.0
+
+    def percentile(self, percent):
+        """Return the given percentile (0-100) of module times, interpolating between ranks."""
+        if not self.number_of_nodes:
+            return 0.0
+        ordered = sorted(self.times)
+        rank = (len(ordered) - 1) * percent / 100
+        low = int(rank)
+        high = min(low + 1, len(ordered) - 1)
+        return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+    def summary(self):
+        """Return total, mean and median/p90/max module times as a dictionary."""
+        return {
+            "modules": self.number_of_nodes,
+            "total": self.total_time,
+            "mean": self.mean(),
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "max": max(self.times, default=0.0),
+        }
+
+    def format_times(self):
+        """Return the report of all module times (with module numbers) and the total."""
         current = self.head
         total_time = 0
-        print("\nTime taken for each module:")
+        lines = ["\nTime taken for each module:"]
         module_number = 1  # Start from module 1
         while current:
             # Convert time to hours, minutes, seconds format
             hours = int(current.module_time // 3600)
             minutes = int((current.module_time % 3600) // 60)
             seconds = int(current.module_time % 60)
-            print(f"Module {module_number}: {hours:02}:{minutes:02}:{seconds:02}")
+            lines.append(f"Module {module_number}: {hours:02}:{minutes:02}:{seconds:02}")
             total_time += current.module_time
             current = current.next
             module_number += 1  # Increment the module number
@@ -78,590 +335,39 @@ class LinkedList:
         total_minutes = int((total_time % 3600) // 60)
         total_seconds = int(total_time % 60)
 
-        print(f"\nTotal time taken for the lesson: {total_hours:02}:{total_minutes:02}:{total_seconds:02}")
-        
+        lines.append(f"\nTotal time taken for the lesson: {total_hours:02}:{total_minutes:02}:{total_seconds:02}")
+        return "\n".join(lines)
+
+    def print_times(self):
+        """Print all stored module times along with module number."""
+        print(self.format_times())
+
 def build_DSA_syllabus_tree():
-    # Root node: Syllabus
-    syllabus = TreeNode("Data Structures and Algorithms Syllabus")
-
-    # Module 1: Algorithm Analysis
-    module1 = TreeNode("Module 1: Algorithm Analysis", 8)
-    module1.add_child(TreeNode("Importance of algorithms and data structures"))
-    module1.add_child(TreeNode("Fundamentals of algorithm analysis"))
-    module1.add_child(TreeNode("Space and time complexity"))
-    module1.add_child(TreeNode("Asymptotic notations and orders of growth"))
-    module1.add_child(TreeNode("Algorithm efficiency: best, worst, and average case"))
-    module1.add_child(TreeNode("Analysis of non-recursive and recursive algorithms"))
-    asymptotic_analysis = TreeNode("Asymptotic analysis for recurrence relations")
-    asymptotic_analysis.add_resource("Recurrence Relations Explained", "https://youtu.be/4V30R3I1vLI?si=ofK-lcoxqETjhM3W")
-    asymptotic_analysis.add_questions("Asymptotic analysis for recurrence relations", [
-        "What is the difference between best, worst, and average case analysis?",
-        "Explain asymptotic notations like Big O, Omega, and Theta."
-    ])
-    module1.add_child(asymptotic_analysis)
-    syllabus.add_child(module1)
-
-    # Module 2: Linear Data Structures
-    module2 = TreeNode("Module 2: Linear Data Structures", 7)
-    arrays = TreeNode("Arrays: 1D and 2D array")
-    arrays.add_resource("Arrays in Data Structures", "https://youtu.be/p5TDnxAYAZY?si=iHCmbu7WHYuZUjjN")
-    arrays.add_questions("Arrays: 1D and 2D array", [
-        "What is the difference between a 1D and 2D array?",
-        "How do you access elements in a 2D array?"
-    ])
-    module2.add_child(arrays)
-
-    stack = TreeNode("Stack and its Applications")
-    stack.add_resource("Introduction to Stacks", "https://youtu.be/bxRVz8zklWM?si=bXFDAA3eSPPEZmnu")
-    stack.add_questions("Stack and its Applications", [
-        "What are the operations of a stack?",
-        "How is a stack used in expression evaluation?"
-    ])
-    module2.add_child(stack)
-
-    queue = TreeNode("Queue and its Applications")
-    queue.add_resource("Introduction to Queues", "https://youtu.be/zp6pBNbUB2U?si=CP6TzGfTkqAsHf-p")
-    queue.add_questions("Queue and its Applications", [
-        "What is the difference between a queue and a stack?",
-        "Explain the concept of circular queue."
-    ])
-    module2.add_child(queue)
-
-    linked_list = TreeNode("List: Singly, Doubly, Circular linked lists")
-    linked_list.add_resource("Singly Linked List Explanation", "https://youtu.be/dmb1i4oN5oE?si=-VREz3hZhB7lKPd2")
-    linked_list.add_questions("List: Singly, Doubly, Circular linked lists", [
-        "What is the difference between singly and doubly linked lists?",
-        "Explain the advantages of circular linked lists."
-    ])
-    module2.add_child(linked_list)
-
-    syllabus.add_child(module2)
-
-    # Module 3: Searching and Sorting
-    module3 = TreeNode("Module 3: Searching and Sorting", 7)
-    searching = TreeNode("Searching: Linear Search, Binary Search")
-    searching.add_resource("Binary Search Algorithm", "https://www.youtube.com/watch?v=V_T5NuccwRA&t=2s")
-    searching.add_questions("Searching: Linear Search, Binary Search", [
-        "What is the time complexity of binary search?",
-        "Explain how linear search differs from binary search."
-    ])
-    module3.add_child(searching)
-
-    sorting = TreeNode("Sorting: Insertion, Selection, Bubble, Counting, Quick, Merge sort")
-    sorting.add_resource("Quick Sort Explained", "https://www.youtube.com/watch?v=HGk_ypEuS24")
-    sorting.add_questions("Sorting: Insertion, Selection, Bubble, Counting, Quick, Merge sort", [
-        "What is the worst-case time complexity of Quick Sort?",
-        "Explain how merge sort works."
-    ])
-    module3.add_child(sorting)
-
-    syllabus.add_child(module3)
-
-    # Module 4: Trees
-    module4 = TreeNode("Module 4: Trees", 6)
-    binary_tree = TreeNode("Binary Tree: Definition and Properties")
-    binary_tree.add_resource("Binary Trees for Beginners", "https://youtu.be/-b2lciNd2L4?si=DmoaRD7WU64pexIR")
-    binary_tree.add_questions("Binary Tree: Definition and Properties", [
-        "What are the properties of a binary tree?",
-        "How do you traverse a binary tree?"
-    ])
-    module4.add_child(binary_tree)
-
-    tree_traversal = TreeNode("Tree Traversals")
-    tree_traversal.add_resource("Tree Traversal Techniques", "https://www.youtube.com/watch?v=xo41NfT8218")
-    tree_traversal.add_questions("Tree Traversals", [
-        "What are the different types of tree traversal?",
-        "Explain in-order, pre-order, and post-order traversal."
-    ])
-    module4.add_child(tree_traversal)
-
-    bst = TreeNode("Binary Search Trees (BST)")
-    bst.add_resource("BST Operations", "https://www.youtube.com/watch?v=cySVml6e_Fc")
-    bst.add_questions("Binary Search Trees (BST)", [
-        "What are the advantages of using a binary search tree?",
-        "How do you balance a binary search tree?"
-    ])
-    module4.add_child(bst)
-
-    syllabus.add_child(module4)
-
-    # Module 5: Graphs
-    module5 = TreeNode("Module 5: Graphs", 6)
-    bfs_dfs = TreeNode("Graph Traversals: BFS and DFS")
-    bfs_dfs.add_resource("Breadth-First Search (BFS)", "https://www.youtube.com/watch?v=AfSk1vA2j8Y")
-    bfs_dfs.add_questions("Graph Traversals: BFS and DFS", [
-        "What is the difference between BFS and DFS?",
-        "How do BFS and DFS differ in terms of implementation?"
-    ])
-    module5.add_child(bfs_dfs)
-
-    mst = TreeNode("Minimum Spanning Tree")
-    mst.add_resource("Prim's and Kruskal's Algorithm", "https://www.youtube.com/watch?v=lxOnvZPBzEc")
-    mst.add_questions("Minimum Spanning Tree", [
-        "What is a minimum spanning tree?",
-        "What are Prim's and Kruskal's algorithms?"
-    ])
-    module5.add_child(mst)
-
-    syllabus.add_child(module5)
-    
-    # Module 6: Hashing
-    module6 = TreeNode("Module 6: Hashing", 4)
-    hashing_methods = TreeNode("Hash functions and Open Hashing")
-    hashing_methods.add_resource("Introduction to Hashing", "https://youtu.be/zeMa9sg-VJM?si=_nyBNPVn1v0Km3wS")
-    hashing_methods.add_questions("Hash functions and Open Hashing", [
-        "Find First Non-Repeating Character in a String",
-        "Explain the concept of open hashing."
-    ])
-    module6.add_child(hashing_methods)
-    
-    syllabus.add_child(module6)
-    
-    # Module 7: Heaps and AVL Trees
-    module7 = TreeNode("Module 7: Heaps and AVL Trees", 5)
-    heaps = TreeNode("Heaps and Heap sort")
-    heaps.add_resource("Heap Sort Algorithm", "https://www.youtube.com/watch?v=XYZ678")
-    heaps.add_questions("Heaps and Heap sort", [
-        "Kth Largest Element in an Array using Heap Sort",
-        "Merge K Sorted Lists"
-    ])
-    module7.add_child(heaps)
-    syllabus.add_child(module7)
-
-    return syllabus
-    
+    """Load the Data Structures and Algorithms syllabus from syllabi/dsa.json."""
+    from catalog import load_syllabus
+    return load_syllabus("dsa.json")
+
 def build_digital_system_design_tree():
-    # Root node: Digital System Design Syllabus
-    syllabus = TreeNode("Digital System Design Syllabus")
-
-    # Module 1: Boolean Algebra and Gate-Level Minimization
-    module1 = TreeNode("Module 1: Boolean Algebra and Gate-Level Minimization", 8)
-    boolean_algebra = TreeNode("Boolean Algebra: Basic definitions, Theorems, and Properties")
-    boolean_algebra.add_resource("Boolean Algebra Fundamentals", "https://youtu.be/xyz123")  # Placeholder link
-    boolean_algebra.add_questions("Boolean Algebra", [
-        "What is Boolean Algebra and how is it used in digital systems?",
-        "Explain the basic theorems and properties of Boolean Algebra."
-    ])
-    module1.add_child(boolean_algebra)
-
-    gate_level_minimization = TreeNode("Gate-Level Minimization: K-map, NAND, NOR")
-    gate_level_minimization.add_resource("K-map Simplification", "https://youtu.be/xyz456")  # Placeholder link
-    gate_level_minimization.add_questions("Gate-Level Minimization", [
-        "How does the K-map help in gate-level minimization?",
-        "Explain the implementation of NAND and NOR gates in digital circuits."
-    ])
-    module1.add_child(gate_level_minimization)
-
-    syllabus.add_child(module1)
-
-    # Module 2: Verilog HDL
-    module2 = TreeNode("Module 2: Verilog HDL", 5)
-    verilog_hld = TreeNode("Verilog HDL: Lexical Conventions, Ports, and Modules")
-    verilog_hld.add_resource("Verilog Syntax Overview", "https://youtu.be/xyz789")  # Placeholder link
-    verilog_hld.add_questions("Verilog HDL", [
-        "What are the basic lexical conventions in Verilog?",
-        "How do you define ports and modules in Verilog?"
-    ])
-    module2.add_child(verilog_hld)
-
-    operators_dataflow = TreeNode("Verilog: Operators, Dataflow Modelling, Gate Level Modelling")
-    operators_dataflow.add_resource("Verilog Operators and Modelling", "https://youtu.be/xyz012")  # Placeholder link
-    operators_dataflow.add_questions("Verilog Operators and Modelling", [
-        "What are the different types of operators in Verilog?",
-        "Explain dataflow and gate-level modelling in Verilog."
-    ])
-    module2.add_child(operators_dataflow)
-
-    test_bench = TreeNode("Verilog: Test Bench")
-    test_bench.add_resource("Test Bench in Verilog", "https://youtu.be/xyz345")  # Placeholder link
-    test_bench.add_questions("Verilog: Test Bench", [
-        "What is the purpose of a test bench in Verilog?",
-        "How do you write a simple test bench for a digital circuit?"
-    ])
-    module2.add_child(test_bench)
-
-    syllabus.add_child(module2)
-
-    # Module 3: Design of Combinational Logic Circuits
-    module3 = TreeNode("Module 3: Design of Combinational Logic Circuits", 8)
-    half_full_adder = TreeNode("Half Adder, Full Adder, Half Subtractor, Full Subtractor")
-    half_full_adder.add_resource("Adder and Subtractor Circuits", "https://youtu.be/xyz678")  # Placeholder link
-    half_full_adder.add_questions("Half Full Adder", [
-        "How does a full adder differ from a half adder?",
-        "Explain the working of a half subtractor circuit."
-    ])
-    module3.add_child(half_full_adder)
-
-    multiplexers_decoders = TreeNode("Decoders, Encoders, Multiplexers, and Demultiplexers")
-    multiplexers_decoders.add_resource("Multiplexers and Decoders", "https://youtu.be/xyz901")  # Placeholder link
-    multiplexers_decoders.add_questions("Decoders, Encoders, Multiplexers", [
-        "What is the difference between a decoder and a multiplexer?",
-        "Explain how a demultiplexer is used in digital circuits."
-    ])
-    module3.add_child(multiplexers_decoders)
-
-    syllabus.add_child(module3)
-
-    # Module 4: Design of Data Path Circuits
-    module4 = TreeNode("Module 4: Design of Data Path Circuits", 6)
-    parallel_adder_subtractor = TreeNode("N-bit Parallel Adder/Subtractor and Carry Look-Ahead Adder")
-    parallel_adder_subtractor.add_resource("Carry Look-Ahead Adder Design", "https://youtu.be/xyz234")  # Placeholder link
-    parallel_adder_subtractor.add_questions("Parallel Adder/Subtractor", [
-        "What is the advantage of a carry look-ahead adder over a ripple carry adder?",
-        "Explain how an N-bit parallel adder works."
-    ])
-    module4.add_child(parallel_adder_subtractor)
-
-    multiplier = TreeNode("Unsigned Array Multiplier, Booth Multiplier")
-    multiplier.add_resource("Booth Multiplier Explanation", "https://youtu.be/xyz567")  # Placeholder link
-    multiplier.add_questions("Multiplier Circuits", [
-        "What is Booth’s algorithm and how does it improve multiplication?",
-        "How does an unsigned array multiplier work?"
-    ])
-    module4.add_child(multiplier)
-
-    syllabus.add_child(module4)
-
-    # Module 5: Design of Sequential Logic Circuits
-    module5 = TreeNode("Module 5: Design of Sequential Logic Circuits", 8)
-    flip_flops = TreeNode("Latches, Flip-Flops (SR, D, JK, T), Shift Registers")
-    flip_flops.add_resource("Flip-Flop Circuits Overview", "https://youtu.be/xyz890")  # Placeholder link
-    flip_flops.add_questions("Flip Flops", [
-        "What are the differences between SR, JK, and D flip-flops?",
-        "How do shift registers function in digital systems?"
-    ])
-    module5.add_child(flip_flops)
-
-    counters = TreeNode("Design of Counters: Modulo-n, Johnson, Ring, Up/Down")
-    counters.add_resource("Digital Counter Design", "https://youtu.be/xyz012")  # Placeholder link
-    counters.add_questions("Counters", [
-        "Explain how a modulo-n counter works.",
-        "What is a Johnson counter and how is it used?"
-    ])
-    module5.add_child(counters)
-
-    syllabus.add_child(module5)
-
-    # Module 6: Design of FSM
-    module6 = TreeNode("Module 6: Design of FSM", 4)
-    fsm = TreeNode("Finite State Machine: Mealy FSM and Moore FSM")
-    fsm.add_resource("FSM Design Techniques", "https://youtu.be/xyz345")  # Placeholder link
-    fsm.add_questions("FSM Design", [
-        "What is the difference between a Mealy and a Moore FSM?",
-        "Explain the steps involved in designing a FSM for sequence detection."
-    ])
-    module6.add_child(fsm)
-
-    syllabus.add_child(module6)
-
-    # Module 7: Programmable Logic Devices
-    module7 = TreeNode("Module 7: Programmable Logic Devices", 4)
-    plds = TreeNode("Types of PLDs: PLA, PAL, CPLD, FPGA")
-    plds.add_resource("PLD Architecture", "https://youtu.be/xyz678")  # Placeholder link
-    plds.add_questions("Programmable Logic Devices", [
-        "What is the difference between PAL and FPGA?",
-        "Explain the architecture of an FPGA."
-    ])
-    module7.add_child(plds)
-
-    syllabus.add_child(module7)
-
-    return syllabus
-    
-def build_complex_tree():
-    # Root node: Complex Analysis and Linear Algebra
-    complex_syllabus = TreeNode("Complex Analysis and Linear Algebra Syllabus")
-
-    # Module 1: Analytic Functions
-    module1 = TreeNode("Module 1: Analytic Functions", 7)
-    analytic_functions = TreeNode("Complex variable - Analytic functions and Cauchy - Riemann equations")
-    analytic_functions.add_resource("Analytic Functions and Cauchy-Riemann Equations", "https://placeholder.com")
-    analytic_functions.add_questions("Analytic Functions", [
-        "What are the Cauchy-Riemann equations?",
-        "How do you prove that a function is analytic?"
-    ])
-    module1.add_child(analytic_functions)
-
-    laplace_equation = TreeNode("Laplace equation and Harmonic functions")
-    laplace_equation.add_resource("Laplace Equation and Harmonic Functions", "https://placeholder.com")
-    laplace_equation.add_questions("Laplace Equation", [
-        "Explain the Laplace equation in the context of complex analysis.",
-        "What are harmonic functions?"
-    ])
-    module1.add_child(laplace_equation)
-
-    fluid_flow = TreeNode("Applications of analytic functions to fluid-flow and electric field problems")
-    fluid_flow.add_resource("Applications in Fluid Flow and Electric Fields", "https://placeholder.com")
-    fluid_flow.add_questions("Applications of Analytic Functions", [
-        "How are analytic functions used in fluid dynamics?",
-        "Explain the application of analytic functions in electric field problems."
-    ])
-    module1.add_child(fluid_flow)
-
-    complex_syllabus.add_child(module1)
-
-    # Module 2: Conformal and Bilinear transformations
-    module2 = TreeNode("Module 2: Conformal and Bilinear transformations", 7)
-    conformal_mapping = TreeNode("Conformal mapping - Elementary transformations")
-    conformal_mapping.add_resource("Conformal Mapping and Transformations", "https://placeholder.com")
-    conformal_mapping.add_questions("Conformal Mapping", [
-        "What is the significance of conformal mappings in complex analysis?",
-        "Explain the transformation of shapes using elementary transformations like rotation and magnification."
-    ])
-    module2.add_child(conformal_mapping)
-
-    bilinear_transformation = TreeNode("Bilinear transformation and Cross-ratio")
-    bilinear_transformation.add_resource("Bilinear Transformation and Cross-ratio", "https://placeholder.com")
-    bilinear_transformation.add_questions("Bilinear Transformation", [
-        "What is the Cross-ratio in the context of bilinear transformations?",
-        "How are regions bounded by straight lines transformed in bilinear transformations?"
-    ])
-    module2.add_child(bilinear_transformation)
-
-    complex_syllabus.add_child(module2)
-
-    # Module 3: Complex Integration
-    module3 = TreeNode("Module 3: Complex Integration", 7)
-    power_series = TreeNode("Functions given by Power Series - Taylor and Laurent series")
-    power_series.add_resource("Power Series and Complex Functions", "https://placeholder.com")
-    power_series.add_questions("Power Series", [
-        "What are the differences between Taylor and Laurent series?",
-        "How do you identify singularities in a complex function?"
-    ])
-    module3.add_child(power_series)
-
-    contour_integral = TreeNode("Integration of a complex function along a contour")
-    contour_integral.add_resource("Complex Integration along Contours", "https://placeholder.com")
-    contour_integral.add_questions("Complex Integration", [
-        "What is Cauchy's integral theorem?",
-        "Explain the significance of Cauchy's residue theorem in complex integration."
-    ])
-    module3.add_child(contour_integral)
-
-    complex_syllabus.add_child(module3)
-
-    # Module 4: Vector Spaces
-    module4 = TreeNode("Module 4: Vector Spaces", 6)
-    vector_space = TreeNode("Vector space - subspace, linear combination, span")
-    vector_space.add_resource("Introduction to Vector Spaces", "https://placeholder.com")
-    vector_space.add_questions("Vector Spaces", [
-        "What is the definition of a vector space?",
-        "Explain the concept of a basis in a vector space."
-    ])
-    module4.add_child(vector_space)
-
-    linear_dependence = TreeNode("Linearly dependent - Independent - bases; Dimensions")
-    linear_dependence.add_resource("Linear Dependence and Dimensions", "https://placeholder.com")
-    linear_dependence.add_questions("Linear Dependence", [
-        "What does it mean for a set of vectors to be linearly independent?",
-        "How do you find the dimension of a vector space?"
-    ])
-    module4.add_child(linear_dependence)
-
-    complex_syllabus.add_child(module4)
-
-    # Module 5: Linear Transformations
-    module5 = TreeNode("Module 5: Linear Transformations", 6)
-    linear_transformations = TreeNode("Linear transformations - Basic properties; Invertible transformations")
-    linear_transformations.add_resource("Linear Transformations and Properties", "https://placeholder.com")
-    linear_transformations.add_questions("Linear Transformations", [
-        "What is the significance of an invertible linear transformation?",
-        "Explain the matrix representation of a linear transformation."
-    ])
-    module5.add_child(linear_transformations)
-
-    complex_syllabus.add_child(module5)
-
-    # Module 6: Inner Product Spaces
-    module6 = TreeNode("Module 6: Inner Product Spaces", 5)
-    inner_product = TreeNode("Dot products and inner products; Lengths and angles of vectors")
-    inner_product.add_resource("Inner Products and Vector Lengths", "https://placeholder.com")
-    inner_product.add_questions("Inner Products", [
-        "How do you calculate the length of a vector using an inner product?",
-        "Explain the concept of orthogonalization in inner product spaces."
-    ])
-    module6.add_child(inner_product)
-
-    complex_syllabus.add_child(module6)
-
-    # Module 7: Matrices and System of Equations
-    module7 = TreeNode("Module 7: Matrices and System of Equations", 5)
-    eigenvalues = TreeNode("Eigenvalues and Eigenvectors; Properties of Eigenvalues")
-    eigenvalues.add_resource("Eigenvalues and Eigenvectors Explained", "https://placeholder.com")
-    eigenvalues.add_questions("Eigenvalues", [
-        "What is the significance of eigenvalues and eigenvectors?",
-        "Explain the Cayley-Hamilton theorem."
-    ])
-    module7.add_child(eigenvalues)
-
-    gaussian_elimination = TreeNode("System of linear equations; Gaussian elimination")
-    gaussian_elimination.add_resource("Solving Linear Equations with Gaussian Elimination", "https://placeholder.com")
-    gaussian_elimination.add_questions("Gaussian Elimination", [
-        "Explain the Gaussian elimination method for solving linear equations.",
-        "How is the Gauss-Jordan method different from Gaussian elimination?"
-    ])
-    module7.add_child(gaussian_elimination)
-
-    complex_syllabus.add_child(module7)
-
-    return complex_syllabus
+    """Load the Digital System Design syllabus from syllabi/digital_system_design.json."""
+    from catalog import load_syllabus
+    return load_syllabus("digital_system_design.json")
 
+def build_complex_tree():
+    """Load the Complex Analysis and Linear Algebra syllabus from syllabi/complex.json."""
+    from catalog import load_syllabus
+    return load_syllabus("complex.json")
 
 def build_math_logic_graph_tree():
-    # Root node: Mathematical Logic and Graph Theory
-    math_logic_graph_syllabus = TreeNode("Mathematical Logic and Graph Theory Syllabus")
-
-    # Module 1: Mathematical Logic
-    module1 = TreeNode("Module 1: Mathematical Logic", 7)
-    
-    statements = TreeNode("Statements and Notation - Connectives, Tautologies, Equivalence")
-    statements.add_resource("Statements, Notation, and Connectives", "https://placeholder.com")
-    statements.add_questions("Statements and Connectives", [
-        "What are the basic connectives in logic?",
-        "Explain the concept of tautologies and equivalence in logical expressions."
-    ])
-    module1.add_child(statements)
-    
-    predicate_calculus = TreeNode("Predicate Calculus - Inference Theory")
-    predicate_calculus.add_resource("Predicate Calculus and Inference Theory", "https://placeholder.com")
-    predicate_calculus.add_questions("Predicate Calculus", [
-        "What is the difference between propositional and predicate calculus?",
-        "Explain the inference theory for predicate calculus."
-    ])
-    module1.add_child(predicate_calculus)
-
-    math_logic_graph_syllabus.add_child(module1)
-
-    # Module 2: Algebraic Structures
-    module2 = TreeNode("Module 2: Algebraic Structures", 6)
-    
-    semigroups = TreeNode("Semigroups and Monoids, Groups and Subgroups")
-    semigroups.add_resource("Semigroups, Monoids, and Groups", "https://placeholder.com")
-    semigroups.add_questions("Semigroups and Groups", [
-        "What are the properties of a semigroup?",
-        "Explain Lagrange's Theorem for groups."
-    ])
-    module2.add_child(semigroups)
-    
-    homomorphism = TreeNode("Homomorphism and Group Codes")
-    homomorphism.add_resource("Homomorphism and Group Codes", "https://placeholder.com")
-    homomorphism.add_questions("Homomorphism", [
-        "What is the concept of homomorphism in group theory?",
-        "Explain group codes in the context of algebraic structures."
-    ])
-    module2.add_child(homomorphism)
-
-    math_logic_graph_syllabus.add_child(module2)
-
-    # Module 3: Counting Techniques
-    module3 = TreeNode("Module 3: Counting Techniques", 6)
-    
-    pigeonhole = TreeNode("Pigeonhole Principle, Permutations, and Combinations")
-    pigeonhole.add_resource("Counting Principles: Pigeonhole, Permutations, and Combinations", "https://placeholder.com")
-    pigeonhole.add_questions("Pigeonhole Principle", [
-        "What is the pigeonhole principle?",
-        "Explain the difference between permutations and combinations."
-    ])
-    module3.add_child(pigeonhole)
-    
-    recurrence_relations = TreeNode("Recurrence Relations and Generating Functions")
-    recurrence_relations.add_resource("Recurrence Relations and Solutions", "https://placeholder.com")
-    recurrence_relations.add_questions("Recurrence Relations", [
-        "How do you solve recurrence relations?",
-        "Explain the use of generating functions in recurrence relations."
-    ])
-    module3.add_child(recurrence_relations)
-
-    math_logic_graph_syllabus.add_child(module3)
-
-    # Module 4: Lattices and Boolean Algebra
-    module4 = TreeNode("Module 4: Lattices and Boolean Algebra", 6)
-    
-    lattices = TreeNode("Lattices as Posets, Hasse Diagram, Properties of Lattices")
-    lattices.add_resource("Lattices and their Properties", "https://placeholder.com")
-    lattices.add_questions("Lattices", [
-        "What are partially ordered relations?"com,
-        "Explain the Hasse diagram and its role in lattice theory."
-    ])
-    module4.add_child(lattices)
-    
-    boolean_algebra = TreeNode("Boolean Algebra and Boolean Functions")
-    boolean_algebra.add_resource("Introduction to Boolean Algebra", "https://placeholder.com")
-    boolean_algebra.add_questions("Boolean Algebra", [
-        "What are the key properties of Boolean algebra?",
-        "How do you simplify Boolean functions?"
-    ])
-    module4.add_child(boolean_algebra)
-
-    math_logic_graph_syllabus.add_child(module4)
-
-    # Module 5: Fundamentals of Graphs
-    module5 = TreeNode("Module 5: Fundamentals of Graphs", 6)
-    
-    graph_basics = TreeNode("Basic Concepts of Graph Theory")
-    graph_basics.add_resource("Introduction to Graph Theory", "https://placeholder.com")
-    graph_basics.add_questions("Graph Basics", [
-        "What are the fundamental concepts in graph theory?",
-        "Explain the difference between a planar and complete graph."
-    ])
-    module5.add_child(graph_basics)
-    
-    graph_algorithms = TreeNode("Graph Isomorphism, Connectivity, Cut sets")
-    graph_algorithms.add_resource("Graph Algorithms and Connectivity", "https://placeholder.com")
-    graph_algorithms.add_questions("Graph Algorithms", [
-        "What is graph isomorphism?",
-        "How do you find the shortest path in a graph?"
-    ])
-    module5.add_child(graph_algorithms)
-
-    math_logic_graph_syllabus.add_child(module5)
-
-    # Module 6: Trees, Fundamental Circuits, Cut Sets
-    module6 = TreeNode("Module 6: Trees, Fundamental Circuits, Cut Sets", 6)
-    
-    tree_properties = TreeNode("Properties of Trees and Spanning Trees")
-    tree_properties.add_resource("Tree Properties and Spanning Trees", "https://placeholder.com")
-    tree_properties.add_questions("Tree Properties", [
-        "What are the properties of trees in graph theory?",
-        "Explain the concept of spanning trees and related algorithms."
-    ])
-    module6.add_child(tree_properties)
-    
-    fundamental_circuits = TreeNode("Fundamental Circuits and Cut-Sets")
-    fundamental_circuits.add_resource("Fundamental Circuits and Cut-Sets in Graphs", "https://placeholder.com")
-    fundamental_circuits.add_questions("Circuits and Cut-Sets", [
-        "What are fundamental circuits in a graph?",
-        "How do cut-sets help in graph connectivity?"
-    ])
-    module6.add_child(fundamental_circuits)
-
-    math_logic_graph_syllabus.add_child(module6)
-
-    # Module 7: Graph Coloring, Covering, Partitioning
-    module7 = TreeNode("Module 7: Graph Coloring, Covering, Partitioning", 6)
-    
-    bipartite_graphs = TreeNode("Bipartite Graphs, Chromatic Number, Chromatic Polynomial")
-    bipartite_graphs.add_resource("Graph Coloring and Chromatic Number", "https://placeholder.com")
-    bipartite_graphs.add_questions("Graph Coloring", [
-        "What is a bipartite graph?",
-        "Explain the concept of the chromatic number and chromatic polynomial."
-    ])
-    module7.add_child(bipartite_graphs)
-    
-    matching_covering = TreeNode("Matching and Covering, Four Colour Problem")
-    matching_covering.add_resource("Matching, Covering and the Four Colour Problem", "https://placeholder.com")
-    matching_covering.add_questions("Matching and Covering", [
-        "What is a matching in graph theory?",
-        "Explain the Four Colour Problem and its significance in graph theory."
-    ])
-    module7.add_child(matching_covering)
-
-    math_logic_graph_syllabus.add_child(module7)
-
-    return math_logic_graph_syllabus
+    """Load the Mathematical Logic and Graph Theory syllabus from syllabi/math_logic_graph.json."""
+    from catalog import load_syllabus
+    return load_syllabus("math_logic_graph.json")
 
 def display_menu(syllabus_list):
     """Display menu to choose and display specific syllabus."""
+    return display_next_module(choose_syllabus(syllabus_list))
+
+def choose_syllabus(syllabus_list):
+    """Print the available syllabi and return the one the learner picks."""
     print("Available Subjects:")
     for idx, syllabus in enumerate(syllabus_list, 1):
         print(f"{idx}. {syllabus.name}")
@@ -670,62 +376,159 @@ def display_menu(syllabus_list):
     while not user_input.isdigit() or int(user_input) not in range(1, len(syllabus_list) + 1):
         user_input = input(f"Invalid input. Please enter a number between 1 and {len(syllabus_list)}: ")
 
-    selected_syllabus = syllabus_list[int(user_input) - 1]
-    display_next_module(selected_syllabus)
+    return syllabus_list[int(user_input) - 1]
 
-def display_next_module(syllabus):
-    """Display the next module in the syllabus and track time."""
-    modules = syllabus.children
-    linked_list = LinkedList()  # Create a linked list to store module times
+def display_next_module(syllabus, timer=None, log=None, learner=None):
+    """Display the next module in the syllabus and track time.
 
-    for module in modules:
+    Returns the SessionTimer holding every module, topic, reading and questions
+    span; its `store` is the LinkedList of module times. With an
+    eventlog.EventLog as `log`, module starts, questions and completions are
+    also appended to the event log.
+    """
+    modules = syllabus.children
+    if timer is None:
+        timer = SessionTimer(LinkedList())  # Module times are stored in a linked list
+    session = log.new_session(syllabus.name, learner) if log is not None else None
+
+    for number, module in enumerate(modules, 1):
+        module_span = timer.start(module.name, "module")
+        if log is not None:
+            log.emit(session, "module_start", module=module.name, number=number)
         print(f"\n--- {module.name} ---")
+        reading_span = timer.start(module.name, "reading")
         for child in module.children:
-            child.display_tree()
+            with timer.span(child.name, "topic"):
+                child.display_tree()
 
-        start_time = time.time()  # Start time for the module
-        start_time_str = time.strftime("%H:%M:%S", time.gmtime(start_time))  # Convert start time to HH:MM:SS
-        print(f"Module started at: {start_time_str}")
+        print(f"Module started at: {format_wall_clock(module_span.wall_start)}")
 
         user_input = input("Do you want to answer questions related to this module? (type 'questions' to answer, 'completed' to move to the next module): ")
         
         while user_input.lower() not in ["questions", "completed"]:
             user_input = input("Invalid input. Type 'questions' to answer, 'completed' to move to the next module: ")
+        timer.stop(reading_span)
 
         if user_input.lower() == "questions":
-            # Generate questions based on the module/topic
-            for child in module.children:
-                if child.name in child.questions_map:
-                    print(f"\nQuestions for {child.name}:")
-                    for question in child.questions_map[child.name]:
-                        print(f"  - {question}")
-            input("\nPress Enter to continue to the next module...")
-
-        end_time = time.time()  # End time for the module
-        end_time_str = time.strftime("%H:%M:%S", time.gmtime(end_time))  # Convert end time to HH:MM:SS
-        print(f"Module ended at: {end_time_str}")
-
-        # Calculate time spent on this module and add to total time
-        module_time = end_time - start_time
-        linked_list.append(module_time)  # Store the module time in the linked list
+            if log is not None:
+                log.emit(session, "questions", module=module.name, number=number)
+            with timer.span(module.name, "questions"):
+                # Generate questions based on the module/topic
+                for child in module.children:
+                    questions = child.get_questions()
+                    if questions:
+                        print(f"\nQuestions for {child.name}:")
+                        for question in questions:
+                            print(f"  - {question}")
+                input("\nPress Enter to continue to the next module...")
+
+        timer.stop(module_span)  # Stores the module time in the timing store
+        if log is not None:
+            log.emit(session, "module_complete", module=module.name, number=number, seconds=module_span.seconds)
+        end_time = module_span.wall_start + module_span.seconds
+        print(f"Module ended at: {format_wall_clock(end_time)}")
+
+    if log is not None:
+        log.emit(session, "session_end", modules=len(modules))
+        log.flush()
 
     # Print the times for all modules and the total time
-    linked_list.print_times()
-
-   
-# Example usage:
-syllabus1 = build_DSA_syllabus_tree()
-syllabus2 = build_complex_tree()
-syllabus3 = build_digital_system_design_tree()
-syllabus4 = build_math_logic_graph_tree()
-
-# Change the name for all four lessons
-syllabus1.name = "Data Structures and Algorithms"
-syllabus2.name = "Complex variables and Linear Algebra"
-syllabus3.name = "Digital System and Design"
-syllabus4.name = "Discrete Mathematics"
-
-syllabus_list = [syllabus1, syllabus2, syllabus3, syllabus4]
-
-# Display the menu
-display_menu(syllabus_list)
+    if timer.store is not None:
+        timer.store.print_times()
+    return timer
+
+
+def build_syllabus_list():
+    """Build all four syllabi with their display names."""
+    syllabus1 = build_DSA_syllabus_tree()
+    syllabus2 = build_complex_tree()
+    syllabus3 = build_digital_system_design_tree()
+    syllabus4 = build_math_logic_graph_tree()
+
+    # Change the name for all four lessons
+    syllabus1.name = "Data Structures and Algorithms"
+    syllabus2.name = "Complex variables and Linear Algebra"
+    syllabus3.name = "Digital System and Design"
+    syllabus4.name = "Discrete Mathematics"
+
+    return [syllabus1, syllabus2, syllabus3, syllabus4]
+
+def draw_tree(root, filename=None, max_depth=None):
+    """Draw a syllabus tree with networkx and matplotlib (imported only when called).
+
+    Meant for interactive viewing; nodes are placed with diagram.TreeLayout
+    rather than a networkx layout. For large trees or files, use
+    diagram.export(root, "tree.svg") instead.
+    """
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
+    from diagram import TreeLayout
+
+    layout = TreeLayout(root, max_depth)
+    graph = nx.DiGraph()
+    positions = {}
+    for i, node in enumerate(layout.nodes):
+        graph.add_node(i)  # Indexes, not names, so topics sharing a name stay separate
+        x, y = layout.position(i)
+        positions[i] = (x, -y)
+        if layout.parent[i] >= 0:
+            graph.add_edge(layout.parent[i], i)
+
+    plt.figure(figsize=(12, 8))
+    nx.draw(graph, pos=positions, labels={i: node.name for i, node in enumerate(layout.nodes)},
+            node_size=30, font_size=6, horizontalalignment="left")
+    if filename:
+        plt.savefig(filename)
+    else:
+        plt.show()
+    plt.close()
+
+def main(argv=None):
+    """Build the syllabi and start the interactive menu.
+
+    With --learner, the session's module times are saved to the progress
+    database (--progress, default progress.db) instead of being discarded.
+    With --events, the session's events are appended to that event log.
+    With --profile, call counts and latencies of tree building and each
+    session step are printed at the end (--metrics also writes them to a
+    file in the Prometheus text format).
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Explore a syllabus module by module.")
+    parser.add_argument("--learner", help="Save this learner's module times and completed modules")
+    parser.add_argument("--progress", default="progress.db", help="Progress database used with --learner")
+    parser.add_argument("--events", help="Append the session's events to this log (e.g. events.ndjson)")
+    parser.add_argument("--profile", action="store_true", help="Print call counts and latencies at the end")
+    parser.add_argument("--metrics", help="Write call counts and latencies to this file (Prometheus text format)")
+    args = parser.parse_args(argv)
+
+    metrics = None
+    if args.profile or args.metrics:
+        import sys
+
+        from instrumentation import Instrumentation, default_targets
+        metrics = Instrumentation(default_targets(sys.modules[__name__])).enable()
+
+    syllabus = choose_syllabus(build_syllabus_list())
+    if args.events:
+        from eventlog import EventLog
+        with EventLog(args.events) as log:
+            timer = display_next_module(syllabus, log=log, learner=args.learner)
+    else:
+        timer = display_next_module(syllabus)
+    if args.learner:
+        from progress import ProgressStore
+        with ProgressStore(args.progress) as store:
+            store.record_session(args.learner, syllabus.name, timer)
+    if metrics is not None:
+        metrics.disable()
+        if args.profile:
+            print("\n" + metrics.format_report())
+        if args.metrics:
+            with open(args.metrics, "w", encoding="utf-8") as f:
+                f.write(metrics.format_prometheus())
+
+if __name__ == "__main__":
+    main()
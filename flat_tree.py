@@ -0,0 +1,120 @@
+"""Frozen, array-backed (struct-of-arrays) copy of a syllabus tree.
+
+Nodes are stored in pre-order, so the subtree of node `i` is the contiguous
+index range `i .. i + subtree_size[i] - 1` and its children are the range
+`child_start[i] .. child_start[i] + child_count[i] - 1` of `child_index`.
+Queries are single linear passes over these arrays instead of walking
+`TreeNode.children` lists.
+"""
+from array import array
+from types import MappingProxyType
+
+from final import TreeNode
+
+NO_HOURS = -1.0  # Stored in `hours` for nodes without a duration
+NO_PARENT = -1   # Stored in `parent` for the root
+_EMPTY_MAP = MappingProxyType({})
+
+
+class FlatTree:
+    """Immutable array-backed snapshot of a TreeNode tree."""
+
+    def __init__(self, root):
+        self.names = []
+        self.hours = array("d")
+        self.parent = array("l")
+        self.depth = array("l")
+        self.resources = []      # Per-node read-only copies of the resource maps (shared empty map if none)
+        self.questions_map = []  # Per-node read-only copies of the question maps, with tuples of questions
+
+        # Pre-order walk with an explicit stack so deep trees don't hit the recursion limit
+        stack = [(root, NO_PARENT, 0)]
+        while stack:
+            node, parent, depth = stack.pop()
+            index = len(self.names)
+            self.names.append(node.name)
+            self.hours.append(NO_HOURS if node.hours is None else float(node.hours))
+            self.parent.append(parent)
+            self.depth.append(depth)
+            # Copied, so later edits to the source tree don't show through
+            self.resources.append(MappingProxyType(dict(node.resources)) if node.resources else _EMPTY_MAP)
+            self.questions_map.append(MappingProxyType({topic: tuple(questions)
+                                                        for topic, questions in node.questions_map.items()})
+                                      if node.questions_map else _EMPTY_MAP)
+            for child in reversed(node.children):
+                stack.append((child, index, depth + 1))
+
+        size = len(self.names)
+        self.subtree_size = array("l", [1]) * size
+        self.child_count = array("l", [0]) * size
+        for i in range(size - 1, 0, -1):
+            p = self.parent[i]
+            self.subtree_size[p] += self.subtree_size[i]
+            self.child_count[p] += 1
+
+        # Group child indices by parent so each node's children are one contiguous slice
+        self.child_start = array("l", [0]) * size
+        offset = 0
+        for i in range(size):
+            self.child_start[i] = offset
+            offset += self.child_count[i]
+        self.child_index = array("l", [0]) * offset
+        filled = array("l", [0]) * size
+        for i in range(1, size):
+            p = self.parent[i]
+            self.child_index[self.child_start[p] + filled[p]] = i
+            filled[p] += 1
+
+    def __len__(self):
+        return len(self.names)
+
+    def children_of(self, index):
+        """Return the indices of the children of node `index`."""
+        start = self.child_start[index]
+        return self.child_index[start:start + self.child_count[index]]
+
+    def subtree_range(self, index):
+        """Return the range of node indices in the subtree rooted at `index`."""
+        return range(index, index + self.subtree_size[index])
+
+    def find(self, name):
+        """Return the index of the first node with this name, or -1."""
+        try:
+            return self.names.index(name)
+        except ValueError:
+            return -1
+
+    def subtree_hours(self):
+        """Return an array with the total hours of every subtree (nodes without hours count as 0)."""
+        totals = array("d", (h if h != NO_HOURS else 0.0 for h in self.hours))
+        for i in range(len(totals) - 1, 0, -1):
+            totals[self.parent[i]] += totals[i]
+        return totals
+
+    def module_hours(self):
+        """Return {module name: total hours} for the children of the root."""
+        totals = self.subtree_hours()
+        return {self.names[i]: totals[i] for i in self.children_of(0)} if len(self) else {}
+
+    def nodes_at_depth(self, depth):
+        """Return the indices of all nodes at the given depth."""
+        return [i for i, d in enumerate(self.depth) if d == depth]
+
+    def to_tree(self, index=0):
+        """Rebuild a TreeNode tree from the subtree rooted at `index`."""
+        nodes = {}
+        for i in self.subtree_range(index):
+            hours = self.hours[i]
+            if hours == NO_HOURS:
+                hours = None
+            elif hours.is_integer():
+                hours = int(hours)
+            node = TreeNode(self.names[i], hours)
+            for key, url in self.resources[i].items():
+                node.add_resource(key, url)
+            for topic, questions in self.questions_map[i].items():
+                node.add_questions(topic, list(questions))
+            nodes[i] = node
+            if i != index:
+                nodes[self.parent[i]].add_child(node)
+        return nodes[index]
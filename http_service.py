@@ -0,0 +1,241 @@
+"""Local HTTP/JSON service for the syllabi.
+
+    python http_service.py --port 8000
+
+Endpoints:
+    GET  /syllabi                          list syllabi (id, name, module count)
+    GET  /syllabi/<id>?path=Module 4: Trees  a syllabus or the subtree at `path`
+    GET  /questions?n=5&syllabus=1&seed=7  random questions (syllabus and seed optional)
+    POST /times   {"learner": "ana", "module_times": [612.5, 480.0], "syllabus": 1}
+                                           record module completion times, returns a summary
+                                           (`syllabus` optional; names the modules when
+                                           times are saved to a progress database)
+    GET  /times/<learner>                  recorded times and summary for a learner
+
+Serialized subtrees are cached and the cache is cleared whenever one of the
+served syllabi is modified through the TreeNode API.
+"""
+import argparse
+import json
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import final
+from catalog import node_to_dict
+from render import find_subtree
+from sampler import QuestionSampler
+
+
+class SyllabusService:
+    """Request handling independent of the HTTP layer: returns (status, JSON-ready body or bytes)."""
+
+    def __init__(self, syllabus_list, progress=None):
+        self.syllabus_list = syllabus_list
+        self.progress = progress      # Optional ProgressStore that also receives recorded times
+        self.learner_times = {}       # Learner -> LinkedList of module times
+        self._cache = {}              # (syllabus id, path) -> serialized JSON bytes
+        self._samplers = {}           # Syllabus id (0 = all) -> shared QuestionSampler
+        self._generation = 0          # Bumped on every tree change; stale serializations aren't cached
+        self._lock = threading.Lock()
+        final.add_observer(self._on_tree_change)
+
+    def close(self):
+        final.remove_observer(self._on_tree_change)
+
+    def _on_tree_change(self, event, node, *args):
+        while node.parent is not None:
+            node = node.parent
+        if not any(node is root for root in self.syllabus_list):
+            return  # Another tree (e.g. one being built): nothing cached from it
+        with self._lock:
+            self._generation += 1
+            self._cache.clear()
+            self._samplers.clear()
+
+    def list_syllabi(self):
+        return 200, [
+            {"id": i, "name": root.name, "modules": len(root.children)}
+            for i, root in enumerate(self.syllabus_list, 1)
+        ]
+
+    def _syllabus(self, syllabus_id):
+        if not 1 <= syllabus_id <= len(self.syllabus_list):
+            return None
+        return self.syllabus_list[syllabus_id - 1]
+
+    def subtree(self, syllabus_id, path=None):
+        """Return the serialized subtree as cached JSON bytes."""
+        key = (syllabus_id, path or "")
+        cached = self._cache.get(key)
+        if cached is not None:
+            return 200, cached
+        generation = self._generation
+        root = self._syllabus(syllabus_id)
+        if root is None:
+            return 404, {"error": f"No syllabus {syllabus_id}"}
+        node = find_subtree(root, path) if path else root
+        if node is None:
+            return 404, {"error": f"No topic at path {path!r} in syllabus {syllabus_id}"}
+        body = json.dumps(node_to_dict(node)).encode()
+        with self._lock:
+            # A tree change while serializing may have left `body` stale; serve it but don't cache it
+            if generation == self._generation:
+                self._cache[key] = body
+        return 200, body
+
+    def questions(self, n, syllabus_id=None, seed=None):
+        if syllabus_id is None:
+            roots = self.syllabus_list
+        else:
+            root = self._syllabus(syllabus_id)
+            if root is None:
+                return 404, {"error": f"No syllabus {syllabus_id}"}
+            roots = [root]
+        if seed is not None:
+            quiz = QuestionSampler(roots, seed=seed).sample(n)
+        else:
+            with self._lock:
+                sampler = self._samplers.get(syllabus_id or 0)
+                if sampler is None:
+                    sampler = self._samplers[syllabus_id or 0] = QuestionSampler(roots)
+                quiz = sampler.sample(n)
+        return 200, [{"topic": topic.name, "question": question} for topic, question in quiz]
+
+    def record_times(self, payload):
+        learner = payload.get("learner")
+        times = payload.get("module_times")
+        if not isinstance(learner, str) or not isinstance(times, list):
+            return 400, {"error": "Expected {\"learner\": str, \"module_times\": [seconds, ...]}"}
+        try:
+            times = [float(seconds) for seconds in times]
+        except (TypeError, ValueError):
+            return 400, {"error": "module_times must be numbers"}
+        if not all(0 <= seconds < math.inf for seconds in times):  # Also false for NaN
+            return 400, {"error": "module_times must be finite and not negative"}
+        with self._lock:
+            linked_list = self.learner_times.setdefault(learner, final.LinkedList())
+            first_number = len(linked_list) + 1
+            for seconds in times:
+                linked_list.append(seconds)
+            summary = linked_list.summary()
+        if self.progress is not None:
+            self._persist_times(learner, payload.get("syllabus"), first_number, times)
+        return 200, {"learner": learner, "summary": summary}
+
+    def _persist_times(self, learner, syllabus_id, first_number, times):
+        root = self._syllabus(syllabus_id) if isinstance(syllabus_id, int) else None
+        syllabus = root.name if root is not None else ""
+        modules = root.children if root is not None else ()
+        for number, seconds in enumerate(times, first_number):
+            if number <= len(modules):
+                module = modules[number - 1].name
+                self.progress.mark_completed(learner, syllabus, module)
+            else:
+                module = f"Module {number}"
+            self.progress.record_module_time(learner, syllabus, module, seconds, number)
+
+    def learner_report(self, learner):
+        linked_list = self.learner_times.get(learner)
+        if linked_list is None:
+            return 404, {"error": f"No times recorded for {learner!r}"}
+        return 200, {"learner": learner, "module_times": list(linked_list), "summary": linked_list.summary()}
+
+
+class SyllabusRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep connections alive between requests
+    disable_nagle_algorithm = True  # Headers and body are written separately; don't delay the body
+    service = None                 # Set on the server's handler subclass
+
+    def log_message(self, format, *args):
+        pass  # Keep the console quiet under load
+
+    def _send(self, status, body):
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        parts = [unquote(part) for part in url.path.split("/") if part]
+        try:
+            if parts == ["syllabi"]:
+                self._send(*self.service.list_syllabi())
+            elif len(parts) == 2 and parts[0] == "syllabi":
+                self._send(*self.service.subtree(int(parts[1]), query.get("path", [None])[0]))
+            elif parts == ["questions"]:
+                syllabus = query.get("syllabus", [None])[0]
+                seed = query.get("seed", [None])[0]
+                self._send(*self.service.questions(
+                    int(query.get("n", ["5"])[0]),
+                    int(syllabus) if syllabus is not None else None,
+                    int(seed) if seed is not None else None,
+                ))
+            elif len(parts) == 2 and parts[0] == "times":
+                self._send(*self.service.learner_report(parts[1]))
+            else:
+                self._send(404, {"error": f"Unknown endpoint {url.path}"})
+        except ValueError as e:
+            self._send(400, {"error": str(e)})
+
+    def do_POST(self):
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True  # The body's extent is unknown, so the connection can't be reused
+            self._send(400, {"error": "Invalid Content-Length"})
+            return
+        body = self.rfile.read(length)
+        if urlsplit(self.path).path.rstrip("/") != "/times":
+            self._send(404, {"error": f"Unknown endpoint {self.path}"})
+            return
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            self._send(400, {"error": "Body must be JSON"})
+            return
+        self._send(*self.service.record_times(payload if isinstance(payload, dict) else {}))
+
+
+def make_server(syllabus_list=None, host="127.0.0.1", port=8000, progress=None):
+    """Create (but don't start) a threaded HTTP server for the syllabi.
+
+    `progress` is an optional ProgressStore that POST /times also writes to.
+    """
+    if syllabus_list is None:
+        syllabus_list = final.build_syllabus_list()
+    handler = type("BoundSyllabusRequestHandler", (SyllabusRequestHandler,),
+                   {"service": SyllabusService(syllabus_list, progress)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve the syllabi as JSON over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--progress", help="Also save recorded times to this progress database")
+    args = parser.parse_args()
+    store = None
+    if args.progress:
+        from progress import ProgressStore
+        store = ProgressStore(args.progress)
+    server = make_server(host=args.host, port=args.port, progress=store)
+    print(f"Serving syllabi on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if store is not None:
+            store.close()
@@ -0,0 +1,139 @@
+"""Name and path index for looking up topics across all syllabi.
+
+    index = TopicIndex(syllabus_list)
+    index.find("binary search trees (bst)")        # every node with that name
+    index.get("Data Structures and Algorithms/Module 4: Trees/Tree Traversals")
+    index.prefix("binary")                          # names starting with "binary"
+
+Names and paths are matched case-insensitively with whitespace collapsed.
+The index registers itself as a TreeNode observer, so children added later
+with `add_child` under an indexed node are indexed immediately, and nodes
+detached with `remove_child` are dropped. Renaming a node after it has been
+indexed is not tracked.
+"""
+import final
+
+PATH_SEPARATOR = "/"
+
+
+def normalize(name):
+    """Normalize a topic name for lookups: case-folded, whitespace collapsed."""
+    return " ".join(name.casefold().split())
+
+
+class NameTrie:
+    """Prefix tree over normalized names."""
+    _END = ""  # Key under which a trie node stores the name ending there
+
+    def __init__(self):
+        self.root = {}
+
+    def insert(self, name):
+        node = self.root
+        for char in name:
+            node = node.setdefault(char, {})
+        node[self._END] = name
+
+    def with_prefix(self, prefix, limit=None):
+        """Return names starting with `prefix` in sorted order (at most `limit`)."""
+        node = self.root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+        names = []
+        stack = [node]
+        while stack and (limit is None or len(names) < limit):
+            node = stack.pop()
+            if self._END in node:
+                names.append(node[self._END])
+            stack.extend(node[char] for char in sorted(node, reverse=True) if char != self._END)
+        return names
+
+
+class TopicIndex:
+    """O(1) exact lookups by name or full path, and prefix lookups via a trie."""
+
+    def __init__(self, roots=()):
+        self.by_name = {}   # Normalized name -> list of nodes with that name
+        self.by_path = {}   # Normalized full path -> node
+        self.paths = {}     # Node -> its full (display) path
+        self.trie = NameTrie()
+        for root in roots:
+            self.add_root(root)
+        final.add_observer(self._on_tree_change)
+
+    def close(self):
+        """Stop tracking tree changes."""
+        final.remove_observer(self._on_tree_change)
+
+    def add_root(self, root):
+        """Index a whole syllabus tree."""
+        self._index_subtree(root, "")
+
+    def _index_subtree(self, node, parent_path):
+        stack = [(node, parent_path)]
+        while stack:
+            node, parent_path = stack.pop()
+            path = f"{parent_path}{PATH_SEPARATOR}{node.name}" if parent_path else node.name
+            key = normalize(node.name)
+            if key not in self.by_name:
+                self.by_name[key] = []
+                self.trie.insert(key)
+            self.by_name[key].append(node)
+            self.by_path[self._path_key(path)] = node
+            self.paths[node] = path
+            for child in node.children:
+                stack.append((child, path))
+
+    def _unindex_subtree(self, node):
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            path = self.paths.pop(node, None)
+            if path is None:
+                continue
+            self.by_path.pop(self._path_key(path), None)
+            key = normalize(node.name)
+            nodes = self.by_name[key]
+            nodes.remove(node)
+            if not nodes:
+                del self.by_name[key]  # The name stays in the trie; prefix() skips it
+            stack.extend(node.children)
+
+    def _on_tree_change(self, event, node, *args):
+        if node not in self.paths:
+            return
+        if event == "child":
+            self._index_subtree(args[0], self.paths[node])
+        elif event == "remove_child":
+            self._unindex_subtree(args[0])
+
+    @staticmethod
+    def _path_key(path):
+        return PATH_SEPARATOR.join(normalize(part) for part in path.split(PATH_SEPARATOR))
+
+    def find(self, name):
+        """Return all nodes with this name (empty list if none)."""
+        return list(self.by_name.get(normalize(name), ()))
+
+    def get(self, path):
+        """Return the node at a full path such as "Course/Module/Topic", or None."""
+        return self.by_path.get(self._path_key(path))
+
+    def path_of(self, node):
+        """Return the full path of an indexed node, or None."""
+        return self.paths.get(node)
+
+    def prefix(self, prefix, limit=None):
+        """Return nodes whose names start with `prefix`, ordered by name."""
+        nodes = []
+        for key in self.trie.with_prefix(normalize(prefix), limit):
+            nodes.extend(self.by_name.get(key, ()))
+        return nodes if limit is None else nodes[:limit]
+
+    def __contains__(self, name):
+        return normalize(name) in self.by_name
+
+    def __len__(self):
+        return len(self.paths)
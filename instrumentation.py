@@ -0,0 +1,218 @@
+"""Call counters and latency histograms for tree building and study sessions.
+
+    metrics = Instrumentation()
+    with metrics:                       # enable() ... disable()
+        syllabus_list = build_syllabus_list()
+        display_next_module(syllabus_list[0])
+    print(metrics.format_report())      # or metrics.format_prometheus()
+
+    metrics.add_hook(lambda operation, seconds: ...)   # called for every timed call
+
+`enable()` replaces the instrumented functions and methods (see
+`default_targets`) with timing wrappers and `disable()` puts the originals
+back, so nothing is measured, and nothing costs anything, while
+instrumentation is off. Each step of a study session (module, reading,
+topic and questions spans of `timing.SessionTimer`) is recorded as
+"session.<kind>".
+"""
+import functools
+import threading
+import time
+from array import array
+from bisect import bisect_left
+
+# Histogram bucket upper bounds in nanoseconds: 1-2.5-5 steps from 1 microsecond to 1000 seconds
+BUCKETS_NS = tuple(int(step * 10 ** exponent) for exponent in range(3, 12) for step in (1, 2.5, 5)) + (10 ** 12,)
+
+
+def default_targets(functions_module=None):
+    """Return (owner, attribute, operation name) for everything instrumented by default.
+
+    `functions_module` holds the build and session functions to wrap; it
+    defaults to `final` (final.py passes its own module when run as a script).
+    """
+    import final
+
+    targets = [(final.TreeNode, name, f"TreeNode.{name}")
+               for name in ("add_child", "add_resource", "add_questions", "display_tree")]
+    targets += [(functions_module or final, name, name) for name in (
+        "build_DSA_syllabus_tree", "build_digital_system_design_tree", "build_complex_tree",
+        "build_math_logic_graph_tree", "build_syllabus_list", "choose_syllabus", "display_next_module")]
+    return targets
+
+
+class Histogram:
+    """Call count, total and bucketed latencies of one operation."""
+    __slots__ = ("counts", "count", "total_ns", "max_ns", "errors")
+
+    def __init__(self):
+        self.counts = array("Q", bytes(8 * (len(BUCKETS_NS) + 1)))  # Last bucket is +Inf
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.errors = 0  # Calls that raised
+
+    def observe(self, ns):
+        self.counts[bisect_left(BUCKETS_NS, ns)] += 1
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def quantile(self, q):
+        """Return the upper bound (in seconds) of the bucket holding quantile q (0-1)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(BUCKETS_NS, self.counts):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.max_ns) / 1e9
+        return self.max_ns / 1e9
+
+
+class Instrumentation:
+    """Collects latencies of instrumented calls while enabled."""
+
+    def __init__(self, targets=None):
+        self.targets = targets  # (owner, attribute, operation name); None means default_targets()
+        self.histograms = {}    # Operation name -> Histogram
+        self.hooks = []         # Callables hook(operation, seconds) run for every timed call
+        self._originals = []    # (owner, attribute, original) while enabled
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook):
+        """Call hook(operation, seconds) after every timed call while enabled."""
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook):
+        self.hooks.remove(hook)
+
+    def _histogram(self, operation):
+        histogram = self.histograms.get(operation)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(operation, Histogram())
+        return histogram
+
+    def record(self, operation, ns, failed=False):
+        """Record one call of `operation` that took `ns` nanoseconds."""
+        histogram = self._histogram(operation)
+        with self._lock:
+            histogram.observe(ns)
+            if failed:
+                histogram.errors += 1
+        if self.hooks:
+            for hook in self.hooks:
+                hook(operation, ns / 1e9)
+
+    def _timed(self, operation, function):
+        lock = self._lock
+        hooks = self.hooks
+        clock = time.perf_counter_ns
+        histogram = self._histogram(operation)  # Looked up once, not on every call
+        observe = histogram.observe
+
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                result = function(*args, **kwargs)
+            except BaseException:
+                self.record(operation, clock() - start, True)
+                raise
+            ns = clock() - start
+            with lock:
+                observe(ns)
+            if hooks:
+                for hook in hooks:
+                    hook(operation, ns / 1e9)
+            return result
+        return timed
+
+    def _timed_stop(self, stop):
+        record = self.record
+
+        @functools.wraps(stop)
+        def timed_stop(timer, span):
+            running = timer._open
+            closing = running[running.index(span):] if span in running else ()  # Stop also ends nested spans
+            result = stop(timer, span)
+            for closed in closing:
+                record(f"session.{closed.kind}", closed.end_ns - closed.start_ns)
+            return result
+        return timed_stop
+
+    @property
+    def enabled(self):
+        return bool(self._originals)
+
+    def enable(self):
+        """Wrap the targets and session timer with timing code."""
+        from timing import SessionTimer
+
+        if self._originals:
+            raise RuntimeError("Instrumentation is already enabled")
+        targets = self.targets if self.targets is not None else default_targets()
+        for owner, attribute, operation in targets:
+            original = vars(owner)[attribute]
+            self._originals.append((owner, attribute, original))
+            setattr(owner, attribute, self._timed(operation, original))
+        stop = vars(SessionTimer)["stop"]
+        self._originals.append((SessionTimer, "stop", stop))
+        SessionTimer.stop = self._timed_stop(stop)
+        return self
+
+    def disable(self):
+        """Restore the original functions and methods."""
+        while self._originals:
+            owner, attribute, original = self._originals.pop()
+            setattr(owner, attribute, original)
+
+    def reset(self):
+        """Forget everything recorded so far."""
+        with self._lock:
+            for histogram in self.histograms.values():
+                histogram.__init__()  # Cleared in place; enabled wrappers keep their histogram
+
+    def __enter__(self):
+        return self.enable()
+
+    def __exit__(self, *exc):
+        self.disable()
+
+    def format_report(self):
+        """Return the recorded operations as a text table, slowest total first."""
+        if not self.histograms:
+            return "No instrumented calls recorded."
+        lines = [f"{'operation':<36} {'calls':>9} {'total s':>10} {'mean us':>10} {'p50 us':>9} "
+                 f"{'p99 us':>9} {'max us':>10} {'errors':>6}"]
+        by_total = sorted(self.histograms.items(), key=lambda item: item[1].total_ns, reverse=True)
+        for operation, h in by_total:
+            if not h.count:
+                continue
+            lines.append(f"{operation:<36} {h.count:>9} {h.total_ns / 1e9:>10.4f} {h.total_ns / h.count / 1e3:>10.2f} "
+                         f"{h.quantile(0.5) * 1e6:>9.1f} {h.quantile(0.99) * 1e6:>9.1f} {h.max_ns / 1e3:>10.1f} "
+                         f"{h.errors:>6}")
+        return "\n".join(lines)
+
+    def format_prometheus(self, prefix="dsa"):
+        """Return the recorded operations in the Prometheus text exposition format."""
+        lines = [f"# HELP {prefix}_call_seconds Latency of instrumented calls and session steps.",
+                 f"# TYPE {prefix}_call_seconds histogram"]
+        for operation, h in sorted(self.histograms.items()):
+            label = operation.replace("\\", "\\\\").replace('"', '\\"')
+            cumulative = 0
+            for bound, n in zip(BUCKETS_NS, h.counts):
+                cumulative += n
+                lines.append(f'{prefix}_call_seconds_bucket{{operation="{label}",le="{bound / 1e9:g}"}} {cumulative}')
+            lines.append(f'{prefix}_call_seconds_bucket{{operation="{label}",le="+Inf"}} {h.count}')
+            lines.append(f'{prefix}_call_seconds_sum{{operation="{label}"}} {h.total_ns / 1e9:.9f}')
+            lines.append(f'{prefix}_call_seconds_count{{operation="{label}"}} {h.count}')
+        lines += [f"# HELP {prefix}_call_errors_total Instrumented calls that raised an exception.",
+                  f"# TYPE {prefix}_call_errors_total counter"]
+        for operation, h in sorted(self.histograms.items()):
+            label = operation.replace("\\", "\\\\").replace('"', '\\"')
+            lines.append(f'{prefix}_call_errors_total{{operation="{label}"}} {h.errors}')
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,230 @@
+"""Audit the resource links of the syllabi.
+
+    python linkcheck.py              # check every link, report problems per module
+    python linkcheck.py --offline    # only report placeholder links
+
+    checker = LinkChecker(max_workers=16)
+    problems = checker.audit(syllabus_list)
+    print(format_report(problems))
+
+Placeholder links (placeholder/example hosts, YouTube links without a valid
+11-character video id such as `youtu.be/xyz123` or `watch?v=QRS678`) are
+reported without any network access. The other links are probed concurrently
+on a thread pool; connections are reused through a pool that allows at most
+`max_per_host` connections to each host, and results are cached for
+`ttl` seconds, so repeated audits only re-probe stale links.
+"""
+import argparse
+import http.client
+import re
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urljoin, urlsplit
+
+PLACEHOLDER_HOSTS = {"placeholder.com", "example.com", "example.org", "example.net", "localhost.invalid"}
+YOUTUBE_HOSTS = {"youtube.com", "m.youtube.com", "youtu.be"}
+YOUTUBE_ID = re.compile(r"[A-Za-z0-9_-]{11}")
+MAX_REDIRECTS = 5
+USER_AGENT = "dsa-project-linkcheck/1.0"
+
+LinkStatus = namedtuple("LinkStatus", "url ok status reason")
+LinkProblem = namedtuple("LinkProblem", "syllabus module topic title url reason")
+
+
+def _host(url):
+    host = (urlsplit(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def placeholder_reason(url):
+    """Return why a URL looks like a placeholder, or None if it looks real."""
+    parts = urlsplit(url)
+    host = _host(url)
+    if parts.scheme not in ("http", "https") or not host:
+        return "not an http(s) URL"
+    if host in PLACEHOLDER_HOSTS:
+        return f"placeholder host {host}"
+    if host == "youtu.be":
+        video_id = parts.path.strip("/")
+    elif host in YOUTUBE_HOSTS and parts.path == "/watch":
+        video_id = parse_qs(parts.query).get("v", [""])[0]
+    else:
+        return None
+    if not YOUTUBE_ID.fullmatch(video_id):
+        return f"invalid YouTube video id {video_id!r}"
+    return None
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections, at most `max_per_host` in use per host at once."""
+
+    def __init__(self, max_per_host=4, timeout=5.0):
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self._idle = {}      # (scheme, host, port) -> idle connections
+        self._slots = {}     # (scheme, host, port) -> semaphore bounding connections in use
+        self._lock = threading.Lock()
+
+    def _key(self, parts):
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        return parts.scheme, parts.hostname, port
+
+    def request(self, method, url):
+        """Send one request and return (status, Location header or None)."""
+        parts = urlsplit(url)
+        key = self._key(parts)
+        with self._lock:
+            slots = self._slots.get(key)
+            if slots is None:
+                slots = self._slots[key] = threading.BoundedSemaphore(self.max_per_host)
+                self._idle[key] = []
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        with slots:
+            with self._lock:
+                connection = self._idle[key].pop() if self._idle[key] else None
+            reused = connection is not None
+            while True:
+                if connection is None:
+                    connection_class = http.client.HTTPSConnection if key[0] == "https" else http.client.HTTPConnection
+                    connection = connection_class(key[1], key[2], timeout=self.timeout)
+                try:
+                    connection.request(method, path, headers={"User-Agent": USER_AGENT})
+                    response = connection.getresponse()
+                    response.read()  # Drain the body so the connection can be reused
+                    break
+                except (OSError, http.client.HTTPException):
+                    connection.close()
+                    if not reused:
+                        raise
+                    connection, reused = None, False  # The server closed an idle connection; retry on a new one
+            if response.will_close:
+                connection.close()
+            else:
+                with self._lock:
+                    self._idle[key].append(connection)
+            return response.status, response.getheader("Location")
+
+    def close(self):
+        with self._lock:
+            for connections in self._idle.values():
+                for connection in connections:
+                    connection.close()
+                connections.clear()
+
+
+class LinkChecker:
+    """Concurrent, cached link probing."""
+
+    def __init__(self, max_workers=16, max_per_host=4, timeout=5.0, ttl=3600.0, clock=time.monotonic):
+        self.max_workers = max_workers
+        self.ttl = ttl                 # Seconds a probe result stays valid
+        self.clock = clock
+        self.pool = ConnectionPool(max_per_host, timeout)
+        self._cache = {}               # URL -> (checked at, LinkStatus)
+        self._lock = threading.Lock()
+
+    def close(self):
+        self.pool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _probe(self, url):
+        target = url
+        try:
+            for _ in range(MAX_REDIRECTS + 1):
+                status, location = self.pool.request("HEAD", target)
+                if status in (405, 501):  # Server doesn't support HEAD
+                    status, location = self.pool.request("GET", target)
+                if status in (301, 302, 303, 307, 308) and location:
+                    target = urljoin(target, location)
+                    continue
+                ok = 200 <= status < 400
+                return LinkStatus(url, ok, status, "ok" if ok else f"HTTP {status}")
+            return LinkStatus(url, False, status, "too many redirects")
+        except (OSError, http.client.HTTPException) as e:
+            return LinkStatus(url, False, None, f"unreachable ({e.__class__.__name__}: {e})")
+
+    def check(self, url):
+        """Return the LinkStatus of one URL, probing it unless a fresh result is cached."""
+        reason = placeholder_reason(url)
+        if reason:
+            return LinkStatus(url, False, None, reason)
+        now = self.clock()
+        with self._lock:
+            cached = self._cache.get(url)
+        if cached is not None and now - cached[0] < self.ttl:
+            return cached[1]
+        status = self._probe(url)
+        with self._lock:
+            self._cache[url] = (self.clock(), status)
+        return status
+
+    def check_many(self, urls):
+        """Check distinct URLs concurrently; returns {url: LinkStatus}."""
+        urls = list(dict.fromkeys(urls))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return dict(zip(urls, executor.map(self.check, urls)))
+
+    def audit(self, roots, offline=False):
+        """Return LinkProblems for every dead or placeholder resource link in the syllabi."""
+        links = list(iter_resources(roots))
+        if offline:
+            statuses = {}
+            for *_, url in links:
+                reason = placeholder_reason(url)
+                if reason:
+                    statuses[url] = LinkStatus(url, False, None, reason)
+        else:
+            statuses = self.check_many(url for *_, url in links)
+        problems = []
+        for root, module, node, title, url in links:
+            status = statuses.get(url)
+            if status is not None and not status.ok:
+                problems.append(LinkProblem(root.name, module.name if module else "", node.name,
+                                            title, url, status.reason))
+        return problems
+
+
+def iter_resources(roots):
+    """Yield (syllabus, module or None, node, title, url) for every resource, in syllabus order."""
+    for root in roots:
+        stack = [(root, None)]
+        while stack:
+            node, module = stack.pop()
+            for title, url in node.resources.items():
+                yield root, module, node, title, url
+            for child in reversed(node.children):
+                stack.append((child, module if module is not None else (child if node is root else None)))
+
+
+def format_report(problems):
+    """Return problems as text grouped by syllabus and module."""
+    if not problems:
+        return "All resource links look fine."
+    lines = []
+    current = None
+    for problem in problems:
+        if (problem.syllabus, problem.module) != current:
+            current = (problem.syllabus, problem.module)
+            lines.append(f"{problem.syllabus} / {problem.module or '(syllabus)'}")
+        lines.append(f"  - {problem.topic}: {problem.title} <{problem.url}>  [{problem.reason}]")
+    lines.append(f"{len(problems)} problem link(s)")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    from final import build_syllabus_list
+
+    parser = argparse.ArgumentParser(description="Report dead and placeholder resource links per module.")
+    parser.add_argument("--offline", action="store_true", help="Only report placeholder links")
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--timeout", type=float, default=5.0)
+    args = parser.parse_args()
+    with LinkChecker(max_workers=args.workers, timeout=args.timeout) as checker:
+        print(format_report(checker.audit(build_syllabus_list(), offline=args.offline)))
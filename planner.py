@@ -0,0 +1,158 @@
+"""Weekly study plans from module hours and measured study times.
+
+    plan = plan_study(syllabus, weekly_hours=10)
+    plan = plan_study(syllabus, 10, measured={"Module 1: Algorithm Analysis": 5400},
+                      completed=store.completed_modules("ana", syllabus.name))
+    print(format_plan(plan))
+
+Each module's hours are shared among its topics (its leaves). Where the
+learner has measured times (seconds, e.g. from `measured_times`) they replace
+the planned hours, and the learner's pace on measured modules scales the
+estimates for the rest. Topics longer than a week are split into week-sized
+parts.
+
+With `ordered=True` (the default) topics keep syllabus order and each week is
+filled greedily, which gives the fewest weeks possible without reordering.
+With `ordered=False` topics are packed first-fit decreasing into weeks, using
+a max-tree of remaining week capacity so each placement costs O(log topics).
+"""
+from collections import namedtuple
+
+PlanItem = namedtuple("PlanItem", "topic module hours")
+Week = namedtuple("Week", "number hours items")
+
+EPSILON = 1e-9  # Tolerance when comparing sums of float hours with the budget
+
+
+def measured_times(store, syllabus):
+    """Return {module name: average seconds} for a syllabus from a ProgressStore."""
+    return {module: seconds for (_, module), (seconds, _) in store.average_time_per_module(syllabus).items()}
+
+
+def estimate_module_hours(root, measured=None, default_hours=1.0):
+    """Return {module node: estimated hours}, adjusted by any measured module times."""
+    measured = measured or {}
+    planned = {module: module.hours if module.hours is not None else default_hours for module in root.children}
+    measured_hours = {module: measured[module.name] / 3600 for module in root.children if module.name in measured}
+    planned_measured = sum(planned[module] for module in measured_hours)
+    pace = sum(measured_hours.values()) / planned_measured if planned_measured else 1.0
+    return {module: measured_hours.get(module, planned[module] * pace) for module in root.children}
+
+
+def _topics(module):
+    """Leaves under a module in syllabus order (the module itself if it has no children)."""
+    leaves = []
+    stack = [module]
+    while stack:
+        node = stack.pop()
+        if node.children:
+            stack.extend(reversed(node.children))
+        else:
+            leaves.append(node)
+    return leaves
+
+
+def study_items(root, measured=None, completed=(), default_hours=1.0, weekly_hours=None):
+    """Return PlanItems in syllabus order, splitting any topic longer than `weekly_hours`."""
+    items = []
+    for module, hours in estimate_module_hours(root, measured, default_hours).items():
+        if module.name in completed:
+            continue
+        topics = _topics(module)
+        share = hours / len(topics)
+        for topic in topics:
+            remaining = share
+            while weekly_hours and remaining > weekly_hours + EPSILON:
+                items.append(PlanItem(topic, module, weekly_hours))
+                remaining -= weekly_hours
+            if remaining > EPSILON:
+                items.append(PlanItem(topic, module, remaining))
+    return items
+
+
+class _CapacityTree:
+    """Max segment tree over week slots' remaining hours, for first-fit lookups."""
+
+    def __init__(self, slots, capacity):
+        self.size = 1
+        while self.size < slots:
+            self.size *= 2
+        self.tree = [capacity] * (2 * self.size)
+
+    def first_fit(self, hours):
+        """Return the first slot with at least `hours` remaining (the caller guarantees one exists)."""
+        tree = self.tree
+        i = 1
+        while i < self.size:
+            i *= 2
+            if tree[i] + EPSILON < hours:
+                i += 1
+        return i - self.size
+
+    def take(self, slot, hours):
+        tree = self.tree
+        i = slot + self.size
+        tree[i] -= hours
+        i //= 2
+        while i:
+            largest = tree[2 * i] if tree[2 * i] > tree[2 * i + 1] else tree[2 * i + 1]
+            if tree[i] == largest:
+                break  # Ancestors already hold the right maximum
+            tree[i] = largest
+            i //= 2
+
+
+def _pack_ordered(items, weekly_hours):
+    weeks = [[]]
+    used = 0.0
+    for item in items:
+        if used + item.hours > weekly_hours + EPSILON and weeks[-1]:
+            weeks.append([])
+            used = 0.0
+        weeks[-1].append(item)
+        used += item.hours
+    return weeks if weeks[0] else []
+
+
+def _pack_first_fit_decreasing(items, weekly_hours):
+    order = sorted(range(len(items)), key=lambda i: items[i].hours, reverse=True)
+    # First fit never leaves two weeks both at most half full, so it needs
+    # fewer than 2 * total / weekly_hours + 1 weeks
+    slot_count = min(len(items), int(2 * sum(item.hours for item in items) / weekly_hours) + 2)
+    capacity = _CapacityTree(slot_count, weekly_hours)
+    slots = [[] for _ in range(slot_count)]
+    for i in order:
+        slot = capacity.first_fit(items[i].hours)
+        capacity.take(slot, items[i].hours)
+        slots[slot].append(i)
+    # Within each week, list topics in syllabus order
+    return [[items[i] for i in sorted(slot)] for slot in slots if slot]
+
+
+def plan_study(root, weekly_hours, measured=None, completed=(), ordered=True, default_hours=1.0):
+    """Schedule a syllabus's remaining topics into weeks of at most `weekly_hours`.
+
+    `measured` maps module names to seconds actually spent, `completed` holds
+    module names to leave out, and modules without hours count as
+    `default_hours`. Returns a list of Week(number, hours, items).
+    """
+    if weekly_hours <= 0:
+        raise ValueError("weekly_hours must be positive")
+    items = study_items(root, measured, completed, default_hours, weekly_hours)
+    pack = _pack_ordered if ordered else _pack_first_fit_decreasing
+    return [Week(number, sum(item.hours for item in week), week)
+            for number, week in enumerate(pack(items, weekly_hours), 1)]
+
+
+def format_plan(plan):
+    """Return a plan as text, one block per week with its topics grouped by module."""
+    lines = []
+    for week in plan:
+        lines.append(f"Week {week.number} ({week.hours:.1f} hours)")
+        module = None
+        for item in week.items:
+            if item.module is not module:
+                module = item.module
+                lines.append(f"  {module.name}")
+            lines.append(f"    - {item.topic.name} ({item.hours:.1f} h)")
+    return "\n".join(lines)
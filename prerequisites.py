@@ -0,0 +1,305 @@
+"""Prerequisite relations between topics, layered over the syllabus trees.
+
+    graph = load_prerequisites(syllabus_list)       # syllabi/dsa_prerequisites.json
+    mst = index.find("Minimum Spanning Tree")[0]
+    graph.prerequisites_of(mst)      # everything needed before it, in study order
+    graph.topological_order()        # every topic, prerequisites first
+    graph.study_order([mst, bst])    # what to study, in order, to reach both
+
+Topics are numbered in syllabus (pre-order) order as they are added. Edges
+are kept in flat arrays and compiled into CSR adjacency (an offsets array
+plus a targets array, in both directions) the first time a query needs
+them. Transitive prerequisites are Python ints used as bitsets, computed on
+demand and memoized, so repeated closure queries cost a few big-int ORs.
+Each bitset is stored shifted down to its lowest topic id, so a closure
+costs memory in proportion to the span of ids it covers rather than to the
+size of the whole catalog.
+"""
+import heapq
+import json
+import os
+from array import array
+
+from catalog import SYLLABUS_DIR
+from index import TopicIndex
+
+
+class PrerequisiteCycleError(ValueError):
+    """Raised when topics depend on each other in a cycle."""
+
+    def __init__(self, cycle):
+        self.cycle = cycle  # Nodes in order, each a prerequisite of the next; the last repeats the first
+        super().__init__("Prerequisite cycle: " + " -> ".join(node.name for node in cycle))
+
+
+def _union(a, b):
+    """Union of two (lowest id, bitset) closures."""
+    if not a[1]:
+        return b
+    if not b[1]:
+        return a
+    low = min(a[0], b[0])
+    return low, (a[1] << (a[0] - low)) | (b[1] << (b[0] - low))
+
+
+def _bit_positions(bits):
+    """Return the indexes of the set bits of a non-negative int, lowest first."""
+    digits = bin(bits)[:1:-1]  # Least significant bit first, without the "0b"
+    positions = []
+    i = digits.find("1")
+    while i != -1:
+        positions.append(i)
+        i = digits.find("1", i + 1)
+    return positions
+
+
+class PrerequisiteGraph:
+    """Directed "topic requires prerequisite" edges between TreeNodes."""
+
+    def __init__(self, roots=()):
+        self.topics = []                        # Topic id -> node
+        self._ids = {}                          # Node -> topic id
+        self._edge_topic = array("I")           # Edge i: _edge_topic[i] requires _edge_prerequisite[i]
+        self._edge_prerequisite = array("I")
+        self._adjacency = None                  # Compiled CSR arrays, rebuilt after changes
+        self._order = None                      # Cached topological order (list of ids)
+        self._rank = None                       # Topic id -> position in that order
+        self._closures = {}                     # Topic id -> (lowest id, bitset) of all its prerequisites
+        for root in roots:
+            self.add_tree(root)
+
+    def __len__(self):
+        return len(self.topics)
+
+    def add_topic(self, node):
+        """Register a node and return its topic id."""
+        topic_id = self._ids.get(node)
+        if topic_id is None:
+            topic_id = self._ids[node] = len(self.topics)
+            self.topics.append(node)
+            self._adjacency = self._order = None
+        return topic_id
+
+    def add_tree(self, root):
+        """Register every node of a syllabus tree, in pre-order."""
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            self.add_topic(node)
+            stack.extend(reversed(node.children))
+
+    def add_prerequisite(self, topic, prerequisite):
+        """Record that `topic` requires `prerequisite` to be studied first."""
+        if topic is prerequisite:
+            raise PrerequisiteCycleError([topic, topic])
+        self._edge_topic.append(self.add_topic(topic))
+        self._edge_prerequisite.append(self.add_topic(prerequisite))
+        self._adjacency = self._order = None
+        self._closures.clear()
+
+    def _compile(self):
+        """Build (offsets, targets) CSR arrays for prerequisites and for dependents."""
+        if self._adjacency is None:
+            n = len(self.topics)
+            self._adjacency = (
+                self._csr(n, self._edge_topic, self._edge_prerequisite),
+                self._csr(n, self._edge_prerequisite, self._edge_topic),
+            )
+        return self._adjacency
+
+    @staticmethod
+    def _csr(n, sources, targets):
+        offsets = array("I", bytes(4 * (n + 1)))
+        for source in sources:
+            offsets[source + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        position = array("I", offsets[:n])
+        ordered = array("I", bytes(4 * len(sources)))
+        for source, target in zip(sources, targets):
+            ordered[position[source]] = target
+            position[source] += 1
+        return offsets, ordered
+
+    def _id(self, topic):
+        topic_id = self._ids.get(topic)
+        if topic_id is None:
+            raise KeyError(f"{topic.name!r} is not in the prerequisite graph")
+        return topic_id
+
+    def direct_prerequisites(self, topic):
+        (offsets, targets), _ = self._compile()
+        i = self._id(topic)
+        return [self.topics[p] for p in targets[offsets[i]:offsets[i + 1]]]
+
+    def direct_dependents(self, topic):
+        _, (offsets, targets) = self._compile()
+        i = self._id(topic)
+        return [self.topics[d] for d in targets[offsets[i]:offsets[i + 1]]]
+
+    def find_cycle(self):
+        """Return a prerequisite cycle as a list of nodes, or None if the graph is acyclic."""
+        (offsets, targets), _ = self._compile()
+        state = bytearray(len(self.topics))  # 0 = unvisited, 1 = on the current path, 2 = done
+        for start in range(len(self.topics)):
+            if state[start]:
+                continue
+            state[start] = 1
+            stack = [[start, offsets[start]]]
+            while stack:
+                frame = stack[-1]
+                v, i = frame
+                if i == offsets[v + 1]:
+                    state[v] = 2
+                    stack.pop()
+                    continue
+                frame[1] += 1
+                p = targets[i]
+                if state[p] == 1:
+                    path = [frame[0] for frame in stack]
+                    cycle = path[path.index(p):] + [p]
+                    # Edges point from a topic to its prerequisite; report prerequisites first
+                    return [self.topics[t] for t in reversed(cycle)]
+                if not state[p]:
+                    state[p] = 1
+                    stack.append([p, offsets[p]])
+        return None
+
+    def topological_order(self):
+        """Return every topic with prerequisites before the topics needing them.
+
+        Among topics that are ready at the same time, syllabus order wins.
+        Raises PrerequisiteCycleError if there is a cycle.
+        """
+        return [self.topics[i] for i in self._topological_ids()]
+
+    def _topological_ids(self):
+        if self._order is None:
+            (offsets, _), (dependent_offsets, dependents) = self._compile()
+            waiting = [offsets[i + 1] - offsets[i] for i in range(len(self.topics))]
+            ready = [i for i, count in enumerate(waiting) if not count]  # Already a valid heap
+            order = []
+            while ready:
+                v = heapq.heappop(ready)
+                order.append(v)
+                for d in dependents[dependent_offsets[v]:dependent_offsets[v + 1]]:
+                    waiting[d] -= 1
+                    if not waiting[d]:
+                        heapq.heappush(ready, d)
+            if len(order) < len(self.topics):
+                raise PrerequisiteCycleError(self.find_cycle())
+            self._order = order
+            self._rank = array("I", bytes(4 * len(order)))
+            for position, topic_id in enumerate(order):
+                self._rank[topic_id] = position
+        return self._order
+
+    def _study_rank(self):
+        self._topological_ids()
+        return self._rank.__getitem__
+
+    def _closure(self, topic_id):
+        """(lowest id, bitset) of every transitive prerequisite of a topic, memoized.
+
+        Bit k of the bitset stands for topic id `lowest id + k`.
+        """
+        closures = self._closures
+        if topic_id in closures:
+            return closures[topic_id]
+        (offsets, targets), _ = self._compile()
+        on_path = {topic_id}
+        stack = [[topic_id, offsets[topic_id]]]
+        while stack:
+            frame = stack[-1]
+            v, i = frame
+            if i < offsets[v + 1]:
+                frame[1] += 1
+                p = targets[i]
+                if p in closures:
+                    continue
+                if p in on_path:
+                    raise PrerequisiteCycleError(self.find_cycle())
+                on_path.add(p)
+                stack.append([p, offsets[p]])
+                continue
+            closure = (v, 0)
+            for p in targets[offsets[v]:offsets[v + 1]]:
+                closure = _union(_union(closure, closures[p]), (p, 1))
+            closures[v] = closure
+            on_path.discard(v)
+            stack.pop()
+        return closures[topic_id]
+
+    def _in_study_order(self, closure):
+        low, bits = closure
+        ids = [low + k for k in _bit_positions(bits)]
+        if len(ids) > 1:
+            ids.sort(key=self._study_rank())
+        return [self.topics[i] for i in ids]
+
+    def requires(self, topic, prerequisite):
+        """True if `prerequisite` must be studied (directly or indirectly) before `topic`."""
+        low, bits = self._closure(self._id(topic))
+        offset = self._id(prerequisite) - low
+        return offset >= 0 and bool(bits >> offset & 1)
+
+    def prerequisites_of(self, topic):
+        """Return every transitive prerequisite of a topic, in study order."""
+        return self._in_study_order(self._closure(self._id(topic)))
+
+    def dependents_of(self, topic):
+        """Return every topic that transitively requires `topic`, in study order."""
+        _, (offsets, targets) = self._compile()
+        seen = set()
+        stack = [self._id(topic)]
+        while stack:
+            v = stack.pop()
+            for d in targets[offsets[v]:offsets[v + 1]]:
+                if d not in seen:
+                    seen.add(d)
+                    stack.append(d)
+        return [self.topics[d] for d in sorted(seen, key=self._study_rank())]
+
+    def study_order(self, topics):
+        """Return the given topics and everything they require, in study order."""
+        closure = (0, 0)
+        for topic in topics:
+            topic_id = self._id(topic)
+            closure = _union(_union(closure, self._closure(topic_id)), (topic_id, 1))
+        return self._in_study_order(closure)
+
+
+def _resolve(index, root, name):
+    nodes = index.find(name)
+    if not nodes:
+        node = index.get(f"{root.name}/{name}")
+        nodes = [node] if node is not None else []
+    if len(nodes) != 1:
+        problem = "not found" if not nodes else "ambiguous; use its path within the syllabus"
+        raise ValueError(f"Topic {name!r} in {root.name!r} is {problem}")
+    return nodes[0]
+
+
+def load_prerequisites(roots, name="dsa_prerequisites.json", graph=None):
+    """Add the prerequisites in a JSON file (under syllabi/ unless a path is given) to a graph.
+
+    The file names a syllabus and maps topic names (or paths below the
+    syllabus root) to lists of prerequisite names.
+    """
+    path = name if os.path.dirname(name) else os.path.join(SYLLABUS_DIR, name)
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    root = next((root for root in roots if root.name == data["syllabus"]), None)
+    if root is None:
+        raise ValueError(f"No syllabus named {data['syllabus']!r} for {path}")
+    if graph is None:
+        graph = PrerequisiteGraph(roots)
+    index = TopicIndex([root])
+    try:
+        for topic, prerequisites in data["prerequisites"].items():
+            node = _resolve(index, root, topic)
+            for prerequisite in prerequisites:
+                graph.add_prerequisite(node, _resolve(index, root, prerequisite))
+    finally:
+        index.close()
+    return graph
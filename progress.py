@@ -0,0 +1,213 @@
+"""Durable learner progress in SQLite.
+
+    store = ProgressStore("progress.db")
+    store.record_session("ana", "Data Structures and Algorithms", timer)
+    store.record_answer("ana", "Data Structures and Algorithms", "Tree Traversals",
+                        "What are the different types of tree traversal?", correct=True)
+    store.flush()
+    store.average_time_per_module("Data Structures and Algorithms")
+
+Writes are queued and applied by a single background thread in batched
+transactions on a WAL-mode database, so callers never wait on disk I/O and
+readers are not blocked by the writer.
+"""
+import queue
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS module_times (
+    learner TEXT NOT NULL,
+    syllabus TEXT NOT NULL,
+    module TEXT NOT NULL,
+    module_number INTEGER,
+    seconds REAL NOT NULL,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS module_times_by_module ON module_times (syllabus, module);
+CREATE INDEX IF NOT EXISTS module_times_by_learner ON module_times (learner);
+
+CREATE TABLE IF NOT EXISTS answers (
+    learner TEXT NOT NULL,
+    syllabus TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    question TEXT NOT NULL,
+    correct INTEGER,
+    answered_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS answers_by_learner ON answers (learner);
+
+CREATE TABLE IF NOT EXISTS completion (
+    learner TEXT NOT NULL,
+    syllabus TEXT NOT NULL,
+    module TEXT NOT NULL,
+    completed INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (learner, syllabus, module)
+);
+CREATE INDEX IF NOT EXISTS completion_by_module ON completion (syllabus, module);
+"""
+
+_STATEMENTS = {
+    "time": "INSERT INTO module_times VALUES (?, ?, ?, ?, ?, ?)",
+    "answer": "INSERT INTO answers VALUES (?, ?, ?, ?, ?, ?)",
+    "completion": "INSERT OR REPLACE INTO completion VALUES (?, ?, ?, ?, ?)",
+}
+_STOP = object()  # Queue sentinel that ends the writer thread
+
+
+def _connect(path):
+    connection = sqlite3.connect(path, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")  # Durable at checkpoints; safe with WAL
+    return connection
+
+
+class ProgressStore:
+    """Per-learner module times, answered questions and completion state."""
+
+    def __init__(self, path="progress.db", batch_size=1000, flush_interval=0.2):
+        self.path = path
+        self.batch_size = batch_size          # Max rows per write transaction
+        self.flush_interval = flush_interval  # Max seconds a queued row waits before being written
+        self._writer = _connect(path)
+        self._writer.executescript(SCHEMA)
+        self._reader = _connect(path)
+        self._reader_lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._error = None                    # First sqlite3.Error behind dropped rows, raised by flush()/close()
+        self._failed_rows = 0
+        self._thread = threading.Thread(target=self._write_loop, name="progress-writer", daemon=True)
+        self._thread.start()
+
+    # --- writes -------------------------------------------------------------
+
+    def record_module_time(self, learner, syllabus, module, seconds, module_number=None):
+        self._queue.put(("time", (learner, syllabus, module, module_number, float(seconds), time.time())))
+
+    def record_answer(self, learner, syllabus, topic, question, correct=None):
+        correct = None if correct is None else int(bool(correct))
+        self._queue.put(("answer", (learner, syllabus, topic, question, correct, time.time())))
+
+    def mark_completed(self, learner, syllabus, module, completed=True):
+        self._queue.put(("completion", (learner, syllabus, module, int(bool(completed)), time.time())))
+
+    def record_session(self, learner, syllabus, timer):
+        """Store every finished module span of a SessionTimer and mark those modules completed."""
+        for number, span in enumerate(timer.spans_of_kind("module"), 1):
+            self.record_module_time(learner, syllabus, span.name, span.seconds, number)
+            self.mark_completed(learner, syllabus, span.name)
+
+    def _write_loop(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    self._queue.put(_STOP)  # Finish this batch, then stop on the next loop
+                    self._queue.task_done()
+                    break
+                batch.append(item)
+
+            try:
+                self._write_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write_batch(self, batch):
+        grouped = {}
+        for kind, row in batch:
+            grouped.setdefault(kind, []).append(row)
+        try:
+            with self._writer:  # One transaction per batch
+                for kind, rows in grouped.items():
+                    self._writer.executemany(_STATEMENTS[kind], rows)
+            return
+        except sqlite3.Error:
+            pass  # Rolled back; find the offending rows one at a time
+        for kind, row in batch:
+            try:
+                with self._writer:
+                    self._writer.execute(_STATEMENTS[kind], row)
+            except sqlite3.Error as e:
+                self._failed_rows += 1
+                if self._error is None:
+                    self._error = e
+
+    def _raise_write_error(self):
+        """Raise (once) the first error that made the writer drop rows since the last check."""
+        error, failed = self._error, self._failed_rows
+        if error is not None:
+            self._error, self._failed_rows = None, 0
+            raise sqlite3.DatabaseError(f"{failed} queued row(s) could not be written: {error}") from error
+
+    def flush(self):
+        """Block until every queued write has been committed or dropped.
+
+        Raises sqlite3.DatabaseError if any rows were dropped because they
+        could not be written (e.g. a NOT NULL column was given None).
+        """
+        self._queue.join()
+        self._raise_write_error()
+
+    def close(self):
+        """Write everything still queued and close the database.
+
+        Raises sqlite3.DatabaseError like flush(), after closing.
+        """
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._writer.close()
+        self._reader.close()
+        self._raise_write_error()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- queries --------------------------------------------------------------
+
+    def _query(self, sql, params=()):
+        with self._reader_lock:
+            return self._reader.execute(sql, params).fetchall()
+
+    def average_time_per_module(self, syllabus=None):
+        """Return {(syllabus, module): (average seconds, number of learners)} across all learners."""
+        sql = ("SELECT syllabus, module, AVG(seconds), COUNT(DISTINCT learner) FROM module_times"
+               + (" WHERE syllabus = ?" if syllabus is not None else "")
+               + " GROUP BY syllabus, module")
+        rows = self._query(sql, (syllabus,) if syllabus is not None else ())
+        return {(s, m): (average, learners) for s, m, average, learners in rows}
+
+    def learner_times(self, learner, syllabus=None):
+        """Return [(syllabus, module, module number, seconds)] for a learner, oldest first."""
+        sql = ("SELECT syllabus, module, module_number, seconds FROM module_times WHERE learner = ?"
+               + (" AND syllabus = ?" if syllabus is not None else "")
+               + " ORDER BY recorded_at")
+        return self._query(sql, (learner, syllabus) if syllabus is not None else (learner,))
+
+    def completed_modules(self, learner, syllabus):
+        """Return the names of modules a learner has completed in a syllabus."""
+        rows = self._query("SELECT module FROM completion WHERE learner = ? AND syllabus = ? AND completed = 1",
+                           (learner, syllabus))
+        return {module for (module,) in rows}
+
+    def answer_accuracy(self, learner):
+        """Return (answered, correct) counts for a learner's graded answers."""
+        answered, correct = self._query(
+            "SELECT COUNT(correct), COALESCE(SUM(correct), 0) FROM answers WHERE learner = ?", (learner,)
+        )[0]
+        return answered, correct
@@ -0,0 +1,155 @@
+"""Question bank keyed by node, with a global question-id table.
+
+Every question in every syllabus gets an integer id. Retrieval goes through
+the node that owns the questions, so it never depends on the free-text
+topic key passed to `add_questions`:
+
+    bank = QuestionBank(syllabus_list)
+    bank.questions_for(node)     # texts, in order
+    bank.ids_for(node)           # their ids
+    bank.text(question_id)       # text of one id
+    bank.node_of(question_id)    # node that owns it
+
+`find_orphaned_questions` reports topic keys that do not match the name of
+the node they are stored on, which the original name-based lookup missed.
+
+The bank exists for what the per-node dicts can't do: stable integer ids,
+id -> text and id -> owning node lookups (used by the review scheduler).
+It is not a faster way to read a node's questions. `node.get_questions()`
+reads the node's own dict and is about 4x faster than `questions_for`
+(about 25 vs 100 ms for 360k questions in the question_retrieval
+benchmark), so display_next_module keeps using it.
+
+Ids are never reused, so anything keyed by them (such as review cards)
+can't be handed an unrelated question. Ids of replaced or removed
+questions are retired: their text and owner are released, `text` and
+`node_of` raise KeyError for them, and callbacks registered with
+`add_observer` are told about them:
+
+    bank.add_observer(reviews.drop_questions)   # forget cards of removed questions
+"""
+import final
+
+
+class QuestionBank:
+    """Global table of questions with per-node id ranges."""
+
+    def __init__(self, roots=()):
+        self.texts = []        # Question id -> text (None while retired)
+        self.owners = []       # Question id -> owning TreeNode (None while retired)
+        self.retired = 0       # Number of retired ids
+        self._observers = []   # Callbacks called with each batch of retired ids
+        self._node_ids = {}    # TreeNode -> {topic key: range of question ids}
+        for root in roots:
+            self.add_tree(root)
+        final.add_observer(self._on_tree_change)
+
+    def close(self):
+        """Stop tracking tree changes."""
+        final.remove_observer(self._on_tree_change)
+
+    def add_observer(self, callback):
+        """Call `callback(question_ids)` whenever questions are removed or replaced."""
+        self._observers.append(callback)
+
+    def remove_observer(self, callback):
+        self._observers.remove(callback)
+
+    def __len__(self):
+        return len(self.texts) - self.retired
+
+    def add_tree(self, root):
+        """Register every question in a tree."""
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            self._node_ids[node] = {}
+            for topic, questions in node.questions_map.items():
+                self._set_questions(node, topic, questions)
+            stack.extend(node.children)
+
+    def _set_questions(self, node, topic, questions):
+        topics = self._node_ids[node]
+        if topic in topics:
+            self._retire(topics.pop(topic))  # Questions replaced under the same key
+        ids = range(len(self.texts), len(self.texts) + len(questions))  # Contiguous, read by slicing
+        self.texts.extend(questions)
+        self.owners.extend([node] * len(questions))
+        topics[topic] = ids
+
+    def _retire(self, ids):
+        for question_id in ids:
+            self.texts[question_id] = self.owners[question_id] = None  # Don't keep removed nodes alive
+        self.retired += len(ids)
+        for callback in self._observers:
+            callback(ids)
+
+    def _on_tree_change(self, event, node, *args):
+        if node not in self._node_ids:
+            return
+        if event == "child":
+            self.add_tree(args[0])
+        elif event == "questions":
+            self._set_questions(node, args[0], args[1])
+        elif event == "remove_questions":
+            ids = self._node_ids[node].pop(args[0], None)
+            if ids is not None:
+                self._retire(ids)
+        elif event == "remove_child":
+            stack = [args[0]]
+            while stack:
+                removed = stack.pop()
+                for ids in self._node_ids.pop(removed, {}).values():
+                    self._retire(ids)
+                stack.extend(removed.children)
+
+    def ids_for(self, node):
+        """Return the ids of all questions stored on a node."""
+        topics = self._node_ids.get(node)
+        if not topics:
+            return []
+        return [question_id for ids in topics.values() for question_id in ids]
+
+    def questions_for(self, node):
+        """Return the texts of all questions stored on a node."""
+        topics = self._node_ids.get(node)
+        if not topics:
+            return []
+        texts = self.texts
+        if len(topics) == 1:
+            for ids in topics.values():
+                return texts[ids.start:ids.stop]
+        return [texts[i] for ids in topics.values() for i in ids]
+
+    def text(self, question_id):
+        if self.owners[question_id] is None:
+            raise KeyError(f"Question {question_id} has been removed")
+        return self.texts[question_id]
+
+    def node_of(self, question_id):
+        node = self.owners[question_id]
+        if node is None:
+            raise KeyError(f"Question {question_id} has been removed")
+        return node
+
+    def module_questions(self, module):
+        """Return {topic node: [question ids]} for the direct children of a module."""
+        return {child: self.ids_for(child) for child in module.children if self.ids_for(child)}
+
+
+def find_orphaned_questions(roots):
+    """Return (node path, topic key) pairs whose key does not match the node's name.
+
+    Such questions were unreachable through `questions_map[node.name]` lookups.
+    """
+    orphans = []
+    for root in roots:
+        stack = [(root, root.name)]
+        while stack:
+            node, path = stack.pop()
+            for topic in node.questions_map:
+                if topic != node.name:
+                    orphans.append((path, topic))
+            for child in node.children:
+                stack.append((child, f"{path}/{child.name}"))
+    return orphans
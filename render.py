@@ -0,0 +1,121 @@
+"""Iterative, buffered text rendering of syllabus trees.
+
+Produces the same layout as the original recursive `TreeNode.display_tree`
+but walks the tree with an explicit stack (no recursion limit) and collects
+lines into chunks that are written with one `write` call each.
+"""
+import sys
+
+FLUSH_CHARS = 64 * 1024  # Buffered characters before a chunk is written out
+
+
+def find_subtree(root, path):
+    """Return the node at a path of child names below `root`, or None.
+
+    `path` is a list of names or a "/"-separated string. In a string, each
+    step matches the longest child name the rest of the path starts with, so
+    names containing "/" (such as "Up/Down Counters") can still be reached.
+    The root's own name may be given as the first segment.
+    """
+    if not isinstance(path, str):
+        parts = list(path)
+        if parts and parts[0] == root.name:
+            parts = parts[1:]
+        node = root
+        for part in parts:
+            for child in node.children:
+                if child.name == part:
+                    node = child
+                    break
+            else:
+                return None
+        return node
+
+    rest = path.strip("/")
+    if rest == root.name or rest.startswith(root.name + "/"):
+        rest = rest[len(root.name):].lstrip("/")
+    node = root
+    while rest:
+        match = None
+        for child in node.children:
+            name = child.name
+            if (rest == name or rest.startswith(name + "/")) and (match is None or len(name) > len(match.name)):
+                match = child
+        if match is None:
+            return None
+        node = match
+        rest = rest[len(match.name):].lstrip("/")
+    return node
+
+
+def _line_chunks(root, level, max_depth):
+    """Yield the display lines of a tree in lists of about FLUSH_CHARS characters.
+
+    Yielding per chunk rather than per line keeps generator overhead out of
+    the per-node loop.
+    """
+    chunk = []
+    size = 0
+    indents = []  # Depth -> indent string, built once per depth
+    stack = [(root, 0)]
+    while stack:
+        node, depth = stack.pop()
+        while len(indents) <= level + depth:
+            indents.append("  " * len(indents))
+        indent = indents[level + depth]
+        line = f"{indent}- {node.name} ({node.hours} hours)" if node.hours else f"{indent}- {node.name}"
+        chunk.append(line)
+        size += len(line)
+        if node.resources:
+            for key, url in node.resources.items():
+                line = f"{indent}    {key}: {url}"
+                chunk.append(line)
+                size += len(line)
+        if node.children and (max_depth is None or depth < max_depth):
+            stack.extend([(child, depth + 1) for child in reversed(node.children)])
+        if size >= FLUSH_CHARS:
+            yield chunk
+            chunk = []
+            size = 0
+    if chunk:
+        yield chunk
+
+
+def iter_tree_lines(root, level=0, max_depth=None):
+    """Yield the display lines of a tree (without newlines), depth-first.
+
+    `max_depth` limits how many levels below `root` are shown (0 = root only).
+    """
+    for chunk in _line_chunks(root, level, max_depth):
+        yield from chunk
+
+
+def render_tree(root, out=None, level=0, max_depth=None, path=None):
+    """Write a tree (or the subtree at `path`) to any object with a `write` method.
+
+    Defaults to sys.stdout. To render to a socket, pass `sock.makefile("w")`.
+    Returns the number of lines written.
+    """
+    if out is None:
+        out = sys.stdout
+    if path is not None:
+        node = find_subtree(root, path)
+        if node is None:
+            raise KeyError(f"No topic at path {path!r}")
+        root = node
+
+    lines = 0
+    for chunk in _line_chunks(root, level, max_depth):
+        lines += len(chunk)
+        chunk.append("")  # Trailing newline
+        out.write("\n".join(chunk))
+    return lines
+
+
+def render_to_string(root, **options):
+    """Render a tree to a string (same options as render_tree)."""
+    import io
+
+    buffer = io.StringIO()
+    render_tree(root, buffer, **options)
+    return buffer.getvalue()
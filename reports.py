@@ -0,0 +1,175 @@
+"""Batch reports of module times and completion across all learners.
+
+    python reports.py progress.db --csv modules.csv --json modules.json --workers 4
+
+    rows = build_report("progress.db", workers=4)
+    write_csv(rows, "modules.csv")
+
+Reads the database written by `progress.ProgressStore`. Every
+(syllabus, module) pair is a shard; shards are spread over a
+ProcessPoolExecutor whose workers each open their own read-only connection,
+fetch their modules' times through the (syllabus, module) index and compute
+the time distribution (mean, spread, percentiles, histogram) and completion
+rate. Only the small per-module summaries travel back to the parent.
+"""
+import argparse
+import csv
+import json
+import math
+import os
+import sqlite3
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+
+CSV_FIELDS = ["syllabus", "module", "module_number", "learners", "sessions", "completed", "completion_rate",
+              "mean", "stdev", "min", "p25", "p50", "p75", "p90", "max"]
+HISTOGRAM_BINS = 10
+
+_connection = None  # Per-worker read-only database connection
+
+
+def percentile(ordered, percent):
+    """Percentile (0-100) of already sorted values, interpolating between ranks like LinkedList.percentile."""
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * percent / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize_times(times):
+    """Return the distribution of a list of times in seconds, with an equal-width histogram."""
+    ordered = sorted(times)
+    count = len(ordered)
+    if not count:
+        return {"sessions": 0, "mean": 0.0, "stdev": 0.0, "min": 0.0, "p25": 0.0, "p50": 0.0,
+                "p75": 0.0, "p90": 0.0, "max": 0.0, "histogram": []}
+    mean = math.fsum(ordered) / count
+    variance = math.fsum((t - mean) ** 2 for t in ordered) / count
+    low, high = ordered[0], ordered[-1]
+    width = (high - low) / HISTOGRAM_BINS or 1.0
+    edges = [bisect_left(ordered, low + i * width) for i in range(1, HISTOGRAM_BINS)]  # Values are sorted
+    histogram = [b - a for a, b in zip([0] + edges, edges + [count])]
+    return {
+        "sessions": count,
+        "mean": mean,
+        "stdev": math.sqrt(variance),
+        "min": low,
+        "p25": percentile(ordered, 25),
+        "p50": percentile(ordered, 50),
+        "p75": percentile(ordered, 75),
+        "p90": percentile(ordered, 90),
+        "max": high,
+        "histogram": [{"from": low + i * width, "to": low + (i + 1) * width, "sessions": n}
+                      for i, n in enumerate(histogram)],
+    }
+
+
+def _connect(path):
+    return sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+
+
+def _open_worker(path):
+    global _connection
+    _connection = _connect(path)
+
+
+def _report_shard(shard):
+    """Summarize one (syllabus, module) shard; runs in a worker process."""
+    syllabus, module = shard
+    rows = _connection.execute(
+        "SELECT learner, seconds, module_number FROM module_times WHERE syllabus = ? AND module = ?",
+        (syllabus, module)).fetchall()
+    completed = _connection.execute(
+        "SELECT COUNT(*) FROM completion WHERE syllabus = ? AND module = ? AND completed = 1", (syllabus, module)
+    ).fetchone()[0]
+    numbers = [number for _, _, number in rows if number is not None]
+    row = {
+        "syllabus": syllabus,
+        "module": module,
+        "module_number": min(numbers) if numbers else None,
+        "learners": len({learner for learner, _, _ in rows}),
+        "completed": completed,
+    }
+    row.update(summarize_times([seconds for _, seconds, _ in rows]))
+    return row
+
+
+def _count_enrolled(syllabus):
+    """Number of learners with any time or completion recorded in a syllabus; runs in a worker process."""
+    return _connection.execute("""
+        SELECT COUNT(*) FROM (SELECT learner FROM module_times WHERE syllabus = ?
+                              UNION SELECT learner FROM completion WHERE syllabus = ?)""",
+                               (syllabus, syllabus)).fetchone()[0]
+
+
+def list_shards(path):
+    """Return the (syllabus, module) pairs that have times or completion recorded."""
+    connection = _connect(path)
+    try:
+        shards = set(connection.execute("SELECT DISTINCT syllabus, module FROM module_times"))
+        shards.update(connection.execute("SELECT DISTINCT syllabus, module FROM completion"))
+    finally:
+        connection.close()
+    return sorted(shards)
+
+
+def build_report(path, workers=None, chunksize=4):
+    """Return one summary row per module, computed on `workers` processes (default: one per core).
+
+    Rows are ordered by syllabus and module number. With workers=1 the shards
+    are processed in this process.
+    """
+    shards = list_shards(path)
+    syllabi = sorted({syllabus for syllabus, _ in shards})
+    if workers == 1:
+        _open_worker(path)
+        try:
+            rows = [_report_shard(shard) for shard in shards]
+            enrolled = dict(zip(syllabi, map(_count_enrolled, syllabi)))
+        finally:
+            _connection.close()
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_open_worker, initargs=(path,)) as executor:
+            counts = executor.map(_count_enrolled, syllabi)  # Runs alongside the shards
+            rows = list(executor.map(_report_shard, shards, chunksize=chunksize))
+            enrolled = dict(zip(syllabi, counts))
+    for row in rows:
+        learners = enrolled[row["syllabus"]]
+        row["completion_rate"] = row["completed"] / learners if learners else 0.0
+    rows.sort(key=lambda row: (row["syllabus"], math.inf if row["module_number"] is None else row["module_number"],
+                               row["module"]))
+    return rows
+
+
+def write_csv(rows, path):
+    """Write report rows (without histograms) as CSV."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_json(rows, path):
+    """Write report rows, including histograms, as JSON."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(rows, f, ensure_ascii=False, indent=1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-module time and completion report for all learners.")
+    parser.add_argument("database", help="Progress database written by ProgressStore")
+    parser.add_argument("--csv", help="Write the report as CSV")
+    parser.add_argument("--json", help="Write the report (with histograms) as JSON")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes")
+    args = parser.parse_args()
+    report = build_report(args.database, args.workers)
+    if args.csv:
+        write_csv(report, args.csv)
+    if args.json:
+        write_json(report, args.json)
+    if not args.csv and not args.json:
+        for row in report:
+            print(f"{row['syllabus']} / {row['module']}: {row['sessions']} sessions, "
+                  f"median {row['p50']:.0f} s, p90 {row['p90']:.0f} s, {row['completion_rate']:.0%} completed")
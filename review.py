@@ -0,0 +1,188 @@
+"""Spaced-repetition reviews of syllabus questions (SM-2).
+
+    bank = QuestionBank(syllabus_list)
+    reviews = ReviewScheduler()
+    reviews.enroll("ana", bank.ids_for(topic))      # new cards, due now
+    for question_id in reviews.due("ana", 10):      # up to 10 cards due now
+        reviews.review("ana", question_id, quality=4)  # 0 (blackout) .. 5 (perfect)
+    run_review(reviews, bank, "ana")                # the same, interactively
+    bank.add_observer(reviews.drop_questions)       # forget cards of removed questions
+
+A card is one learner/question pair. Its ease, interval, repetition count and
+due time live in parallel arrays indexed by card id (22 bytes per card), and
+each learner has a min-heap of its cards' due times. Rescheduling pushes a new
+heap entry and leaves the old one to be skipped when it surfaces, so a review
+and each of the next due cards cost O(log cards).
+"""
+import heapq
+import time
+from array import array
+from collections import namedtuple
+
+DAY = 86400                # Seconds
+INITIAL_EASE = 2.5
+MINIMUM_EASE = 1.3
+MAXIMUM_INTERVAL = 36500   # Days; keeps long-mastered cards from growing without bound
+_CARD_BITS = 32            # Heap entries are due time << _CARD_BITS | card id
+_CARD_MASK = (1 << _CARD_BITS) - 1
+
+Card = namedtuple("Card", "question_id ease interval repetitions due")
+
+
+def sm2(quality, ease, interval, repetitions):
+    """Return the next (ease, interval in days, repetitions) after a review graded 0-5."""
+    if not 0 <= quality <= 5:
+        raise ValueError("quality must be between 0 and 5")
+    ease = max(MINIMUM_EASE, ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    if quality < 3:
+        return ease, 1.0, 0  # Forgotten: start the card over
+    repetitions += 1
+    if repetitions == 1:
+        interval = 1.0
+    elif repetitions == 2:
+        interval = 6.0
+    else:
+        interval = min(round(interval * ease), MAXIMUM_INTERVAL)
+    return ease, interval, repetitions
+
+
+class ReviewScheduler:
+    """SM-2 cards for many learners with a per-learner due queue."""
+
+    def __init__(self):
+        self.learners = {}              # Learner name -> learner id
+        self._cards = {}                # learner id << 32 | question id -> card id
+        self._queues = []               # Learner id -> heap of due << 32 | card id (may hold stale entries)
+        self._live = []                 # Learner id -> number of cards (live heap entries)
+        self.question = array("I")      # Card id -> question id
+        self.ease = array("f")          # Card id -> ease factor
+        self.interval = array("f")      # Card id -> current interval in days
+        self.repetitions = array("H")   # Card id -> successful reviews in a row
+        self.due_at = array("q")        # Card id -> due time (whole seconds since the epoch)
+
+    def __len__(self):
+        return len(self._cards)
+
+    def _learner(self, learner):
+        learner_id = self.learners.get(learner)
+        if learner_id is None:
+            learner_id = self.learners[learner] = len(self._queues)
+            self._queues.append([])
+            self._live.append(0)
+        return learner_id
+
+    def _card(self, learner, question_id):
+        learner_id = self.learners.get(learner)
+        card = None if learner_id is None else self._cards.get(learner_id << 32 | question_id)
+        if card is None:
+            raise KeyError(f"{learner!r} has no card for question {question_id}")
+        return learner_id, card
+
+    def enroll(self, learner, question_ids, now=None):
+        """Add cards for questions the learner doesn't have yet, due immediately."""
+        learner_id = self._learner(learner)
+        due = int(time.time() if now is None else now)
+        queue = self._queues[learner_id]
+        added = 0
+        for question_id in question_ids:
+            key = learner_id << 32 | question_id
+            if key in self._cards:
+                continue
+            card = self._cards[key] = len(self.question)
+            self.question.append(question_id)
+            self.ease.append(INITIAL_EASE)
+            self.interval.append(0.0)
+            self.repetitions.append(0)
+            self.due_at.append(due)
+            queue.append(due << _CARD_BITS | card)
+            added += 1
+        if added:
+            heapq.heapify(queue)
+            self._live[learner_id] += added
+        return added
+
+    def review(self, learner, question_id, quality, now=None):
+        """Grade a review (0-5) and reschedule the card; returns its next due time."""
+        learner_id, card = self._card(learner, question_id)
+        ease, interval, repetitions = sm2(quality, self.ease[card], self.interval[card], self.repetitions[card])
+        due = int((time.time() if now is None else now) + interval * DAY)
+        rescheduled = due != self.due_at[card]
+        if rescheduled:
+            self.due_at[card] = due  # First, so a due time that can't be stored leaves the card untouched
+        self.ease[card] = ease
+        self.interval[card] = interval
+        self.repetitions[card] = min(repetitions, 0xFFFF)
+        if not rescheduled:
+            return due  # The card's heap entry is still live; pushing another would list it twice
+        queue = self._queues[learner_id]
+        heapq.heappush(queue, due << _CARD_BITS | card)  # The card's old entry is now stale
+        if len(queue) > 2 * self._live[learner_id] + 64:
+            self._compact(learner_id)
+        return due
+
+    def _compact(self, learner_id):
+        """Drop stale and duplicate heap entries once they outnumber the live ones."""
+        due_at = self.due_at
+        queue = list({entry for entry in self._queues[learner_id]
+                      if due_at[entry & _CARD_MASK] == entry >> _CARD_BITS})
+        heapq.heapify(queue)
+        self._queues[learner_id] = queue
+
+    def due(self, learner, n=10, now=None):
+        """Return up to n question ids due for review by `now`, most overdue first."""
+        learner_id = self.learners.get(learner)
+        if learner_id is None:
+            return []
+        limit = int(time.time() if now is None else now)
+        queue = self._queues[learner_id]
+        due_at = self.due_at
+        taken = []
+        while queue and len(taken) < n and queue[0] >> _CARD_BITS <= limit:
+            entry = heapq.heappop(queue)
+            # Stale entries are simply dropped, and so are copies of one just taken: a card
+            # rescheduled away and back to the same second has two identical, adjacent entries
+            if due_at[entry & _CARD_MASK] == entry >> _CARD_BITS and (not taken or taken[-1] != entry):
+                taken.append(entry)
+        for entry in taken:
+            heapq.heappush(queue, entry)  # Peeking doesn't change what is due
+        return [self.question[entry & _CARD_MASK] for entry in taken]
+
+    def drop_questions(self, question_ids):
+        """Forget every learner's card for these questions (e.g. ids retired by a QuestionBank).
+
+        A dropped card's slot in the arrays isn't reused; its due time is set
+        to -1 so its heap entries are stale.
+        """
+        question_ids = set(question_ids)
+        if len(question_ids) * len(self._queues) <= len(self._cards):
+            keys = [learner_id << 32 | question_id
+                    for learner_id in range(len(self._queues)) for question_id in question_ids]
+        else:  # Cheaper to scan the cards once
+            keys = [key for key in self._cards if (key & _CARD_MASK) in question_ids]
+        for key in keys:
+            card = self._cards.pop(key, None)
+            if card is not None:
+                self.due_at[card] = -1
+                self._live[key >> 32] -= 1
+
+    def card(self, learner, question_id):
+        """Return a learner's Card for a question."""
+        _, card = self._card(learner, question_id)
+        return Card(question_id, self.ease[card], self.interval[card], self.repetitions[card], self.due_at[card])
+
+
+def run_review(scheduler, bank, learner, n=10):
+    """Ask a learner's due questions on the console and grade each answer 0-5."""
+    due = scheduler.due(learner, n)
+    due = [question_id for question_id in due if bank.owners[question_id] is not None]  # Skip removed questions
+    if not due:
+        print("Nothing to review right now.")
+        return 0
+    for i, question_id in enumerate(due, 1):
+        print(f"\n{i}. {bank.text(question_id)}  ({bank.node_of(question_id).name})")
+        grade = input("Answer it, then grade your recall (0 = not at all, 5 = perfectly): ").strip()
+        while grade not in ("0", "1", "2", "3", "4", "5"):
+            grade = input("Please enter a number between 0 and 5: ").strip()
+        due_time = scheduler.review(learner, question_id, int(grade))
+        print(f"Next review: {time.strftime('%Y-%m-%d', time.localtime(due_time))}")
+    return len(due)
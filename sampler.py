@@ -0,0 +1,225 @@
+"""Weighted, stratified random question sampling over syllabus trees.
+
+Each topic that has questions gets a weight (by default its module's hours
+shared among the module's topics). Weights live in a Fenwick tree, so a draw
+and a weight update both cost O(log topics) and a quiz of k questions costs
+O(k log topics), however many questions the bank holds.
+
+    sampler = QuestionSampler(syllabus_list, seed=42)
+    quiz = sampler.sample(5)                 # [(topic node, question), ...]
+    quiz = sampler.sample_stratified(7)      # spread across modules by weight
+    sampler.record_answer(topic, correct=False)  # draw that topic more often
+"""
+import random
+
+
+class FenwickTree:
+    """Binary indexed tree of non-negative weights with prefix-sum search."""
+
+    def __init__(self, weights):
+        self.size = len(weights)
+        self.tree = [0.0] * (self.size + 1)
+        self.weights = [0.0] * self.size
+        for i, weight in enumerate(weights):
+            self.add(i, weight)
+
+    def add(self, index, delta):
+        """Add `delta` to the weight at `index`."""
+        self.weights[index] += delta
+        i = index + 1
+        while i <= self.size:
+            self.tree[i] += delta
+            i += i & -i
+
+    def set(self, index, weight):
+        self.add(index, weight - self.weights[index])
+
+    def prefix_sum(self, end):
+        """Return the sum of weights[0:end]."""
+        total = 0.0
+        while end > 0:
+            total += self.tree[end]
+            end -= end & -end
+        return total
+
+    def total(self):
+        return self.prefix_sum(self.size)
+
+    def find(self, value):
+        """Return the smallest index whose prefix sum (inclusive) exceeds `value`."""
+        index = 0
+        step = 1 << self.size.bit_length()
+        while step:
+            nxt = index + step
+            if nxt <= self.size and self.tree[nxt] <= value:
+                index = nxt
+                value -= self.tree[nxt]
+            step >>= 1
+        return min(index, self.size - 1)
+
+
+class QuestionSampler:
+    """Draw quiz questions with topic weights, module strata and wrong-answer boosting."""
+
+    def __init__(self, roots, seed=None, weight=None, wrong_boost=2.0, max_boost=8.0):
+        self.rng = random.Random(seed)
+        self.wrong_boost = wrong_boost  # Weight multiplier each time a topic is answered wrongly
+        self.max_boost = max_boost      # Cap on the accumulated multiplier
+        self.topics = []         # Topic nodes, grouped by module so each module is a contiguous range
+        self.questions = []      # Per topic: list of questions
+        self.base_weights = []   # Per topic: weight before boosting
+        self.boosts = []         # Per topic: current wrong-answer multiplier
+        self.modules = []        # (module node, first topic index, end topic index)
+        self._topic_index = {}   # Topic node -> index
+
+        for root in roots:
+            for module in root.children:
+                start = len(self.topics)
+                stack = [module]
+                while stack:
+                    node = stack.pop()
+                    questions = node.get_questions()
+                    if questions:
+                        self._topic_index[node] = len(self.topics)
+                        self.topics.append(node)
+                        self.questions.append(questions)
+                    stack.extend(reversed(node.children))
+                end = len(self.topics)
+                if end > start:
+                    self.modules.append((module, start, end))
+                    for i in range(start, end):
+                        self.base_weights.append(
+                            weight(self.topics[i], module) if weight else (module.hours or 1) / (end - start)
+                        )
+        self.boosts = [1.0] * len(self.topics)
+        self.weights = FenwickTree(self.base_weights)
+
+    def __len__(self):
+        return sum(len(questions) for questions in self.questions)
+
+    def record_answer(self, topic, correct):
+        """Boost a topic after a wrong answer; decay the boost after a right one."""
+        i = self._topic_index[topic]
+        if correct:
+            self.boosts[i] = max(1.0, self.boosts[i] / self.wrong_boost)
+        else:
+            self.boosts[i] = min(self.max_boost, self.boosts[i] * self.wrong_boost)
+        self.weights.set(i, self.base_weights[i] * self.boosts[i])
+
+    def _draw(self, k, start, end, chosen, exhausted):
+        """Draw up to k distinct questions from topics start..end-1 into `chosen`.
+
+        Stops early only when every topic in the range is used up.
+        """
+        drawn = []
+        offset = self.weights.prefix_sum(start)
+        initial_span = self.weights.prefix_sum(end) - offset
+        misses = 0
+        while len(drawn) < k:
+            span = self.weights.prefix_sum(end) - offset
+            if span <= initial_span * 1e-9:
+                break  # Every topic in range is used up (up to floating-point residue)
+            if misses < 16:
+                i = self.weights.find(offset + self.rng.random() * span)
+                if not start <= i < end or self.weights.weights[i] <= 0:
+                    misses += 1  # Floating-point edge at a range boundary; try again
+                    continue
+            else:
+                i = self._draw_by_scan(start, end)  # Repeated edge misses: pick by a linear scan instead
+                if i is None:
+                    break
+            misses = 0
+            questions = self.questions[i]
+            used = chosen.setdefault(i, set())
+            if len(used) == len(questions):
+                exhausted[i] = self.weights.weights[i]
+                self.weights.set(i, 0.0)  # Topic used up for this quiz
+                continue
+            q = self.rng.randrange(len(questions))
+            while q in used:
+                q = self.rng.randrange(len(questions))
+            used.add(q)
+            drawn.append((self.topics[i], questions[q]))
+        return drawn
+
+    def _draw_by_scan(self, start, end):
+        """Pick a topic in start..end-1 by weight with a linear scan; None if all weights are zero."""
+        weights = self.weights.weights
+        total = sum(weights[i] for i in range(start, end) if weights[i] > 0)
+        if total <= 0:
+            return None
+        value = self.rng.random() * total
+        last = None
+        for i in range(start, end):
+            if weights[i] > 0:
+                last = i
+                value -= weights[i]
+                if value < 0:
+                    return i
+        return last
+
+    def _restore(self, exhausted):
+        for i, weight in exhausted.items():
+            self.weights.set(i, weight)
+
+    def sample(self, k):
+        """Draw k distinct questions across all topics, weighted by topic weight.
+
+        Returns fewer only if the topics hold fewer than k questions.
+        """
+        if k < 0:
+            raise ValueError("k must not be negative")
+        chosen, exhausted = {}, {}
+        try:
+            return self._draw(k, 0, len(self.topics), chosen, exhausted)
+        finally:
+            self._restore(exhausted)
+
+    def sample_stratified(self, k):
+        """Draw k questions, allotting each module a share proportional to its total weight.
+
+        A module's share is capped at the questions it has; the rest is
+        reallocated to the other modules by weight, so the quiz is only
+        short if the whole bank holds fewer than k questions.
+        """
+        if k < 0:
+            raise ValueError("k must not be negative")
+        weights = self.weights.weights
+        totals = [self.weights.prefix_sum(end) - self.weights.prefix_sum(start) for _, start, end in self.modules]
+        capacity = [sum(len(self.questions[i]) for i in range(start, end) if weights[i] > 0)
+                    for _, start, end in self.modules]
+        counts = [0] * len(self.modules)
+        remaining = k
+        while remaining:
+            # Largest-remainder allocation of the remaining draws across modules with questions left
+            open_modules = [m for m in range(len(self.modules)) if counts[m] < capacity[m] and totals[m] > 0]
+            grand_total = sum(totals[m] for m in open_modules)
+            if not grand_total:
+                break
+            quotas = {m: remaining * totals[m] / grand_total for m in open_modules}
+            shares = {m: int(quota) for m, quota in quotas.items()}
+            by_remainder = sorted(open_modules, key=lambda m: quotas[m] - shares[m], reverse=True)
+            for m in by_remainder[:remaining - sum(shares.values())]:
+                shares[m] += 1
+            for m, share in shares.items():
+                share = min(share, capacity[m] - counts[m])
+                counts[m] += share
+                remaining -= share
+
+        chosen, exhausted = {}, {}
+        quiz = []
+        try:
+            for (_, start, end), count in zip(self.modules, counts):
+                if count:
+                    quiz.extend(self._draw(count, start, end, chosen, exhausted))
+        finally:
+            self._restore(exhausted)
+        return quiz
+
+
+def generate_n_questions(roots, n, seed=None):
+    """Print n random questions drawn from the syllabi (see README)."""
+    quiz = QuestionSampler(roots, seed=seed).sample(n)
+    for i, (_, question) in enumerate(quiz, 1):
+        print(f"{i}. {question}")
+    return quiz
@@ -0,0 +1,203 @@
+"""Full-text search over topic names, resource titles and questions.
+
+    engine = SearchEngine(syllabus_list)
+    for hit in engine.search("heap sort complexity", limit=5):
+        print(hit.score, hit.kind, hit.text)
+
+Documents are ranked with BM25 over an inverted index. Postings are
+append-only arrays of document ids and term frequencies; replaced or
+removed documents are tombstoned, and the index is compacted once the
+tombstones outnumber the live documents. The engine observes TreeNode
+changes, so `add_child`, `add_resource` and `add_questions` on an indexed
+tree are searchable immediately.
+"""
+import heapq
+import math
+import re
+from array import array
+from collections import namedtuple
+
+import final
+
+K1 = 1.2   # BM25 term-frequency saturation
+B = 0.75   # BM25 length normalization
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be by do does for from how in is it its of on or the "
+    "this to what when which why with you your".split()
+)
+
+Hit = namedtuple("Hit", "score kind text node")
+
+
+def tokenize(text):
+    """Split text into lowercase terms, dropping stopwords and plural "s" endings."""
+    terms = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        if token in STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        terms.append(token)
+    return terms
+
+
+class SearchEngine:
+    """BM25-ranked inverted index over every topic, resource and question."""
+
+    def __init__(self, roots=()):
+        self.kinds = []              # Per document: "topic", "resource" or "question"
+        self.texts = []              # Per document: the searchable text
+        self.nodes = []              # Per document: the TreeNode it belongs to
+        self.lengths = array("l")    # Per document: number of terms
+        self.alive = bytearray()     # Per document: 0 once replaced or removed
+        self.postings = {}           # Term -> (array of doc ids, array of term frequencies)
+        self.live_count = 0
+        self.total_length = 0
+        self._node_docs = {}         # Indexed node -> {(kind, key): [doc ids]}
+        for root in roots:
+            self.add_tree(root)
+        final.add_observer(self._on_tree_change)
+
+    def close(self):
+        """Stop tracking tree changes."""
+        final.remove_observer(self._on_tree_change)
+
+    def __len__(self):
+        return self.live_count
+
+    def add_tree(self, root):
+        """Index every node in a tree."""
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            self._add_node(node)
+            stack.extend(node.children)
+
+    def _add_node(self, node):
+        self._node_docs[node] = {}
+        self._set_docs(node, ("topic", None), "topic", [node.name])
+        for key in node.resources:
+            self._set_docs(node, ("resource", key), "resource", [key])
+        for topic, questions in node.questions_map.items():
+            self._set_docs(node, ("questions", topic), "question", questions)
+
+    def _on_tree_change(self, event, node, *args):
+        if node not in self._node_docs:
+            return
+        if event == "child":
+            self.add_tree(args[0])
+        elif event == "resource":
+            self._set_docs(node, ("resource", args[0]), "resource", [args[0]])
+        elif event == "questions":
+            self._set_docs(node, ("questions", args[0]), "question", args[1])
+        elif event == "remove_child":
+            self.remove_tree(args[0])
+        elif event == "remove_resource":
+            self._drop_docs(node, ("resource", args[0]))
+        elif event == "remove_questions":
+            self._drop_docs(node, ("questions", args[0]))
+
+    def remove_tree(self, root):
+        """Tombstone the documents of every node in a tree."""
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            docs = self._node_docs.get(node)
+            if docs is not None:
+                for slot in list(docs):
+                    self._drop_docs(node, slot)
+                del self._node_docs[node]
+            stack.extend(node.children)
+
+    def _set_docs(self, node, slot, kind, texts):
+        """Replace the documents stored in one slot of a node (e.g. one topic's questions)."""
+        self._drop_docs(node, slot)
+        self._node_docs[node][slot] = [self._add_document(kind, text, node) for text in texts]
+
+    def _drop_docs(self, node, slot):
+        for doc_id in self._node_docs[node].pop(slot, ()):
+            self.alive[doc_id] = 0
+            self.texts[doc_id] = self.nodes[doc_id] = None  # Don't keep removed nodes alive
+            self.live_count -= 1
+            self.total_length -= self.lengths[doc_id]
+        if len(self.alive) - self.live_count > self.live_count + 64:
+            self._compact()
+
+    def _compact(self):
+        """Drop tombstoned documents and renumber the live ones, once the dead outnumber the live."""
+        alive = self.alive
+        new_id = array("l", [-1]) * len(alive)
+        kinds, texts, nodes, lengths = [], [], [], array("l")
+        for doc_id, live in enumerate(alive):
+            if live:
+                new_id[doc_id] = len(kinds)
+                kinds.append(self.kinds[doc_id])
+                texts.append(self.texts[doc_id])
+                nodes.append(self.nodes[doc_id])
+                lengths.append(self.lengths[doc_id])
+        postings = {}
+        for term, (doc_ids, frequencies) in self.postings.items():
+            kept_ids, kept_frequencies = array("l"), array("l")
+            for doc_id, tf in zip(doc_ids, frequencies):
+                if alive[doc_id]:
+                    kept_ids.append(new_id[doc_id])
+                    kept_frequencies.append(tf)
+            if kept_ids:
+                postings[term] = (kept_ids, kept_frequencies)
+        for slots in self._node_docs.values():
+            for slot, doc_ids in slots.items():
+                slots[slot] = [new_id[doc_id] for doc_id in doc_ids]
+        self.kinds, self.texts, self.nodes, self.lengths = kinds, texts, nodes, lengths
+        self.alive = bytearray(b"\x01") * len(kinds)
+        self.postings = postings
+
+    def _add_document(self, kind, text, node):
+        doc_id = len(self.texts)
+        terms = tokenize(text)
+        self.kinds.append(kind)
+        self.texts.append(text)
+        self.nodes.append(node)
+        self.lengths.append(len(terms))
+        self.alive.append(1)
+        self.live_count += 1
+        self.total_length += len(terms)
+
+        counts = {}
+        for term in terms:
+            counts[term] = counts.get(term, 0) + 1
+        for term, count in counts.items():
+            posting = self.postings.get(term)
+            if posting is None:
+                posting = self.postings[term] = (array("l"), array("l"))
+            posting[0].append(doc_id)
+            posting[1].append(count)
+        return doc_id
+
+    def search(self, query, limit=10, kind=None):
+        """Return up to `limit` Hits for a query, best first, optionally only of one kind."""
+        if not self.live_count:
+            return []
+        average_length = self.total_length / self.live_count or 1.0
+        lengths = self.lengths
+        alive = self.alive
+        scores = {}
+        for term in set(tokenize(query)):
+            posting = self.postings.get(term)
+            if posting is None:
+                continue
+            doc_ids, frequencies = posting
+            # Document frequency counts tombstoned documents too; they are rare and it keeps updates O(1)
+            df = len(doc_ids)
+            idf = math.log(1 + (self.live_count - df + 0.5) / (df + 0.5))
+            for doc_id, tf in zip(doc_ids, frequencies):
+                if not alive[doc_id]:
+                    continue
+                norm = K1 * (1 - B + B * lengths[doc_id] / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+
+        if kind is not None:
+            scores = {doc_id: score for doc_id, score in scores.items() if self.kinds[doc_id] == kind}
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [Hit(score, self.kinds[doc_id], self.texts[doc_id], self.nodes[doc_id]) for doc_id, score in best]
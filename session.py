@@ -0,0 +1,175 @@
+"""Non-blocking study sessions over asyncio streams.
+
+Drives the same flow as `display_menu`/`display_next_module` (choose a
+syllabus, show each module, "questions" or "completed", record the time)
+but reads answers from an asyncio StreamReader and writes to a
+StreamWriter, so one process can run thousands of sessions at once.
+
+    python session.py --port 8765      # then e.g. `nc localhost 8765`
+"""
+import argparse
+import asyncio
+
+from final import LinkedList, build_syllabus_list
+from render import render_to_string
+from timing import SessionTimer, format_wall_clock
+
+QUESTION_PROMPT = ("Do you want to answer questions related to this module? "
+                   "(type 'questions' to answer, 'completed' to move to the next module): ")
+RETRY_PROMPT = "Invalid input. Type 'questions' to answer, 'completed' to move to the next module: "
+
+
+class SessionClosed(Exception):
+    """Raised when the learner's stream ends in the middle of a session."""
+
+
+class AsyncSession:
+    """One learner's session over a pair of asyncio streams."""
+
+    def __init__(self, reader, writer, timer=None):
+        self.reader = reader
+        self.writer = writer
+        self.timer = timer if timer is not None else SessionTimer(LinkedList())
+
+    async def send(self, text):
+        self.writer.write(text.encode())
+        await self.writer.drain()
+
+    async def ask(self, prompt):
+        """Send a prompt and return the learner's next line (without the newline).
+
+        A line longer than the reader's limit is skipped and read as an empty
+        answer, which the prompts treat like any other invalid input.
+        """
+        await self.send(prompt)
+        line = await self._read_line()
+        if line is None:
+            await self.send("\nThat line was too long and has been ignored.\n")
+            return ""
+        if not line:
+            raise SessionClosed()
+        return line.decode(errors="replace").strip()
+
+    async def _read_line(self):
+        """Return the next line (b"" at the end of the stream), or None if it was too long."""
+        reader = self.reader
+        too_long = False
+        while True:
+            try:
+                line = await reader.readuntil(b"\n")
+            except asyncio.IncompleteReadError as error:
+                line = error.partial  # The stream ended without a newline
+            except asyncio.LimitOverrunError as error:
+                # Nothing was consumed: drop what is buffered and keep looking for the newline
+                too_long = True
+                try:
+                    await reader.readexactly(error.consumed)
+                except asyncio.IncompleteReadError:
+                    return b""
+                continue
+            return None if too_long and line else line
+
+    async def choose_syllabus(self, syllabus_list):
+        """Async counterpart of display_menu's selection."""
+        lines = ["Available Subjects:"]
+        lines += [f"{idx}. {syllabus.name}" for idx, syllabus in enumerate(syllabus_list, 1)]
+        await self.send("\n".join(lines) + "\n")
+        answer = await self.ask("\nEnter the number of the syllabus you want to explore: ")
+        while not answer.isdigit() or int(answer) not in range(1, len(syllabus_list) + 1):
+            answer = await self.ask(f"Invalid input. Please enter a number between 1 and {len(syllabus_list)}: ")
+        return syllabus_list[int(answer) - 1]
+
+    async def run_modules(self, syllabus):
+        """Async counterpart of display_next_module; returns the SessionTimer."""
+        timer = self.timer
+        for module in syllabus.children:
+            module_span = timer.start(module.name, "module")
+            reading_span = timer.start(module.name, "reading")
+            parts = [f"\n--- {module.name} ---\n"]
+            for child in module.children:
+                with timer.span(child.name, "topic"):
+                    parts.append(render_to_string(child))
+            parts.append(f"Module started at: {format_wall_clock(module_span.wall_start)}\n")
+            await self.send("".join(parts))
+
+            answer = (await self.ask(QUESTION_PROMPT)).lower()
+            while answer not in ("questions", "completed"):
+                answer = (await self.ask(RETRY_PROMPT)).lower()
+            timer.stop(reading_span)
+
+            if answer == "questions":
+                with timer.span(module.name, "questions"):
+                    parts = []
+                    for child in module.children:
+                        questions = child.get_questions()
+                        if questions:
+                            parts.append(f"\nQuestions for {child.name}:\n")
+                            parts.extend(f"  - {question}\n" for question in questions)
+                    await self.send("".join(parts))
+                    await self.ask("\nPress Enter to continue to the next module...")
+
+            timer.stop(module_span)
+            end_time = module_span.wall_start + module_span.seconds
+            await self.send(f"Module ended at: {format_wall_clock(end_time)}\n")
+
+        await self.send(timer.store.format_times() + "\n")
+        return timer
+
+
+async def run_session(syllabus_list, reader, writer):
+    """Run a full menu + modules session; returns the SessionTimer (None if the learner left)."""
+    session = AsyncSession(reader, writer)
+    try:
+        syllabus = await session.choose_syllabus(syllabus_list)
+        return await session.run_modules(syllabus)
+    except (SessionClosed, ConnectionError):
+        return None
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+LINE_LIMIT = 64 * 1024   # Longest answer line a server session reads; longer lines are skipped
+LISTEN_BACKLOG = 4096  # Pending connections the kernel queues before accepting; asyncio's default is 100
+
+
+async def start_server(syllabus_list=None, host="127.0.0.1", port=8765, on_finished=None, backlog=LISTEN_BACKLOG):
+    """Serve one session per TCP connection. `on_finished(timer)` receives each finished session.
+
+    `backlog` bounds how many connections can wait to be accepted at once.
+    With asyncio's default of 100, a burst of thousands of learners
+    connecting together overflows the queue and stalls on SYN retransmits
+    (about one second each). The kernel also caps it at
+    net.core.somaxconn (4096 on current Linux).
+    """
+    if syllabus_list is None:
+        syllabus_list = build_syllabus_list()
+
+    async def handle(reader, writer):
+        timer = await run_session(syllabus_list, reader, writer)
+        if timer is not None and on_finished is not None:
+            on_finished(timer)
+
+    return await asyncio.start_server(handle, host, port, limit=LINE_LIMIT, backlog=backlog)
+
+
+async def _serve_forever(host, port, backlog):
+    server = await start_server(host=host, port=port, backlog=backlog)
+    print(f"Serving study sessions on {host}:{server.sockets[0].getsockname()[1]}")
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve study sessions over TCP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--backlog", type=int, default=LISTEN_BACKLOG, help="Pending connections to queue")
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve_forever(args.host, args.port, args.backlog))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,293 @@
+"""Compact binary snapshots of built syllabus trees.
+
+    save_snapshot(syllabus_list, "syllabi.snap")
+    with Snapshot("syllabi.snap") as snap:
+        roots = snap.roots()              # materialize everything, or
+        module = snap.subtree(3)          # just one subtree, by node index
+
+Layout (little-endian):
+
+    header   magic, string count, node count, root count, section offsets
+    strings  per string: uint32 byte length + UTF-8 bytes (each distinct
+             name, resource title, URL and question stored once)
+    string offsets   uint64 per string
+    nodes    8-byte aligned; per node, in pre-order: uint32 record length, then
+             name id, hours (float64, NaN = none), parent index,
+             subtree size, resource pairs and question lists as string ids
+    node offsets     uint64 per node (file offset of each record)
+    roots    uint32 node index per root
+
+The file is memory-mapped and only the strings and records that are
+actually used get decoded.
+"""
+import math
+import mmap
+import struct
+import sys
+from array import array
+
+from final import TreeNode
+
+MAGIC = b"SYLSNAP1"
+_HEADER = struct.Struct("<8sIII5Q")   # magic, counts, offsets of the five sections
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_F64 = struct.Struct("<d")
+_NODE_FIXED = struct.Struct("<IdII")  # name id, hours, parent, subtree size
+NO_PARENT = 0xFFFFFFFF
+
+
+class _StringTable:
+    """Interns strings to integer ids while writing."""
+
+    def __init__(self):
+        self.ids = {}
+        self.strings = []
+
+    def id(self, text):
+        string_id = self.ids.get(text)
+        if string_id is None:
+            string_id = self.ids[text] = len(self.strings)
+            self.strings.append(text)
+        return string_id
+
+
+class _StringCache(dict):
+    """String id -> text, decoded from the mapped string table on first lookup."""
+
+    def __init__(self, data, index_offset):
+        super().__init__()
+        self._data = data
+        self._index_offset = index_offset
+
+    def __missing__(self, string_id):
+        offset = _U64.unpack_from(self._data, self._index_offset + 8 * string_id)[0]
+        length = _U32.unpack_from(self._data, offset)[0]
+        text = self[string_id] = self._data[offset + 4:offset + 4 + length].decode("utf-8")
+        return text
+
+
+def _pad_to_8(f):
+    f.write(b"\0" * (-f.tell() % 8))
+
+
+def save_snapshot(roots, path):
+    """Write TreeNode roots to a binary snapshot file."""
+    strings = _StringTable()
+    records = []
+    root_indices = []
+    for root in roots:
+        root_indices.append(len(records))
+        # Pre-order walk; each record is [name id, hours, parent, subtree size, resources, topics]
+        first = len(records)
+        stack = [(root, NO_PARENT)]
+        while stack:
+            node, parent = stack.pop()
+            index = len(records)
+            records.append([
+                strings.id(node.name),
+                math.nan if node.hours is None else float(node.hours),
+                parent,
+                1,
+                [(strings.id(key), strings.id(url)) for key, url in node.resources.items()],
+                [(strings.id(topic), [strings.id(q) for q in questions])
+                 for topic, questions in node.questions_map.items()],
+            ])
+            for child in reversed(node.children):
+                stack.append((child, index))
+        for i in range(len(records) - 1, first, -1):
+            records[records[i][2]][3] += records[i][3]
+
+    with open(path, "wb") as f:
+        f.write(b"\0" * _HEADER.size)  # Placeholder, rewritten once offsets are known
+
+        strings_offset = f.tell()
+        string_offsets = []
+        for text in strings.strings:
+            data = text.encode("utf-8")
+            string_offsets.append(f.tell())
+            f.write(_U32.pack(len(data)))
+            f.write(data)
+
+        string_index_offset = f.tell()
+        f.write(struct.pack(f"<{len(string_offsets)}Q", *string_offsets))
+
+        _pad_to_8(f)
+        nodes_offset = f.tell()
+        node_offsets = []
+        for name_id, hours, parent, size, resources, topics in records:
+            parts = [_NODE_FIXED.pack(name_id, hours, parent, size), _U32.pack(len(resources))]
+            for key_id, url_id in resources:
+                parts.append(struct.pack("<II", key_id, url_id))
+            parts.append(_U32.pack(len(topics)))
+            for topic_id, question_ids in topics:
+                parts.append(struct.pack(f"<II{len(question_ids)}I", topic_id, len(question_ids), *question_ids))
+            record = b"".join(parts)
+            node_offsets.append(f.tell())
+            f.write(_U32.pack(len(record)))
+            f.write(record)
+
+        _pad_to_8(f)  # Every record is a multiple of 4 bytes, so the node index needs padding only once
+        node_index_offset = f.tell()
+        f.write(struct.pack(f"<{len(node_offsets)}Q", *node_offsets))
+
+        roots_offset = f.tell()
+        f.write(struct.pack(f"<{len(root_indices)}I", *root_indices))
+
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, len(strings.strings), len(records), len(root_indices),
+                             strings_offset, string_index_offset, nodes_offset, node_index_offset, roots_offset))
+
+
+class Snapshot:
+    """Read-only, memory-mapped view of a snapshot file that decodes on demand."""
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty files can't be mapped
+            self._file.close()
+            raise ValueError(f"{path} is not a syllabus snapshot") from None
+        if len(self._map) < _HEADER.size or self._map[:len(MAGIC)] != MAGIC:
+            # close() would need the section views, which don't exist yet
+            self._map.close()
+            self._file.close()
+            raise ValueError(f"{path} is not a syllabus snapshot")
+        (_, self.string_count, self.node_count, self.root_count, self._strings_offset,
+         self._string_index, self._nodes_offset, node_index, roots_offset) = _HEADER.unpack_from(self._map, 0)
+        # Node records and the node index are 8-byte aligned, so view them as uint32/uint64 words
+        self._words = self._view(self._nodes_offset, node_index, "I")
+        self._node_offsets = self._view(node_index, node_index + 8 * self.node_count, "Q")
+        self.root_indices = struct.unpack_from(f"<{self.root_count}I", self._map, roots_offset)
+        self._strings = _StringCache(self._map, self._string_index)  # Filled lazily
+
+    def _view(self, start, end, typecode):
+        """Zero-copy view of a little-endian section (a byte-swapped copy on big-endian hosts)."""
+        if sys.byteorder == "little":
+            return memoryview(self._map)[start:end].cast(typecode)
+        words = array(typecode, self._map[start:end])
+        words.byteswap()
+        return words
+
+    def close(self):
+        if isinstance(self._words, memoryview):
+            self._words.release()
+            self._node_offsets.release()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def string(self, string_id):
+        """Return a string by id, decoding it on first use."""
+        return self._strings[string_id]
+
+    def preload_strings(self):
+        """Decode the whole string table in one sequential pass (used before bulk loads)."""
+        data = self._map
+        offset = self._strings_offset
+        strings = self._strings
+        for string_id in range(self.string_count):
+            length = _U32.unpack_from(data, offset)[0]
+            if string_id not in strings:
+                strings[string_id] = data[offset + 4:offset + 4 + length].decode("utf-8")
+            offset += 4 + length
+
+    def _word_position(self, index):
+        """Position of a node's record (its length word) in the uint32 view of the nodes section."""
+        return (self._node_offsets[index] - self._nodes_offset) // 4
+
+    def record(self, index):
+        """Return (name, hours, parent index, subtree size, resources, questions_map) for a node."""
+        words = self._words
+        position = self._word_position(index)
+        hours = _F64.unpack_from(self._map, self._node_offsets[index] + 8)[0]
+        name_id, parent, size = words[position + 1], words[position + 4], words[position + 5]
+        string = self.string
+        resource_count = words[position + 6]
+        position += 7
+        resources = {}
+        for _ in range(resource_count):
+            resources[string(words[position])] = string(words[position + 1])
+            position += 2
+        topic_count = words[position]
+        position += 1
+        questions_map = {}
+        for _ in range(topic_count):
+            topic_id, count = words[position], words[position + 1]
+            position += 2
+            questions_map[string(topic_id)] = [string(q) for q in words[position:position + count]]
+            position += count
+        if math.isnan(hours):
+            hours = None
+        elif hours.is_integer():
+            hours = int(hours)
+        return string(name_id), hours, (None if parent == NO_PARENT else parent), size, resources, questions_map
+
+    def subtree(self, index):
+        """Materialize the TreeNode subtree rooted at node `index`.
+
+        The nodes are new and not yet observed by anything, so their fields
+        are filled in directly instead of through the add_* methods, and the
+        records are read in one sequential pass over the nodes section.
+        """
+        words = self._words
+        data = self._map
+        strings = self._strings
+        lookup = strings.__getitem__  # Decodes strings not seen yet
+        unpack_hours = _F64.unpack_from
+        position = self._word_position(index)
+        byte_base = self._nodes_offset + 8  # Hours sit 8 bytes into a record
+        nodes = []
+        for _ in range(words[position + 5]):
+            hours = unpack_hours(data, byte_base + 4 * position)[0]
+            if hours != hours:  # NaN: no hours
+                hours = None
+            elif hours.is_integer():
+                hours = int(hours)
+            node = TreeNode(strings[words[position + 1]], hours)
+            cursor = position + 6
+            count = words[cursor]
+            cursor += 1
+            if count:
+                node.resources = {strings[words[cursor + 2 * j]]: strings[words[cursor + 2 * j + 1]]
+                                  for j in range(count)}
+                cursor += 2 * count
+            count = words[cursor]
+            cursor += 1
+            if count:
+                questions_map = node.questions_map = {}
+                for _ in range(count):
+                    topic_id, length = words[cursor], words[cursor + 1]
+                    cursor += 2
+                    questions_map[strings[topic_id]] = list(map(lookup, words[cursor:cursor + length]))
+                    cursor += length
+            if nodes:
+                parent = nodes[words[position + 4] - index]
+                if not parent.children:
+                    parent.children = []  # Replaces the shared empty placeholder
+                parent.children.append(node)
+                node.parent = parent
+            nodes.append(node)
+            position += 1 + words[position] // 4  # Records are consecutive in pre-order
+        return nodes[0]
+
+    def root_names(self):
+        """Return the names of the stored roots without materializing them."""
+        return [self.string(self._words[self._word_position(i) + 1]) for i in self.root_indices]
+
+    def roots(self):
+        """Materialize every stored tree."""
+        self.preload_strings()
+        return [self.subtree(index) for index in self.root_indices]
+
+
+def load_snapshot(path):
+    """Load all trees from a snapshot file."""
+    with Snapshot(path) as snapshot:
+        return snapshot.roots()
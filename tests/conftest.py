@@ -0,0 +1,41 @@
+import pytest
+
+from final import TreeNode
+
+
+def _build_syllabus():
+    """Syllabus
+         Module 1 (3 hours)
+           Stacks (2 hours)     resource "Notes", two questions
+           Queues (1 hour)      one question
+         Module 2 (2 hours)
+           Heaps                two questions
+    """
+    root = TreeNode("Syllabus")
+    linear = TreeNode("Module 1", 3)
+    stacks = TreeNode("Stacks", 2)
+    stacks.add_resource("Notes", "https://example.org/stacks")
+    stacks.add_questions("Stacks", ["What is a stack?", "Implement a stack"])
+    queues = TreeNode("Queues", 1)
+    queues.add_questions("Queues", ["What is a queue?"])
+    linear.add_child(stacks)
+    linear.add_child(queues)
+    trees = TreeNode("Module 2", 2)
+    heaps = TreeNode("Heaps")
+    heaps.add_questions("Heaps", ["Heapify", "Heap sort"])
+    trees.add_child(heaps)
+    root.add_child(linear)
+    root.add_child(trees)
+    return root
+
+
+@pytest.fixture
+def syllabus():
+    """A small two-module syllabus, built through the TreeNode API."""
+    return _build_syllabus()
+
+
+@pytest.fixture
+def make_syllabus():
+    """Factory for tests that need several independent copies of `syllabus`."""
+    return _build_syllabus
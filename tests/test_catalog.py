@@ -0,0 +1,69 @@
+import io
+import json
+
+import pytest
+
+import catalog
+from catalog import load_catalog, node_to_dict, save_catalog
+from final import TreeNode
+
+
+def _values(text, chunk_size):
+    original = catalog.CHUNK_SIZE
+    catalog.CHUNK_SIZE = chunk_size
+    try:
+        return list(catalog._iter_json_values(io.StringIO(text)))
+    finally:
+        catalog.CHUNK_SIZE = original
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 64 * 1024])
+@pytest.mark.parametrize("text", [
+    '[1, 23, 456, -7.5e3, true, null, "a b", {"name": "x", "hours": 12}, [1, 2]]',
+    ' [ ] ',
+    '[]',
+    '{"name": "only", "children": [{"name": "child"}]}',
+    '12345',
+    '"top-level string"',
+    '\n[{"name":"a"},\n {"name":"b"}]\n',
+])
+def test_values_match_json_loads_at_any_chunk_boundary(text, chunk_size):
+    expected = json.loads(text)
+    values = _values(text, chunk_size)
+    if isinstance(expected, list):
+        assert values == expected
+    else:
+        assert values == [expected]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 64 * 1024])
+@pytest.mark.parametrize("text", [
+    '[{"name":"a"} {"name":"b"}]',   # Missing comma
+    '[{"name":"a"},,{"name":"b"}]',  # Stray comma
+    '[,{"name":"a"}]',
+    '[{"name":"a"},]',               # Trailing comma
+    '[1, 2',                         # Unterminated
+    '[1, 2] 3',                      # Data after the document
+    '{"name": "a"} {"name": "b"}',
+    '[1, 2 3]',
+    '[tru]',
+])
+def test_malformed_documents_are_rejected(text, chunk_size):
+    with pytest.raises(ValueError):
+        _values(text, chunk_size)
+
+
+def test_catalog_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(catalog, "CHUNK_SIZE", 7)
+    roots = []
+    for i in range(3):
+        root = TreeNode(f"Course {i}", 40 + i)
+        module = TreeNode("Module 1", 6)
+        module.add_resource("Notes", "https://example.com/notes")
+        module.add_questions("Module 1", ["What is a tree?"])
+        root.add_child(module)
+        roots.append(root)
+    for name in ("courses.json", "courses.jsonl"):
+        path = str(tmp_path / name)
+        save_catalog(roots, path)
+        assert [node_to_dict(root) for root in load_catalog(path)] == [node_to_dict(root) for root in roots]
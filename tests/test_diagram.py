@@ -0,0 +1,76 @@
+import io
+
+import pytest
+
+from diagram import MARGIN, ROW_HEIGHT, TreeLayout, export, write_dot, write_svg
+from final import TreeNode
+from render import FLUSH_CHARS
+
+
+def test_leaves_take_rows_in_order_and_parents_are_centered(syllabus):
+    layout = TreeLayout(syllabus)
+    rows = {node.name: layout.row[i] for i, node in enumerate(layout.nodes)}
+    assert rows == {"Stacks": 0, "Queues": 1, "Heaps": 2, "Module 1": 0.5, "Module 2": 2, "Syllabus": 1.25}
+    assert layout.rows == 3
+    assert layout.height == 2 * MARGIN + 2 * ROW_HEIGHT
+    x = [layout.position(i)[0] for i in range(len(layout))]
+    assert x[0] < x[1] < x[2]  # One column per depth, left to right
+    assert x[1] == x[4] and x[2] == x[3] == x[5]
+
+
+def test_max_depth_cuts_the_layout(syllabus):
+    layout = TreeLayout(syllabus, max_depth=1)
+    assert [node.name for node in layout.nodes] == ["Syllabus", "Module 1", "Module 2"]
+    assert list(layout.row) == [0.5, 0, 1]
+
+
+def test_svg_escapes_labels_and_counts_nodes(syllabus):
+    syllabus.children[1].add_child(TreeNode("Heaps & <Tries>", 2))
+    out = io.StringIO()
+    assert write_svg(syllabus, out) == 7
+    svg = out.getvalue()
+    assert svg.startswith("<svg ") and svg.endswith("</svg>\n")
+    assert "Heaps &amp; &lt;Tries&gt; (2 hours)" in svg
+    assert svg.count("<text ") == 7 and svg.count("<path ") == 6
+
+
+def test_dot_lists_nodes_and_edges(syllabus):
+    syllabus.children[0].children[0].name = 'Say "stack"'
+    out = io.StringIO()
+    assert write_dot(syllabus, out, path="Module 1") == 3
+    dot = out.getvalue()
+    assert 'n0 [label="Module 1 (3 hours)"];' in dot
+    assert 'n1 [label="Say \\"stack\\" (2 hours)"];' in dot
+    assert "n0 -> n1;" in dot and "n0 -> n2;" in dot
+    assert "pos=" not in dot
+
+    out = io.StringIO()
+    write_dot(syllabus, out, max_depth=1, with_positions=True)
+    assert out.getvalue().count('pos="') == 3
+
+
+def test_large_diagrams_are_written_in_chunks():
+    root = TreeNode("Syllabus")
+    for i in range(2000):
+        root.add_child(TreeNode(f"Topic {i}", 1))
+    writes = []
+
+    class Out:
+        def write(self, text):
+            writes.append(len(text))
+
+    write_svg(root, Out())
+    assert len(writes) > 1
+    assert all(size >= FLUSH_CHARS for size in writes[:-1])
+    assert len(writes) < sum(writes) // FLUSH_CHARS + 2
+
+
+def test_export_picks_the_format_from_the_extension(tmp_path, syllabus):
+    assert export(syllabus, str(tmp_path / "s.svg")) == 6
+    assert (tmp_path / "s.svg").read_text().startswith("<svg")
+    assert export(syllabus, str(tmp_path / "s.gv"), max_depth=0) == 1
+    assert (tmp_path / "s.gv").read_text().startswith("digraph")
+    with pytest.raises(ValueError, match="Unsupported"):
+        export(syllabus, str(tmp_path / "s.png"))
+    with pytest.raises(KeyError):
+        export(syllabus, str(tmp_path / "s.svg"), path="Module 9")
@@ -0,0 +1,52 @@
+import time
+
+from eventlog import EventLog, iter_events, replay_sessions
+
+
+def _log_session(log, modules=1):
+    session = log.new_session("DSA", learner="ana")
+    for number in range(1, modules + 1):
+        log.emit(session, "module_complete", module=f"Module {number}", number=number, seconds=60.0 * number)
+    log.emit(session, "session_end", modules=modules)
+    return session
+
+
+def test_session_after_a_torn_line_is_replayed(tmp_path):
+    path = str(tmp_path / "events.ndjson")
+    with EventLog(path) as log:
+        first = _log_session(log)
+        crashed = log.new_session("DSA")
+    with open(path, "ab") as f:
+        f.write(b'{"ts":1.0,"session":"' + crashed.encode() + b'","event":"module_co')  # Crash mid-write
+
+    with EventLog(path) as log:
+        second = _log_session(log, modules=2)
+
+    sessions = {s.session: s for s in replay_sessions(iter_events(path))}
+    assert list(sessions[first].times) == [60.0]
+    assert list(sessions[second].times) == [60.0, 120.0]
+    assert sessions[second].finished
+    assert not sessions[crashed].finished
+
+
+def test_reopening_a_clean_log_adds_no_blank_line(tmp_path):
+    path = str(tmp_path / "events.ndjson")
+    with EventLog(path) as log:
+        _log_session(log)
+    size = (tmp_path / "events.ndjson").stat().st_size
+    EventLog(path).close()
+    assert (tmp_path / "events.ndjson").stat().st_size == size
+
+
+def test_idle_log_is_flushed_by_the_timer(tmp_path):
+    path = str(tmp_path / "events.ndjson")
+    log = EventLog(path, fsync_interval=0.05)
+    try:
+        log.emit("s1", "session_start", syllabus="DSA")  # Within the interval: buffered
+        log.emit("s1", "module_start", module="Module 1", number=1)
+        deadline = time.monotonic() + 5
+        while len(list(iter_events(path))) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)  # No further events, as while a learner reads a module
+        assert [event["event"] for event in iter_events(path)] == ["session_start", "module_start"]
+    finally:
+        log.close()
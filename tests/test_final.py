@@ -0,0 +1,78 @@
+import gc
+import pickle
+import weakref
+
+import pytest
+
+import final
+from final import TreeNode
+
+
+def test_pickled_subtree_leaves_ancestors_out(syllabus):
+    module = syllabus.children[0]
+    copy = pickle.loads(pickle.dumps(module))
+    assert copy.parent is None
+    assert copy.children[0].parent is copy
+    assert copy.aggregates() == module.aggregates()
+
+
+def test_pickled_tree_relinks_parents(syllabus):
+    copy = pickle.loads(pickle.dumps(syllabus))
+    module = copy.children[0]
+    assert module.parent is copy
+    assert module.children[0].parent is module
+
+
+def test_removing_from_a_node_without_children_or_maps_raises_lookup_errors():
+    node = TreeNode("Leaf")
+    with pytest.raises(ValueError):
+        node.remove_child(TreeNode("Stranger"))
+    with pytest.raises(KeyError):
+        node.remove_resource("Notes")
+    with pytest.raises(KeyError):
+        node.remove_questions("Leaf")
+    with pytest.raises(ValueError):
+        node.reorder_children(["Stranger"])
+    node.reorder_children([])  # An empty permutation of no children is fine
+    assert node.aggregates() == (0, 0, 0, 0)
+
+
+def test_unreferenced_observer_is_dropped_without_close(make_syllabus):
+    class Counter:
+        def __init__(self):
+            self.events = []
+
+        def on_change(self, event, node, *args):
+            self.events.append(event)
+
+    counter = Counter()
+    final.add_observer(counter.on_change)
+    observers = len(final._observers)
+    module = make_syllabus().children[0]
+    assert counter.events.count("child") == 5
+
+    collected = weakref.ref(counter)
+    del counter
+    gc.collect()
+    assert collected() is None
+    assert len(final._observers) == observers - 1
+    module.set_hours(4)  # No dead observer is called
+
+
+def test_function_observer_is_held_until_removed(syllabus):
+    events = []
+
+    def observer(event, node, *args):
+        events.append((event, node.name))
+
+    final.add_observer(observer)
+    module = syllabus.children[0]
+    try:
+        module.set_hours(5)
+        module.add_child(TreeNode("Deques"))
+    finally:
+        final.remove_observer(observer)
+    module.set_hours(6)
+    assert events == [("hours", "Module 1"), ("child", "Module 1")]
+    with pytest.raises(ValueError):
+        final.remove_observer(observer)
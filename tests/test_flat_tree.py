@@ -0,0 +1,31 @@
+import pytest
+
+from flat_tree import FlatTree
+
+STACKS = 2  # Pre-order index of Syllabus/Module 1/Stacks
+
+
+def test_snapshot_does_not_follow_source_edits(syllabus):
+    stacks = syllabus.children[0].children[0]
+    flat = FlatTree(syllabus)
+    stacks.add_resource("Video", "https://example.org/video")
+    stacks.questions_map["Stacks"].append("Push and pop")
+    stacks.add_questions("Other", ["What?"])
+
+    assert dict(flat.resources[STACKS]) == {"Notes": "https://example.org/stacks"}
+    assert dict(flat.questions_map[STACKS]) == {"Stacks": ("What is a stack?", "Implement a stack")}
+
+
+def test_snapshot_maps_are_read_only(syllabus):
+    flat = FlatTree(syllabus)
+    with pytest.raises(TypeError):
+        flat.resources[STACKS]["Video"] = "https://example.org/video"
+
+
+def test_to_tree_round_trip(syllabus):
+    rebuilt = FlatTree(syllabus).to_tree()
+    stacks = rebuilt.children[0].children[0]
+    assert stacks.resources == {"Notes": "https://example.org/stacks"}
+    assert stacks.questions_map == {"Stacks": ["What is a stack?", "Implement a stack"]}
+    assert stacks.hours == 2
+    assert [module.hours for module in rebuilt.children] == [3, 2]
@@ -0,0 +1,117 @@
+import http.client
+import json
+import threading
+
+import pytest
+
+import http_service
+from final import TreeNode
+from http_service import SyllabusService, make_server
+
+
+def test_subtree_changed_while_serializing_is_not_cached(monkeypatch, syllabus):
+    root = syllabus
+    service = SyllabusService([root])
+    serialize = http_service.node_to_dict
+
+    def serialize_then_edit(node):
+        body = serialize(node)
+        root.add_child(TreeNode("Module 3", 3))  # Lands after the snapshot was taken
+        return body
+
+    try:
+        monkeypatch.setattr(http_service, "node_to_dict", serialize_then_edit)
+        service.subtree(1)
+        monkeypatch.setattr(http_service, "node_to_dict", serialize)
+        status, body = service.subtree(1)
+        assert status == 200
+        assert [child["name"] for child in json.loads(body)["children"]] == ["Module 1", "Module 2", "Module 3"]
+    finally:
+        service.close()
+
+
+def test_subtree_not_found_messages(syllabus):
+    service = SyllabusService([syllabus])
+    try:
+        assert service.subtree(9) == (404, {"error": "No syllabus 9"})
+        assert service.subtree(1, "Nope") == (404, {"error": "No topic at path 'Nope' in syllabus 1"})
+    finally:
+        service.close()
+
+
+def test_post_with_invalid_content_length_is_rejected(syllabus):
+    server = make_server([syllabus], port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+        connection.putrequest("POST", "/times")
+        connection.putheader("Content-Length", "abc")
+        connection.endheaders()
+        response = connection.getresponse()
+        assert response.status == 400
+        assert json.loads(response.read()) == {"error": "Invalid Content-Length"}
+        connection.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+        server.RequestHandlerClass.service.close()
+
+
+@pytest.mark.parametrize("seconds", ["NaN", "Infinity", "-Infinity", -1.0])
+def test_record_times_rejects_non_finite_or_negative_times(seconds, syllabus):
+    service = SyllabusService([syllabus])
+    try:
+        status, _ = service.record_times({"learner": "ana", "module_times": [60.0, seconds]})
+        assert status == 400
+        assert service.learner_report("ana")[0] == 404  # Nothing was stored
+    finally:
+        service.close()
+
+
+def test_posted_nan_is_rejected_and_reports_stay_valid_json(syllabus):
+    server = make_server([syllabus], port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+        for body, status in ((b'{"learner": "ana", "module_times": [NaN]}', 400),
+                             (b'{"learner": "ana", "module_times": [60.5]}', 200)):
+            connection.request("POST", "/times", body, {"Content-Type": "application/json"})
+            response = connection.getresponse()
+            response.read()
+            assert response.status == status
+        connection.request("GET", "/times/ana")
+        report = json.loads(connection.getresponse().read(), parse_constant=_reject_constant)
+        assert report["module_times"] == [60.5]
+        connection.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+        server.RequestHandlerClass.service.close()
+
+
+def _reject_constant(name):
+    raise ValueError(f"Not valid JSON: {name}")
+
+
+def test_subtree_path_may_contain_slashes_in_topic_names(syllabus):
+    root = syllabus
+    root.children[0].add_child(TreeNode("Up/Down Counters", 1))
+    service = SyllabusService([root])
+    try:
+        status, body = service.subtree(1, "Module 1/Up/Down Counters")
+        assert status == 200
+        assert json.loads(body)["name"] == "Up/Down Counters"
+    finally:
+        service.close()
+
+
+def test_building_another_tree_keeps_the_cache(syllabus, make_syllabus):
+    service = SyllabusService([syllabus])
+    try:
+        _, cached = service.subtree(1)
+        make_syllabus()  # An unrelated tree, built through the TreeNode API
+        assert service.subtree(1)[1] is cached
+    finally:
+        service.close()
@@ -0,0 +1,62 @@
+import gc
+import weakref
+
+from final import TreeNode
+from index import TopicIndex
+
+
+def _syllabus():
+    root = TreeNode("Syllabus")
+    for i in range(3):
+        module = TreeNode(f"Module {i}")
+        module.add_child(TreeNode("Heaps"))
+        root.add_child(module)
+    return root
+
+
+def _contents(index):
+    return (sorted(index.paths.values()),
+            {name: sorted(index.paths[node] for node in nodes) for name, nodes in index.by_name.items()},
+            sorted(index.by_path))
+
+
+def test_index_matches_a_fresh_index_after_edits():
+    root = _syllabus()
+    index = TopicIndex([root])
+    try:
+        root.remove_child(root.children[0])
+        extra = TreeNode("Module 3")
+        extra.add_child(TreeNode("Tries"))
+        root.add_child(extra)
+        root.children[0].add_child(TreeNode("Binary Heaps"))
+
+        fresh = TopicIndex([root])
+        fresh.close()
+        assert _contents(index) == _contents(fresh)
+        assert index.get("syllabus/module 3/tries") is extra.children[0]
+        assert index.get("Syllabus/Module 0/Heaps") is None
+        assert len(index.find("heaps")) == 2
+        assert [node.name for node in index.prefix("binary")] == ["Binary Heaps"]
+    finally:
+        index.close()
+
+
+def test_other_trees_are_not_indexed():
+    index = TopicIndex([_syllabus()])
+    try:
+        other = _syllabus()
+        other.add_child(TreeNode("Module 9"))
+        assert index.find("module 9") == []
+        assert len(index.find("heaps")) == 3
+    finally:
+        index.close()
+
+
+def test_unclosed_index_is_freed():
+    root = _syllabus()
+    index = TopicIndex([root])
+    collected = weakref.ref(index)
+    del index
+    gc.collect()
+    assert collected() is None
+    root.add_child(TreeNode("Module 3"))  # Nothing left to notify
@@ -0,0 +1,89 @@
+import itertools
+
+import pytest
+
+import final
+from final import LinkedList, TreeNode
+from instrumentation import BUCKETS_NS, Histogram, Instrumentation
+from timing import SessionTimer
+
+
+class _Work:
+    def run(self, fail=False):
+        if fail:
+            raise RuntimeError("failed")
+        return "done"
+
+
+def test_histogram_quantiles_use_bucket_bounds():
+    histogram = Histogram()
+    for ns in (500, 2_000, 2_000, 7_000_000):
+        histogram.observe(ns)
+    assert histogram.count == 4 and histogram.max_ns == 7_000_000
+    assert histogram.quantile(0.25) == BUCKETS_NS[0] / 1e9   # 500 ns falls in the 1 us bucket
+    assert histogram.quantile(0.5) == 2_500 / 1e9
+    assert histogram.quantile(1.0) == 7_000_000 / 1e9        # Capped at the largest observation
+    assert Histogram().quantile(0.5) == 0.0
+
+
+def test_enable_wraps_targets_and_disable_restores_them():
+    original = _Work.run
+    metrics = Instrumentation(targets=[(_Work, "run", "work")])
+    seen = []
+    metrics.add_hook(lambda operation, seconds: seen.append(operation))
+    with metrics:
+        assert metrics.enabled
+        assert _Work.run is not original
+        assert _Work().run() == "done"
+        with pytest.raises(RuntimeError):
+            _Work().run(fail=True)
+        with pytest.raises(RuntimeError, match="already enabled"):
+            metrics.enable()
+    assert _Work.run is original and not metrics.enabled
+    assert vars(SessionTimer)["stop"].__name__ == "stop"
+
+    histogram = metrics.histograms["work"]
+    assert (histogram.count, histogram.errors) == (2, 1)
+    assert seen == ["work", "work"]
+    _Work().run()
+    assert histogram.count == 2  # Nothing is measured once disabled
+
+    metrics.reset()
+    assert histogram.count == 0
+    assert metrics.format_report().splitlines()[1:] == []
+
+
+def test_session_spans_are_recorded_by_kind():
+    ticks = itertools.count(0, 1_000)
+    timer = SessionTimer(LinkedList(), clock=lambda: next(ticks))
+    with Instrumentation(targets=[]) as metrics:
+        module = timer.start("Module 1", "module")
+        timer.start("Module 1", "reading")
+        timer.stop(module)  # Also ends the nested reading span
+    assert metrics.histograms["session.module"].count == 1
+    assert metrics.histograms["session.reading"].count == 1
+    assert metrics.histograms["session.module"].total_ns == 2_000
+
+
+def test_default_targets_cover_tree_building():
+    originals = (vars(TreeNode)["add_child"], final.build_syllabus_list)
+    with Instrumentation() as metrics:
+        final.build_syllabus_list()  # Looked up on the module, where the wrapper is installed
+    assert (vars(TreeNode)["add_child"], final.build_syllabus_list) == originals
+    assert metrics.histograms["build_syllabus_list"].count == 1
+    assert metrics.histograms["TreeNode.add_child"].count == sum(
+        root.aggregates()[1] for root in final.build_syllabus_list())  # One call per non-root node
+    assert "TreeNode.add_child" in metrics.format_report()
+
+
+def test_prometheus_output_is_cumulative():
+    metrics = Instrumentation(targets=[])
+    metrics.record('say "hi"', 2_000)
+    metrics.record('say "hi"', 3_000_000_000_000, failed=True)
+    text = metrics.format_prometheus(prefix="test")
+    assert 'test_call_seconds_bucket{operation="say \\"hi\\"",le="2.5e-06"} 1' in text
+    assert 'test_call_seconds_bucket{operation="say \\"hi\\"",le="1000"} 1' in text
+    assert 'test_call_seconds_bucket{operation="say \\"hi\\"",le="+Inf"} 2' in text
+    assert 'test_call_seconds_count{operation="say \\"hi\\""} 2' in text
+    assert 'test_call_errors_total{operation="say \\"hi\\""} 1' in text
+    assert text.endswith("\n")
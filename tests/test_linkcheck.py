@@ -0,0 +1,107 @@
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from final import TreeNode
+from linkcheck import MAX_REDIRECTS, LinkChecker, format_report
+
+
+class FakeSite(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits = Counter()  # (method, path) -> requests served
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status, location=None):
+        self.hits[self.command, self.path] += 1
+        self.send_response(status)
+        if location is not None:
+            self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_HEAD(self):
+        if self.path == "/get-only":
+            self._reply(405)
+        elif self.path == "/dead":
+            self._reply(404)
+        elif self.path == "/moved":
+            self._reply(301, "/ok")
+        elif self.path == "/loop":
+            self._reply(302, "/loop")
+        else:
+            self._reply(200)
+
+    def do_GET(self):
+        self._reply(200 if self.path == "/get-only" else 500)
+
+
+@pytest.fixture
+def site():
+    FakeSite.hits.clear()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeSite)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_dead_links_and_redirects(site):
+    with LinkChecker() as checker:
+        statuses = checker.check_many([f"{site}/ok", f"{site}/dead", f"{site}/moved", f"{site}/loop"])
+    assert statuses[f"{site}/ok"].ok
+    assert statuses[f"{site}/dead"] == (f"{site}/dead", False, 404, "HTTP 404")
+    assert statuses[f"{site}/moved"].ok and statuses[f"{site}/moved"].status == 200
+    assert statuses[f"{site}/loop"].reason == "too many redirects"
+    assert FakeSite.hits["HEAD", "/loop"] == MAX_REDIRECTS + 1
+
+
+def test_head_not_allowed_falls_back_to_get(site):
+    with LinkChecker() as checker:
+        status = checker.check(f"{site}/get-only")
+    assert status.ok and status.status == 200
+    assert FakeSite.hits["HEAD", "/get-only"] == 1
+    assert FakeSite.hits["GET", "/get-only"] == 1
+
+
+def test_placeholder_links_are_not_requested(site):
+    with LinkChecker() as checker:
+        for url in ("https://example.com/notes", "https://youtu.be/xyz123",
+                    "https://www.youtube.com/watch?v=QRS678", "ftp://files.test/x"):
+            status = checker.check(url)
+            assert not status.ok and status.status is None
+    assert not FakeSite.hits
+
+
+def test_results_are_cached_for_ttl_seconds(site):
+    now = [0.0]
+    with LinkChecker(ttl=60.0, clock=lambda: now[0]) as checker:
+        checker.check(f"{site}/ok")
+        now[0] = 59.0
+        checker.check(f"{site}/ok")
+        assert FakeSite.hits["HEAD", "/ok"] == 1
+        now[0] = 61.0
+        checker.check(f"{site}/ok")
+        assert FakeSite.hits["HEAD", "/ok"] == 2
+
+
+def test_audit_reports_problems_per_module(site):
+    root = TreeNode("Syllabus")
+    module = TreeNode("Module 1")
+    topic = TreeNode("Topic")
+    topic.add_resource("Live", f"{site}/ok")
+    topic.add_resource("Gone", f"{site}/dead")
+    topic.add_resource("Video", "https://youtu.be/xyz123")
+    module.add_child(topic)
+    root.add_child(module)
+    with LinkChecker() as checker:
+        problems = checker.audit([root])
+        offline = checker.audit([root], offline=True)
+    assert [(p.module, p.title, p.reason) for p in problems] == [
+        ("Module 1", "Gone", "HTTP 404"), ("Module 1", "Video", "invalid YouTube video id 'xyz123'")]
+    assert [p.title for p in offline] == ["Video"]
+    assert "2 problem link(s)" in format_report(problems)
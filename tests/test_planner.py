@@ -0,0 +1,66 @@
+import pytest
+
+from final import TreeNode
+from planner import estimate_module_hours, format_plan, plan_study
+
+
+def _names(week):
+    return [(item.topic.name, item.hours) for item in week.items]
+
+
+def test_ordered_plan_fills_weeks_in_syllabus_order(syllabus):
+    # Module 1's 3 hours are shared by Stacks and Queues; Heaps has Module 2's 2 hours
+    plan = plan_study(syllabus, weekly_hours=3)
+    assert [week.number for week in plan] == [1, 2]
+    assert _names(plan[0]) == [("Stacks", 1.5), ("Queues", 1.5)]
+    assert _names(plan[1]) == [("Heaps", 2.0)]
+    assert [week.hours for week in plan] == [3.0, 2.0]
+
+
+def test_measured_pace_scales_the_other_modules_and_long_topics_are_split(syllabus):
+    measured = {"Module 1": 6 * 3600}  # Twice the planned 3 hours
+    hours = estimate_module_hours(syllabus, measured)
+    assert [hours[module] for module in syllabus.children] == [6.0, 4.0]
+
+    plan = plan_study(syllabus, 3, measured=measured)
+    assert [_names(week) for week in plan] == [
+        [("Stacks", 3.0)], [("Queues", 3.0)], [("Heaps", 3.0)], [("Heaps", 1.0)]]
+
+
+def test_completed_modules_are_left_out(syllabus):
+    plan = plan_study(syllabus, 10, completed={"Module 1"})
+    assert [_names(week) for week in plan] == [[("Heaps", 2.0)]]
+    assert plan_study(syllabus, 10, completed={"Module 1", "Module 2"}) == []
+
+
+def test_first_fit_decreasing_packs_into_earlier_weeks(syllabus):
+    ordered = plan_study(syllabus, 4)
+    packed = plan_study(syllabus, 4, ordered=False)
+    assert [_names(week) for week in ordered] == [[("Stacks", 1.5), ("Queues", 1.5)], [("Heaps", 2.0)]]
+    # Heaps (the largest) goes first, then Stacks fits beside it; topics stay in syllabus order per week
+    assert [_names(week) for week in packed] == [[("Stacks", 1.5), ("Heaps", 2.0)], [("Queues", 1.5)]]
+    assert all(week.hours <= 4 for week in packed)
+
+
+def test_modules_without_hours_use_the_default():
+    root = TreeNode("Syllabus")
+    root.add_child(TreeNode("Module 1"))
+    plan = plan_study(root, 5, default_hours=2.5)
+    assert [_names(week) for week in plan] == [[("Module 1", 2.5)]]  # A module without topics is its own topic
+
+
+def test_weekly_hours_must_be_positive(syllabus):
+    with pytest.raises(ValueError):
+        plan_study(syllabus, 0)
+
+
+def test_format_plan_groups_topics_by_module(syllabus):
+    assert format_plan(plan_study(syllabus, 4, ordered=False)) == (
+        "Week 1 (3.5 hours)\n"
+        "  Module 1\n"
+        "    - Stacks (1.5 h)\n"
+        "  Module 2\n"
+        "    - Heaps (2.0 h)\n"
+        "Week 2 (1.5 hours)\n"
+        "  Module 1\n"
+        "    - Queues (1.5 h)")
@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from final import build_syllabus_list
+from prerequisites import PrerequisiteCycleError, PrerequisiteGraph, load_prerequisites
+
+
+def _topics(syllabus):
+    (stacks, queues), (heaps,) = (module.children for module in syllabus.children)
+    return stacks, queues, heaps
+
+
+def _graph(syllabus):
+    """Heaps requires Queues, which requires Stacks."""
+    stacks, queues, heaps = _topics(syllabus)
+    graph = PrerequisiteGraph([syllabus])
+    graph.add_prerequisite(heaps, queues)
+    graph.add_prerequisite(queues, stacks)
+    return graph
+
+
+def test_transitive_prerequisites_and_dependents(syllabus):
+    stacks, queues, heaps = _topics(syllabus)
+    graph = _graph(syllabus)
+    assert graph.direct_prerequisites(heaps) == [queues]
+    assert graph.prerequisites_of(heaps) == [stacks, queues]
+    assert graph.requires(heaps, stacks)
+    assert not graph.requires(stacks, heaps)
+    assert graph.dependents_of(stacks) == [queues, heaps]
+    assert graph.study_order([heaps]) == [stacks, queues, heaps]
+
+
+def test_topological_order_keeps_syllabus_order_among_ready_topics(syllabus):
+    stacks, queues, heaps = _topics(syllabus)
+    graph = _graph(syllabus)
+    graph.add_prerequisite(stacks, heaps.parent)  # Module 2 now comes before Stacks
+    order = [node.name for node in graph.topological_order()]
+    assert order == ["Syllabus", "Module 1", "Module 2", "Stacks", "Queues", "Heaps"]
+    assert graph.prerequisites_of(heaps) == [heaps.parent, stacks, queues]  # Closures were invalidated
+
+
+def test_cycles_are_reported(syllabus):
+    stacks, queues, heaps = _topics(syllabus)
+    graph = _graph(syllabus)
+    graph.add_prerequisite(stacks, heaps)
+    assert graph.find_cycle() is not None
+    with pytest.raises(PrerequisiteCycleError) as error:
+        graph.topological_order()
+    cycle = error.value.cycle
+    assert cycle[0] is cycle[-1] and set(cycle) == {stacks, queues, heaps}
+    with pytest.raises(PrerequisiteCycleError):
+        graph.prerequisites_of(heaps)
+    with pytest.raises(PrerequisiteCycleError):
+        graph.add_prerequisite(stacks, stacks)
+
+
+def test_unknown_topic_raises_key_error(syllabus, make_syllabus):
+    graph = _graph(syllabus)
+    with pytest.raises(KeyError):
+        graph.prerequisites_of(make_syllabus())
+
+
+def test_load_prerequisites_resolves_names_and_paths(tmp_path, syllabus):
+    stacks, queues, heaps = _topics(syllabus)
+    path = tmp_path / "prerequisites.json"
+    path.write_text(json.dumps({"syllabus": "Syllabus",
+                                "prerequisites": {"Heaps": ["Module 1/Queues"], "queues": ["Stacks"]}}))
+    graph = load_prerequisites([syllabus], str(path))
+    assert graph.prerequisites_of(heaps) == [stacks, queues]
+
+    path.write_text(json.dumps({"syllabus": "Syllabus", "prerequisites": {"Heaps": ["Tries"]}}))
+    with pytest.raises(ValueError, match="not found"):
+        load_prerequisites([syllabus], str(path))
+    path.write_text(json.dumps({"syllabus": "Other", "prerequisites": {}}))
+    with pytest.raises(ValueError, match="No syllabus named"):
+        load_prerequisites([syllabus], str(path))
+
+
+def test_bundled_prerequisites_are_acyclic():
+    graph = load_prerequisites(build_syllabus_list())
+    assert graph.find_cycle() is None
+    assert len(graph.topological_order()) == len(graph)
@@ -0,0 +1,30 @@
+import sqlite3
+
+import pytest
+
+from progress import ProgressStore
+
+
+def test_bad_row_is_dropped_and_reported_without_losing_its_batch(tmp_path):
+    store = ProgressStore(str(tmp_path / "progress.db"), flush_interval=0.05)
+    try:
+        store.record_module_time("ana", "DSA", "Module 1", 60.0, 1)
+        store.record_module_time(None, "DSA", "Module 2", 90.0, 2)  # learner is NOT NULL
+        store.record_module_time("ana", "DSA", "Module 3", 30.0, 3)
+        with pytest.raises(sqlite3.DatabaseError, match="1 queued row"):
+            store.flush()
+        assert [row[1] for row in store.learner_times("ana")] == ["Module 1", "Module 3"]
+
+        # The writer is still running and the error was reported only once
+        store.record_module_time("ana", "DSA", "Module 4", 45.0, 4)
+        store.flush()
+        assert len(store.learner_times("ana")) == 3
+    finally:
+        store.close()
+
+
+def test_close_reports_dropped_rows(tmp_path):
+    store = ProgressStore(str(tmp_path / "progress.db"))
+    store.mark_completed("ana", None, "Module 1")
+    with pytest.raises(sqlite3.DatabaseError):
+        store.close()
@@ -0,0 +1,68 @@
+import pytest
+
+from final import TreeNode
+from questions import QuestionBank
+
+
+@pytest.fixture
+def tree():
+    root = TreeNode("Syllabus")
+    for name in ("Stacks", "Queues"):
+        topic = TreeNode(name)
+        topic.add_questions(name, [f"What is a {name[:-1].lower()}?", f"Implement {name.lower()}"])
+        root.add_child(topic)
+    return root
+
+
+def test_replaced_questions_get_new_ids(tree):
+    bank = QuestionBank([tree])
+    try:
+        stacks = tree.children[0]
+        old_ids = bank.ids_for(stacks)
+        stacks.add_questions("Stacks", ["Version 2", "Push and pop"])
+
+        assert not set(bank.ids_for(stacks)) & set(old_ids)
+        assert bank.questions_for(stacks) == ["Version 2", "Push and pop"]
+        assert len(bank) == 4
+        with pytest.raises(KeyError):
+            bank.text(old_ids[0])
+    finally:
+        bank.close()
+
+
+def test_removed_subtree_is_released_and_ids_not_reused(tree):
+    bank = QuestionBank([tree])
+    retired = []
+    bank.add_observer(retired.extend)
+    try:
+        queues = tree.children[1]
+        old_ids = bank.ids_for(queues)
+        tree.remove_child(queues)
+
+        assert queues not in bank.owners
+        assert len(bank) == 2
+        assert retired == old_ids
+
+        heaps = TreeNode("Heaps")
+        heaps.add_questions("Heaps", ["Heapify", "Heap sort", "Priority queues"])
+        tree.add_child(heaps)
+        assert not set(bank.ids_for(heaps)) & set(old_ids)
+        assert bank.questions_for(heaps) == ["Heapify", "Heap sort", "Priority queues"]
+        for question_id in old_ids:
+            with pytest.raises(KeyError):
+                bank.text(question_id)
+    finally:
+        bank.close()
+
+
+def test_remove_questions_retires_ids(tree):
+    bank = QuestionBank([tree])
+    try:
+        stacks = tree.children[0]
+        ids = bank.ids_for(stacks)
+        stacks.remove_questions("Stacks")
+        assert bank.ids_for(stacks) == []
+        with pytest.raises(KeyError):
+            bank.node_of(ids[0])
+    finally:
+        bank.close()
@@ -0,0 +1,51 @@
+import io
+
+import pytest
+
+from final import TreeNode, build_syllabus_list
+from render import find_subtree, iter_tree_lines, render_to_string, render_tree
+
+ADDER = "N-bit Parallel Adder/Subtractor and Carry Look-Ahead Adder"
+COUNTERS = "Design of Counters: Modulo-n, Johnson, Ring, Up/Down"
+
+
+@pytest.fixture(scope="module")
+def digital():
+    return next(root for root in build_syllabus_list() if root.name == "Digital System and Design")
+
+
+@pytest.mark.parametrize("module, topic", [
+    ("Module 4: Design of Data Path Circuits", ADDER),
+    ("Module 5: Design of Sequential Logic Circuits", COUNTERS),
+])
+def test_topics_with_slashes_are_reachable(digital, module, topic):
+    for path in (f"{module}/{topic}", f"{digital.name}/{module}/{topic}", [module, topic]):
+        node = find_subtree(digital, path)
+        assert node is not None and node.name == topic
+    assert render_to_string(digital, path=f"{module}/{topic}").startswith(f"- {topic}")
+
+
+def test_longest_matching_name_wins():
+    root = TreeNode("Root")
+    short, long = TreeNode("A"), TreeNode("A/B")
+    short.add_child(TreeNode("B"))
+    root.add_child(short)
+    root.add_child(long)
+    assert find_subtree(root, "A/B") is long
+    assert find_subtree(root, ["A", "B"]) is short.children[0]
+    assert find_subtree(root, "A/C") is None
+
+
+def test_render_matches_recursive_layout():
+    root = TreeNode("Root")
+    module = TreeNode("Module", 6)
+    module.add_resource("Notes", "https://example.com")
+    module.add_child(TreeNode("Topic"))
+    root.add_child(module)
+    expected = ["- Root", "  - Module (6 hours)", "      Notes: https://example.com", "    - Topic"]
+    out = io.StringIO()
+    assert render_tree(root, out) == 4
+    assert out.getvalue() == "\n".join(expected) + "\n"
+    assert list(iter_tree_lines(root, max_depth=1)) == expected[:3]
+    with pytest.raises(KeyError):
+        render_tree(root, out, path="Missing")
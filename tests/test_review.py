@@ -0,0 +1,80 @@
+from final import TreeNode
+from questions import QuestionBank
+from review import DAY, MAXIMUM_INTERVAL, ReviewScheduler, run_review
+
+NOW = 1_800_000_000  # A realistic epoch time, so due times are large
+
+
+def test_card_graded_twice_at_the_same_time_is_due_once():
+    reviews = ReviewScheduler()
+    reviews.enroll("ana", [1, 2], now=0)
+    reviews.review("ana", 1, quality=1, now=0)
+    reviews.review("ana", 1, quality=1, now=0)
+    assert reviews.due("ana", now=DAY) == [2, 1]
+
+
+def test_card_rescheduled_away_and_back_is_due_once():
+    reviews = ReviewScheduler()
+    reviews.enroll("ana", [1], now=0)
+    reviews.review("ana", 1, quality=1, now=0)            # Due at DAY
+    reviews.review("ana", 1, quality=1, now=DAY)          # Due at 2 * DAY
+    reviews.review("ana", 1, quality=1, now=0)            # Back to DAY, next to its old entry
+    assert reviews.due("ana", now=DAY) == [1]
+    for _ in range(200):                                  # Enough reviews to trigger compaction
+        reviews.review("ana", 1, quality=1, now=DAY)
+        reviews.review("ana", 1, quality=1, now=0)
+    assert reviews.due("ana", now=DAY) == [1]
+
+
+def test_card_reviewed_many_times_stays_schedulable():
+    reviews = ReviewScheduler()
+    reviews.enroll("ana", [1], now=NOW)
+    now = NOW
+    for _ in range(50):
+        now = reviews.review("ana", 1, quality=5, now=now)
+    card = reviews.card("ana", 1)
+    assert card.interval == MAXIMUM_INTERVAL
+    assert card.repetitions == 50
+    assert card.due == now
+    assert reviews.due("ana", now=now) == [1]
+
+
+def test_cards_of_retired_questions_are_dropped(monkeypatch):
+    root = TreeNode("Syllabus")
+    stacks, heaps = TreeNode("Stacks"), TreeNode("Heaps")
+    stacks.add_questions("Stacks", ["What is a stack?"])
+    root.add_child(stacks)
+    bank = QuestionBank([root])
+    reviews = ReviewScheduler()
+    bank.add_observer(reviews.drop_questions)
+    try:
+        reviews.enroll("ana", bank.ids_for(stacks), now=NOW)
+        reviews.enroll("bo", bank.ids_for(stacks), now=NOW)
+        reviews.review("ana", bank.ids_for(stacks)[0], quality=5, now=NOW)
+        root.remove_child(stacks)
+        heaps.add_questions("Heaps", ["Heapify"])
+        root.add_child(heaps)
+
+        assert len(reviews) == 0
+        assert reviews.due("ana", now=NOW + 10 * DAY) == []
+        reviews.enroll("ana", bank.ids_for(heaps), now=NOW)
+        assert reviews.card("ana", bank.ids_for(heaps)[0]).repetitions == 0  # Fresh card, no inherited state
+    finally:
+        bank.close()
+
+
+def test_run_review_skips_retired_questions(monkeypatch, capsys):
+    root = TreeNode("Syllabus")
+    topic = TreeNode("Stacks")
+    topic.add_questions("Stacks", ["What is a stack?", "Push and pop"])
+    root.add_child(topic)
+    bank = QuestionBank([root])
+    reviews = ReviewScheduler()  # Not following the bank, so its cards outlive the questions
+    try:
+        reviews.enroll("ana", bank.ids_for(topic))
+        topic.add_questions("Stacks", ["Implement a stack"])
+        monkeypatch.setattr("builtins.input", lambda prompt: "4")
+        assert run_review(reviews, bank, "ana") == 0
+        assert "Nothing to review" in capsys.readouterr().out
+    finally:
+        bank.close()
@@ -0,0 +1,46 @@
+import pytest
+
+from final import TreeNode
+from sampler import QuestionSampler
+
+
+def _syllabus():
+    """Module A is heavy but holds 2 questions; module B is light but holds 10."""
+    root = TreeNode("Syllabus")
+    for name, hours, count in (("A", 50, 2), ("B", 1, 10)):
+        module = TreeNode(name, hours)
+        topic = TreeNode(f"{name} topic")
+        topic.add_questions(topic.name, [f"{name} question {i}" for i in range(count)])
+        module.add_child(topic)
+        root.add_child(module)
+    return root
+
+
+def test_stratified_reallocates_when_a_module_runs_out():
+    sampler = QuestionSampler([_syllabus()], seed=3)
+    for k in range(1, 13):
+        quiz = sampler.sample_stratified(k)
+        assert len(quiz) == k
+        assert len({question for _, question in quiz}) == k
+    assert sum(1 for _, q in sampler.sample_stratified(6) if q.startswith("A")) == 2
+
+
+def test_stratified_is_short_only_when_the_bank_is():
+    sampler = QuestionSampler([_syllabus()], seed=3)
+    assert len(sampler.sample_stratified(50)) == 12
+    assert len(sampler.sample(50)) == 12
+
+
+def test_draw_restores_weights():
+    sampler = QuestionSampler([_syllabus()], seed=3)
+    before = list(sampler.weights.weights)
+    sampler.sample_stratified(12)
+    assert sampler.weights.weights == before
+
+
+def test_negative_k_is_rejected():
+    sampler = QuestionSampler([_syllabus()], seed=3)
+    for draw in (sampler.sample, sampler.sample_stratified):
+        with pytest.raises(ValueError):
+            draw(-1)
+        assert draw(0) == []
@@ -0,0 +1,84 @@
+import gc
+import weakref
+
+from final import TreeNode
+from search import SearchEngine
+
+
+def _syllabus(topics=100):
+    root = TreeNode("Syllabus")
+    for i in range(topics):
+        topic = TreeNode(f"Topic {i}")
+        topic.add_questions(topic.name, [f"Explain heap number {i}"])
+        root.add_child(topic)
+    return root
+
+
+def test_removed_subtree_is_released_and_index_compacted():
+    root = _syllabus()
+    engine = SearchEngine([root])
+    try:
+        removed = list(root.children)
+        for child in removed:
+            root.remove_child(child)
+
+        assert not any(node in removed for node in engine.nodes)  # Nothing keeps removed nodes alive
+        assert len(engine) == 1                 # Only the root's topic document is left
+        assert len(engine.texts) < 100          # Tombstones were compacted away
+        assert engine.search("heap") == []
+        assert [hit.node for hit in engine.search("syllabus")] == [root]
+    finally:
+        engine.close()
+
+
+def test_search_after_compaction_finds_new_and_kept_documents():
+    root = _syllabus()
+    engine = SearchEngine([root])
+    try:
+        kept = root.children[-1]
+        for child in root.children[:-1]:
+            root.remove_child(child)
+        late = TreeNode("Late topic")
+        late.add_questions("Late topic", ["Explain heap sort"])
+        root.add_child(late)
+        kept.add_questions(kept.name, ["Explain tries"])
+
+        assert {hit.node for hit in engine.search("heap")} == {late}
+        assert [hit.node for hit in engine.search("tries")] == [kept]
+    finally:
+        engine.close()
+
+
+def test_search_matches_a_fresh_engine_after_edits():
+    root = _syllabus(10)
+    engine = SearchEngine([root])
+    try:
+        root.remove_child(root.children[3])
+        root.children[0].add_questions(root.children[0].name, ["Explain heap sort and tries"])
+        root.children[1].remove_questions(root.children[1].name)
+        root.children[2].add_resource("Heap notes", "https://example.org/heaps")
+        late = TreeNode("Late topic")
+        late.add_questions(late.name, ["Explain a binary heap"])
+        root.add_child(late)
+
+        fresh = SearchEngine([root])
+        fresh.close()
+
+        def hits(engine, query):  # Scores differ slightly, as document frequencies count tombstones
+            return {(hit.kind, hit.text, hit.node) for hit in engine.search(query, limit=50)}
+
+        for query in ("heap", "tries", "heap notes", "explain binary heap", "topic 3"):
+            assert hits(engine, query) == hits(fresh, query)
+        assert len(engine) == len(fresh)
+    finally:
+        engine.close()
+
+
+def test_unclosed_engine_is_freed():
+    root = _syllabus(3)
+    engine = SearchEngine([root])
+    collected = weakref.ref(engine)
+    del engine
+    gc.collect()
+    assert collected() is None
+    root.add_child(TreeNode("Late topic"))
@@ -0,0 +1,107 @@
+import asyncio
+
+from session import AsyncSession, run_session, start_server
+
+
+class _Writer:
+    """Collects what a session sends, in place of a StreamWriter."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.closed = False
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    async def wait_closed(self):
+        pass
+
+    @property
+    def text(self):
+        return self.data.decode()
+
+
+def _reader(*chunks, limit=2 ** 16, eof=True):
+    reader = asyncio.StreamReader(limit=limit)
+    for chunk in chunks:
+        reader.feed_data(chunk)
+    if eof:
+        reader.feed_eof()
+    return reader
+
+
+def _run_session(syllabus_list, *chunks, limit=2 ** 16):
+    """Run a session over the given input; returns (SessionTimer or None, writer)."""
+    async def main():
+        return await run_session(syllabus_list, _reader(*chunks, limit=limit), writer)
+
+    writer = _Writer()
+    return asyncio.run(main()), writer
+
+
+def test_session_walks_every_module(syllabus):
+    timer, writer = _run_session([syllabus], b"7\n1\ncompleted\nnope\nquestions\n\n")
+
+    assert timer is not None
+    assert [span.name for span in timer.spans_of_kind("module")] == ["Module 1", "Module 2"]
+    assert len(timer.store) == 2
+    assert writer.closed
+    text = writer.text
+    assert "1. Syllabus" in text
+    assert "Invalid input. Please enter a number between 1 and 1" in text
+    assert "--- Module 1 ---" in text and "--- Module 2 ---" in text
+    assert "Questions for Heaps:\n  - Heapify\n  - Heap sort\n" in text
+    assert "Questions for Stacks" not in text  # Module 1 was completed without questions
+    assert "Time taken for each module:" in text
+
+
+def test_session_ends_quietly_when_the_learner_leaves(syllabus):
+    timer, writer = _run_session([syllabus], b"1\ncompleted\n")
+    assert timer is None
+    assert writer.closed
+
+
+def test_overlong_line_is_skipped_and_asked_again(syllabus):
+    # The first newline is beyond the 16-byte limit
+    timer, writer = _run_session([syllabus], b"1" * 100 + b"\n1\ncompleted\ncompleted\n", limit=16)
+    assert timer is not None
+    assert writer.text.count("too long") == 1
+
+
+def test_overlong_line_arriving_in_pieces_is_skipped(syllabus):
+    async def main():
+        reader = _reader(limit=16, eof=False)
+        session = AsyncSession(reader, _Writer())
+        answer = asyncio.ensure_future(session.ask("? "))
+        for chunk in (b"x" * 40, b"y" * 40, b"z\nqu", b"estions\n"):  # No newline within the limit
+            await asyncio.sleep(0)
+            reader.feed_data(chunk)
+        assert await answer == ""
+        assert await session.ask("? ") == "questions"  # Nothing of the long line is left over
+
+    asyncio.run(main())
+
+
+def test_server_runs_sessions_over_tcp(syllabus):
+    finished = []
+
+    async def main():
+        server = await start_server([syllabus], port=0, on_finished=finished.append)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"1\ncompleted\ncompleted\n")
+            output = await reader.read()
+            writer.close()
+            await writer.wait_closed()
+        return output.decode()
+
+    output = asyncio.run(main())
+    assert "Time taken for each module:" in output
+    assert len(finished) == 1 and len(finished[0].store) == 2
@@ -0,0 +1,25 @@
+import pytest
+
+from snapshot import Snapshot, load_snapshot, save_snapshot
+
+
+def test_round_trip(tmp_path, syllabus):
+    path = tmp_path / "syllabi.snap"
+    save_snapshot([syllabus], path)
+
+    (loaded,) = load_snapshot(path)
+    assert loaded.name == "Syllabus"
+    assert [module.hours for module in loaded.children] == [3, 2]
+    stacks = loaded.children[0].children[0]
+    assert stacks.parent.parent is loaded
+    assert dict(stacks.resources) == {"Notes": "https://example.org/stacks"}
+    assert stacks.get_questions() == ["What is a stack?", "Implement a stack"]
+    assert loaded.children[1].children[0].hours is None
+
+
+@pytest.mark.parametrize("content", [b"", b"short", b"NOTASNAP" + bytes(64)])
+def test_rejects_files_that_are_not_snapshots(tmp_path, content):
+    path = tmp_path / "bogus.snap"
+    path.write_bytes(content)
+    with pytest.raises(ValueError, match="not a syllabus snapshot"):
+        Snapshot(path)
@@ -0,0 +1,35 @@
+import itertools
+
+from final import LinkedList
+from timing import SessionTimer, format_wall_clock
+
+
+def _timer():
+    ticks = itertools.count(0, 1_000_000_000)  # Every clock read advances one second
+    return SessionTimer(LinkedList(), clock=lambda: next(ticks))
+
+
+def test_stopping_a_closed_span_again_is_a_no_op():
+    timer = _timer()
+    module = timer.start("Module 1", "module")
+    with timer.span("Topic", "topic") as topic:
+        pass
+    timer.stop(topic)  # Already closed by the context manager
+
+    assert module.end_ns is None
+    assert len(timer.store) == 0
+    timer.stop(module)
+    assert list(timer.store) == [module.seconds]
+
+
+def test_stop_closes_nested_spans():
+    timer = _timer()
+    module = timer.start("Module 1", "module")
+    reading = timer.start("Module 1", "reading")
+    timer.stop(module)
+    assert reading.end_ns == module.end_ns
+    assert len(timer.store) == 1
+
+
+def test_wall_clock_is_utc():
+    assert format_wall_clock(3600.25) == "01:00:00"
@@ -0,0 +1,49 @@
+import pytest
+
+from final import TreeNode
+from treediff import Change, apply_patch, diff_trees
+
+
+def _tree(*children):
+    root = TreeNode("Syllabus")
+    section = TreeNode("S")
+    for name, hours in children:
+        section.add_child(TreeNode(name, hours))
+    root.add_child(section)
+    return root
+
+
+def test_patch_turns_old_tree_into_new():
+    old = _tree(("A", 1), ("B", 2))
+    new = _tree(("B", 3), ("C", 4))
+    apply_patch(old, diff_trees(old, new))
+    assert diff_trees(old, new) == []
+    assert [(child.name, child.hours) for child in old.children[0].children] == [("B", 3), ("C", 4)]
+
+
+def test_duplicate_sibling_names_are_rejected():
+    old = _tree(("X", 1), ("X", 2))
+    new = _tree(("X", 5), ("X", 2))
+    with pytest.raises(ValueError, match="more than one child named 'X'"):
+        diff_trees(old, new)
+
+
+def test_duplicate_names_in_unchanged_subtrees_are_fine():
+    old = _tree(("X", 1), ("X", 2))
+    new = _tree(("X", 1), ("X", 2))
+    new.add_child(TreeNode("T", 1))
+    changes = diff_trees(old, new)
+    assert [change.op for change in changes] == ["add_child"]
+
+
+def test_only_changed_children_are_diffed_and_reorders_are_kept():
+    old = _tree(*[(f"T{i}", i) for i in range(50)])
+    new = _tree(*[(f"T{i}", i) for i in range(50)])
+    new.children[0].children[7].set_hours(99)
+    assert diff_trees(old, new) == [Change("set_hours", ("S", "T7"), None, 99)]
+
+    new.children[0].reorder_children([f"T{i}" for i in reversed(range(50))])
+    changes = diff_trees(old, new)
+    assert [change.op for change in changes] == ["reorder", "set_hours"]
+    apply_patch(old, changes)
+    assert diff_trees(old, new) == []
@@ -0,0 +1,100 @@
+"""Monotonic, nanosecond-resolution timing of study sessions.
+
+Durations come from `time.perf_counter_ns`, which never jumps when the wall
+clock is adjusted; the wall-clock start of each span is kept only for display.
+"""
+import time
+from contextlib import contextmanager
+
+NS_PER_SECOND = 1_000_000_000
+
+
+class Span:
+    """One timed interval, e.g. a module, a topic or the questions phase of a module."""
+    __slots__ = ("name", "kind", "parent", "start_ns", "end_ns", "wall_start")
+
+    def __init__(self, name, kind, parent, start_ns, wall_start):
+        self.name = name            # Module or topic name
+        self.kind = kind            # "module", "topic", "reading" or "questions"
+        self.parent = parent        # Enclosing span (None for modules)
+        self.start_ns = start_ns    # Monotonic start time
+        self.end_ns = None          # Monotonic end time, set when the span is stopped
+        self.wall_start = wall_start  # Wall-clock start (seconds since the epoch), for display
+
+    @property
+    def duration_ns(self):
+        return self.end_ns - self.start_ns if self.end_ns is not None else None
+
+    @property
+    def seconds(self):
+        return self.duration_ns / NS_PER_SECOND if self.end_ns is not None else None
+
+    def __repr__(self):
+        return f"Span({self.kind} {self.name!r}, {self.seconds} s)"
+
+
+class SessionTimer:
+    """Record nested spans for a session and feed module times into a timing store.
+
+    `store` is any object with an `append(seconds)` method, such as `LinkedList`;
+    the duration of every finished "module" span is appended to it.
+    """
+    def __init__(self, store=None, clock=time.perf_counter_ns):
+        self.store = store
+        self.clock = clock
+        self.spans = []    # Finished and running spans in start order
+        self._open = []    # Stack of running spans
+
+    def start(self, name, kind):
+        """Start a span nested inside the currently running one."""
+        span = Span(name, kind, self._open[-1] if self._open else None, self.clock(), time.time())
+        self.spans.append(span)
+        self._open.append(span)
+        return span
+
+    def stop(self, span):
+        """Stop a running span (and any spans still open inside it); stopping it again does nothing."""
+        if span.end_ns is not None:
+            return span
+        end = self.clock()
+        while self._open:
+            current = self._open.pop()
+            current.end_ns = end
+            if current.kind == "module" and self.store is not None:
+                self.store.append(current.seconds)
+            if current is span:
+                break
+        return span
+
+    @contextmanager
+    def span(self, name, kind):
+        """Context manager timing the enclosed block as a span."""
+        span = self.start(name, kind)
+        try:
+            yield span
+        finally:
+            self.stop(span)
+
+    def spans_of_kind(self, kind):
+        """Return all finished spans of a kind, in start order."""
+        return [span for span in self.spans if span.kind == kind and span.end_ns is not None]
+
+    def phase_seconds(self, module_name):
+        """Return {phase kind: seconds} for the spans inside a module, e.g. reading vs questions."""
+        totals = {}
+        for span in self.spans:
+            if span.end_ns is None or span.parent is None:
+                continue
+            if span.parent.kind != "module" or span.parent.name != module_name:
+                continue
+            totals[span.kind] = totals.get(span.kind, 0.0) + span.seconds
+        return totals
+
+    def module_seconds(self):
+        """Return {module name: seconds} for every finished module span."""
+        return {span.name: span.seconds for span in self.spans_of_kind("module")}
+
+
+def format_wall_clock(timestamp):
+    """Format a wall-clock timestamp as UTC HH:MM:SS, as the session has always printed it."""
+    return time.strftime("%H:%M:%S", time.gmtime(timestamp))
@@ -0,0 +1,246 @@
+"""Diff and patch two versions of a syllabus tree.
+
+    changes = diff_trees(deployed, updated)     # [Change(op, path, key, value), ...]
+    apply_patch(deployed, changes)              # deployed now matches updated
+    save_patch(changes, "hashing-update.json")  # or ship the patch as JSON
+
+Every subtree gets a Merkle hash of its own content (name, hours, resources,
+questions) and its children's hashes, so equal hashes mean equal subtrees.
+The diff walks both trees together by path (children are matched by name)
+and never descends into a subtree whose hash is unchanged. It still looks
+at every child of each node it does descend into, so its cost grows with
+the number of changes times the number of siblings along their paths (a
+change under a root with 9k modules costs a pass over those 9k children),
+not with the number of changes alone. A renamed node
+shows up as a removal plus an addition. Because paths are names, siblings
+must have distinct names wherever the two trees differ.
+
+Change ops, with `path` the tuple of child names from the root:
+
+    add_child         key = child name, value = the child subtree as a catalog dict
+    remove_child      key = child name
+    set_hours         value = new hours
+    set_resource      key = resource title, value = URL
+    remove_resource   key = resource title
+    set_questions     key = question topic, value = list of questions
+    remove_questions  key = question topic
+    reorder           value = child names in their new order
+
+`MerkleHashes` keeps a deployed tree's hashes current as it is edited through
+the TreeNode API, so a later diff only rehashes the new version.
+"""
+import json
+from collections import namedtuple
+from hashlib import blake2b
+
+import final
+from catalog import node_from_dict, node_to_dict
+
+Change = namedtuple("Change", "op path key value")
+
+
+def _content_digest(node):
+    """Hash of a node's own fields, independent of its children."""
+    fields = [node.name, repr(node.hours)]
+    if node.resources:
+        for key in sorted(node.resources):
+            fields += (key, node.resources[key])
+    if node.questions_map:
+        for topic in sorted(node.questions_map):
+            fields.append(topic)
+            fields.extend(node.questions_map[topic])
+            fields.append("")  # Ends this topic's question list
+    return blake2b("\x1f".join(fields).encode(), digest_size=16).digest()
+
+
+def subtree_hashes(root, hashes=None):
+    """Return {node: (content digest, subtree digest)} for every node below `root`.
+
+    Nodes already present in `hashes` are reused without being rehashed.
+    """
+    if hashes is None:
+        hashes = {}
+    order = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node in hashes:
+            continue
+        order.append(node)
+        stack.extend(node.children)
+    for node in reversed(order):  # Children before parents
+        content = _content_digest(node)
+        if node.children:
+            subtree = blake2b(content + b"".join([hashes[child][1] for child in node.children]),
+                              digest_size=16).digest()
+        else:
+            subtree = content
+        hashes[node] = (content, subtree)
+    return hashes
+
+
+class MerkleHashes:
+    """Subtree hashes of a tree, invalidated along the ancestor path when it is edited."""
+
+    def __init__(self, root):
+        self.root = root
+        self.hashes = subtree_hashes(root)
+        final.add_observer(self._on_tree_change)
+
+    def close(self):
+        final.remove_observer(self._on_tree_change)
+
+    def _on_tree_change(self, event, node, *args):
+        if event == "remove_child":
+            stack = [args[0]]
+            while stack:
+                removed = stack.pop()
+                self.hashes.pop(removed, None)
+                stack.extend(removed.children)
+        while node is not None and self.hashes.pop(node, None) is not None:
+            node = node.parent
+
+    def current(self):
+        """Return up-to-date hashes, rehashing only nodes changed since the last call."""
+        return subtree_hashes(self.root, self.hashes)
+
+
+def diff_trees(old, new, old_hashes=None, new_hashes=None):
+    """Return the Changes that turn tree `old` into tree `new`.
+
+    Both roots must be the same syllabus (same name). Pass precomputed hashes
+    (e.g. MerkleHashes(old).current()) to avoid rehashing. Raises ValueError
+    if a node that differs has two children with the same name, as a patch
+    could not tell them apart.
+    """
+    if old.name != new.name:
+        raise ValueError(f"Cannot diff {old.name!r} against a different syllabus {new.name!r}")
+    old_hashes = old_hashes if old_hashes is not None else subtree_hashes(old)
+    new_hashes = new_hashes if new_hashes is not None else subtree_hashes(new)
+    changes = []
+    stack = [(old, new, ())]
+    while stack:
+        a, b, path = stack.pop()
+        if old_hashes[a][1] == new_hashes[b][1]:
+            continue  # Identical subtrees
+        if old_hashes[a][0] != new_hashes[b][0]:
+            _diff_content(a, b, path, changes)
+
+        old_names = [child.name for child in a.children]
+        wanted = [child.name for child in b.children]
+        if old_names == wanted:
+            # Same children in the same order (the usual case): only changed subtrees are visited
+            pairs = [(match, child) for match, child in zip(a.children, b.children)
+                     if old_hashes[match][1] != new_hashes[child][1]]
+            if pairs and len(set(old_names)) < len(old_names):
+                for _, child in pairs:
+                    if old_names.count(child.name) > 1:
+                        raise _duplicate_name(a, path, child.name)
+        else:
+            old_children = _children_by_name(a, path)
+            new_names = set(_children_by_name(b, path))
+            pairs = []
+            for child in b.children:
+                match = old_children.get(child.name)
+                if match is None:
+                    changes.append(Change("add_child", path, child.name, node_to_dict(child)))
+                elif old_hashes[match][1] != new_hashes[child][1]:
+                    pairs.append((match, child))
+            kept = []
+            for child in a.children:
+                if child.name in new_names:
+                    kept.append(child.name)
+                else:
+                    changes.append(Change("remove_child", path, child.name, None))
+            # After the edits above the children are the kept ones in old order, then the added ones
+            resulting = kept + [child.name for child in b.children if child.name not in old_children]
+            if resulting != wanted:
+                changes.append(Change("reorder", path, None, wanted))
+        for match, child in reversed(pairs):
+            stack.append((match, child, path + (child.name,)))
+    return changes
+
+
+def _duplicate_name(node, path, name):
+    return ValueError(f"Cannot diff {'/'.join(path) or node.name!r}: it has more than one child named {name!r}")
+
+
+def _children_by_name(node, path):
+    children = {}
+    for child in node.children:
+        if children.setdefault(child.name, child) is not child:
+            raise _duplicate_name(node, path, child.name)
+    return children
+
+
+def _diff_content(a, b, path, changes):
+    if a.hours != b.hours:
+        changes.append(Change("set_hours", path, None, b.hours))
+    for key, url in b.resources.items():
+        if a.resources.get(key) != url:
+            changes.append(Change("set_resource", path, key, url))
+    for key in a.resources:
+        if key not in b.resources:
+            changes.append(Change("remove_resource", path, key, None))
+    for topic, questions in b.questions_map.items():
+        if a.questions_map.get(topic) != questions:
+            changes.append(Change("set_questions", path, topic, list(questions)))
+    for topic in a.questions_map:
+        if topic not in b.questions_map:
+            changes.append(Change("remove_questions", path, topic, None))
+
+
+def _child_named(node, name):
+    for child in node.children:
+        if child.name == name:
+            return child
+    raise KeyError(f"{node.name!r} has no child named {name!r}")
+
+
+def apply_patch(root, changes):
+    """Apply Changes from diff_trees to `root` in place, through the TreeNode API."""
+    resolved = {(): root}
+
+    def node_at(path):
+        node = resolved.get(path)
+        if node is None:
+            node = resolved[path] = _child_named(node_at(path[:-1]), path[-1])
+        return node
+
+    for change in changes:
+        node = node_at(tuple(change.path))
+        op = change.op
+        if op == "add_child":
+            node.add_child(node_from_dict(change.value))
+        elif op == "remove_child":
+            node.remove_child(_child_named(node, change.key))
+            child_path = tuple(change.path) + (change.key,)
+            for path in [path for path in resolved if path[:len(child_path)] == child_path]:
+                del resolved[path]
+        elif op == "set_hours":
+            node.set_hours(change.value)
+        elif op == "set_resource":
+            node.add_resource(change.key, change.value)
+        elif op == "remove_resource":
+            node.remove_resource(change.key)
+        elif op == "set_questions":
+            node.add_questions(change.key, list(change.value))
+        elif op == "remove_questions":
+            node.remove_questions(change.key)
+        elif op == "reorder":
+            node.reorder_children(change.value)
+        else:
+            raise ValueError(f"Unknown patch op {op!r}")
+    return root
+
+
+def save_patch(changes, path):
+    """Write Changes to a JSON file."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump([change._asdict() for change in changes], f, ensure_ascii=False, indent=1)
+
+
+def load_patch(path):
+    """Read Changes written by save_patch."""
+    with open(path, encoding="utf-8") as f:
+        return [Change(item["op"], tuple(item["path"]), item["key"], item["value"]) for item in json.load(f)]